@@ -0,0 +1,89 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogSink:
+    """
+    Queue ActivityLog rows in memory and write them with ``bulk_create``.
+
+    A daemon thread flushes once ``batch_size`` entries are queued or
+    ``flush_interval`` seconds have passed, so admin requests no longer pay
+    for a second write transaction. ``shutdown`` drains the queue and runs
+    at interpreter exit.
+    """
+
+    def __init__(self, batch_size=50, flush_interval=2.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._after_fork()
+
+    def _after_fork(self):
+        self._queue = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+    def put(self, **fields):
+        with self._condition:
+            self._queue.append(fields)
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._run, name='activity-log-sink', daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def _take(self):
+        with self._condition:
+            batch, self._queue = self._queue, []
+        return batch
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._queue) >= self.batch_size or self._stopping,
+                    timeout=self.flush_interval,
+                )
+                stopping = self._stopping
+            self._write(self._take())
+            if stopping:
+                return
+
+    def _write(self, batch):
+        if not batch:
+            return
+        from .models import ActivityLog
+        close_old_connections()
+        try:
+            ActivityLog.objects.bulk_create([ActivityLog(**fields) for fields in batch])
+        except Exception:
+            logger.exception('Dropped %d activity log entries', len(batch))
+
+    def flush(self):
+        self._write(self._take())
+
+    def shutdown(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=10)
+        self.flush()
+
+
+sink = ActivityLogSink(
+    batch_size=getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 50),
+    flush_interval=getattr(settings, 'ACTIVITY_LOG_FLUSH_INTERVAL', 2.0),
+)
+
+atexit.register(sink.shutdown)
+# A forked worker starts with an empty queue and no writer thread.
+os.register_at_fork(after_in_child=sink._after_fork)
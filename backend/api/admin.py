@@ -91,3 +91,24 @@ class ActivityLogAdmin(admin.ModelAdmin):
     list_display = ['user', 'action', 'model_name', 'timestamp']
     list_filter = ['model_name', 'timestamp']
     search_fields = ['action', 'details']
+
+
+@admin.register(StatCounter)
+class StatCounterAdmin(admin.ModelAdmin):
+    list_display = ['name', 'value', 'updated_at']
+    search_fields = ['name']
+
+
+@admin.register(NewsletterCampaign)
+class NewsletterCampaignAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'status', 'created_by', 'queued_at', 'completed_at']
+    list_filter = ['status']
+    search_fields = ['subject']
+
+
+@admin.register(NewsletterDelivery)
+class NewsletterDeliveryAdmin(admin.ModelAdmin):
+    list_display = ['email', 'campaign', 'status', 'attempts', 'sent_at']
+    list_filter = ['status', 'campaign']
+    search_fields = ['email']
+    raw_id_fields = ['campaign', 'subscriber']
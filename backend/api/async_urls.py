@@ -0,0 +1,24 @@
+from django.urls import path, re_path
+
+from . import async_views, views
+from .urls import public_router
+
+ENDPOINT_CLASSES = {
+    views.NewsArticlePublicViewSet: async_views.AsyncNewsEndpoint,
+}
+
+# Async twins of the public read endpoints, mounted ahead of api.urls by
+# mradvocates.asgi_urls. Names match the synchronous routes.
+urlpatterns = []
+for prefix, viewset, basename in public_router.registry:
+    endpoint = ENDPOINT_CLASSES.get(viewset, async_views.AsyncReadOnlyEndpoint)(viewset, basename)
+    urlpatterns += [
+        path(f'{prefix}/', endpoint.as_view('list'), name=f'{basename}-list'),
+        re_path(rf'^{prefix}/(?P<{endpoint.lookup_field}>[^/.]+)/$', endpoint.as_view('retrieve'),
+                name=f'{basename}-detail'),
+    ]
+
+urlpatterns += [
+    path('seo/', async_views.seo_metadata_bulk, name='seo-bulk'),
+    path('seo/<str:page_name>/', async_views.get_seo_metadata, name='get-seo'),
+]
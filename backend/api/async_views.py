@@ -0,0 +1,138 @@
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from . import search as search_index
+from .cache import CachedResponseMixin, aget_or_build, aget_response
+from .db_routers import read_only
+from .fast_serializers import compile_plan, serialize_rows
+from .seo import seo_map
+from .view_counts import news_views
+
+renderer = JSONRenderer()
+
+
+def json_response(data, status=200):
+    # The bytes DRF's JSONRenderer produces for the synchronous views.
+    return HttpResponse(renderer.render(data), status=status, content_type='application/json')
+
+
+class AsyncReadOnlyEndpoint:
+    """
+    Async ``list`` and ``retrieve`` for a public read-only viewset.
+
+    The viewset supplies the queryset, serializer, lookup field, pagination
+    and cache models; rows are fetched through the async ORM as ``.values()``
+    and rendered by the fast serialization path, and responses share the
+    cache entries of the synchronous views, so both produce identical JSON.
+    """
+
+    def __init__(self, viewset, basename):
+        self.viewset = viewset
+        self.basename = basename
+        self.lookup_field = viewset.lookup_field
+        if issubclass(viewset, CachedResponseMixin):
+            self.cache_models = viewset.cache_models or (viewset.queryset.model,)
+        else:
+            self.cache_models = None
+
+    def as_view(self, action):
+        @require_safe
+        async def view(request, **kwargs):
+            request = Request(request)
+            try:
+                with read_only():
+                    data = await self.cached(action, request, kwargs)
+            except (Http404, NotFound) as exc:
+                return json_response({'detail': str(exc)}, status=404)
+            return json_response(data)
+
+        view.__name__ = view.__qualname__ = f'{self.viewset.__name__}_{action}'
+        return view
+
+    async def cached(self, action, request, kwargs):
+        handler = getattr(self, action)
+        if self.cache_models is None:
+            return await handler(request, **kwargs)
+        key, data = await aget_response(self.basename, self.cache_models, request.build_absolute_uri())
+        if data is None:
+            data = await aget_or_build(key, lambda: handler(request, **kwargs))
+        return data
+
+    def get_serializer_class(self, action):
+        return self.viewset(action=action).get_serializer_class()
+
+    async def get_queryset(self, request):
+        return self.viewset.queryset.all()
+
+    async def list(self, request):
+        serializer_class = self.get_serializer_class('list')
+        columns, _ = compile_plan(serializer_class)
+        queryset = (await self.get_queryset(request)).values(*columns)
+
+        if self.viewset.pagination_class is not None:
+            paginator = self.viewset.pagination_class()
+            rows = await paginator.apaginate_queryset(queryset, request)
+            if rows is not None:
+                return paginator.get_paginated_response(serialize_rows(serializer_class, rows, request)).data
+        return serialize_rows(serializer_class, [row async for row in queryset], request)
+
+    async def retrieve(self, request, **kwargs):
+        serializer_class = self.get_serializer_class('retrieve')
+        columns, _ = compile_plan(serializer_class)
+        queryset = await self.get_queryset(request)
+        try:
+            row = await queryset.values('pk', *columns).aget(**{self.lookup_field: kwargs[self.lookup_field]})
+        except queryset.model.DoesNotExist:
+            raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+        await self.seen(row)
+        return serialize_rows(serializer_class, [row], request)[0]
+
+    async def seen(self, row):
+        pass
+
+
+class AsyncNewsEndpoint(AsyncReadOnlyEndpoint):
+    """``NewsArticlePublicViewSet``: category and search filters, and buffered view counts."""
+
+    async def get_queryset(self, request):
+        queryset = await super().get_queryset(request)
+        category = request.query_params.get('category', None)
+        search = request.query_params.get('search', None)
+
+        if category:
+            queryset = queryset.filter(category=category)
+        if search:
+            ids = await sync_to_async(search_index.matching_ids)('news', search)
+            queryset = queryset.filter(pk__in=ids)
+        return queryset
+
+    async def seen(self, row):
+        # Recording only touches the in-memory buffer; its own thread writes to the database.
+        news_views.record(row['pk'])
+        row['views'] += news_views.pending(row['pk'])
+
+
+@require_safe
+async def get_seo_metadata(request, page_name):
+    data = await sync_to_async(seo_map.get)(request, page_name)
+    if data is None:
+        return json_response({'message': 'SEO metadata not found'}, status=404)
+    return json_response(data)
+
+
+@require_safe
+async def seo_metadata_bulk(request):
+    names = request.GET.get('pages')
+    page_names = [name for name in names.split(',') if name] if names is not None else None
+    pages, missing, etag = await sync_to_async(seo_map.select)(request, page_names)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = json_response({'pages': pages, 'missing': missing})
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
@@ -0,0 +1,144 @@
+import bisect
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Appointment
+
+# Appointments in these states hold their slot.
+ACTIVE_STATUSES = ('pending', 'confirmed')
+
+# How far either side of a refused slot alternatives are looked for.
+SUGGESTION_DAYS = 7
+
+OUTSIDE_HOURS = 'outside_hours'
+PAST = 'past'
+TOO_FAR_AHEAD = 'too_far_ahead'
+FULL = 'full'
+
+REASONS = {
+    OUTSIDE_HOURS: 'This time is outside our office hours.',
+    PAST: 'This time has already passed.',
+    TOO_FAR_AHEAD: 'Appointments can only be booked {days} days ahead.',
+    FULL: 'This slot has just been booked.',
+}
+
+
+def slot_length():
+    return datetime.timedelta(minutes=settings.APPOINTMENT_SLOT_MINUTES)
+
+
+def local_now():
+    # preferred_date and preferred_time are wall-clock times in TIME_ZONE.
+    return timezone.localtime().replace(tzinfo=None)
+
+
+def bookable_dates():
+    """(first, last) date that can currently be booked."""
+    today = local_now().date()
+    return today, today + datetime.timedelta(days=settings.APPOINTMENT_BOOKING_DAYS)
+
+
+def office_slots(day):
+    """Yield the start of every slot on ``day`` that lies within ``OFFICE_HOURS``."""
+    if day.isoformat() in settings.APPOINTMENT_CLOSED_DATES:
+        return
+    length = slot_length()
+    for opens, closes in settings.OFFICE_HOURS.get(day.weekday(), ()):
+        start = datetime.datetime.combine(day, datetime.time.fromisoformat(opens))
+        end = datetime.datetime.combine(day, datetime.time.fromisoformat(closes))
+        while start + length <= end:
+            yield start
+            start += length
+
+
+class IntervalIndex:
+    """
+    Booked [start, start + length) intervals, kept sorted by start.
+
+    No booking is longer than ``length``, so the ones overlapping [start, end)
+    are exactly those starting after ``start - length`` and before ``end``:
+    a lookup is two bisections however many bookings the range holds, and
+    also catches bookings that are off the slot grid.
+    """
+
+    def __init__(self, starts, length):
+        self.starts = sorted(starts)
+        self.length = length
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, start):
+        bisect.insort(self.starts, start)
+
+    def overlapping(self, start, end):
+        low = bisect.bisect_right(self.starts, start - self.length)
+        high = bisect.bisect_left(self.starts, end)
+        return high - low
+
+
+def booked(first, last):
+    """An ``IntervalIndex`` of the slot-holding appointments from ``first`` to ``last``."""
+    # One range scan of appointment_status_idx per active status.
+    rows = (Appointment.objects
+            .filter(status__in=ACTIVE_STATUSES, preferred_date__range=(first, last))
+            .values_list('preferred_date', 'preferred_time'))
+    return IntervalIndex((datetime.datetime.combine(day, time) for day, time in rows), slot_length())
+
+
+def free_slots(first, last, index=None):
+    """Yield the start of every future slot from ``first`` to ``last`` with capacity left."""
+    if index is None:
+        index = booked(first, last)
+    now = local_now()
+    length = slot_length()
+    capacity = settings.APPOINTMENT_SLOT_CAPACITY
+    day = first
+    while day <= last:
+        for start in office_slots(day):
+            if start > now and index.overlapping(start, start + length) < capacity:
+                yield start
+        day += datetime.timedelta(days=1)
+
+
+def unavailable_reason(start):
+    """
+    Why the slot starting at ``start`` cannot be booked, or None if it can.
+
+    Run it in the transaction that saves the booking: write transactions
+    begin IMMEDIATE (see DATABASES), so concurrent bookings check and insert
+    one at a time.
+    """
+    last = bookable_dates()[1]
+    if start not in office_slots(start.date()):
+        return OUTSIDE_HOURS
+    if start <= local_now():
+        return PAST
+    if start.date() > last:
+        return TOO_FAR_AHEAD
+    index = booked(start.date(), start.date())
+    if index.overlapping(start, start + slot_length()) >= settings.APPOINTMENT_SLOT_CAPACITY:
+        return FULL
+    return None
+
+
+def describe(reason):
+    return REASONS[reason].format(days=settings.APPOINTMENT_BOOKING_DAYS)
+
+
+def suggestions(start, count=None):
+    """The free slots nearest to ``start``, in date order."""
+    if count is None:
+        count = settings.APPOINTMENT_SUGGESTIONS
+    today, last = bookable_dates()
+    around = min(max(start.date(), today), last)
+    window = datetime.timedelta(days=SUGGESTION_DAYS)
+    slots = sorted(free_slots(max(around - window, today), min(around + window, last)),
+                   key=lambda slot: abs(slot - start))
+    return sorted(slots[:count])
+
+
+def slot_data(start):
+    return {'date': start.date().isoformat(), 'time': start.strftime('%H:%M')}
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+
+VERSION_KEY = 'api:version:{}'
+RESPONSE_KEY = 'api:response:{}:{}:{}'
+LOCK_SUFFIX = ':lock'
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+_async_builds = {}
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def _version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_model_versions(models):
+    """Return the current version stamp of each model, in the given order."""
+    cache = get_cache()
+    keys = [_version_key(model) for model in models]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            # A missing stamp starts from the clock rather than 1 so an evicted
+            # stamp can never collide with one that keyed older entries.
+            version = int(time.time() * 1000)
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+        versions.append(version)
+    return versions
+
+
+def get_model_version(model):
+    return get_model_versions([model])[0]
+
+
+def bump_model_version(model):
+    """
+    Give ``model`` a new version stamp.
+
+    Stamps only need to change, not to count: a fresh clock reading is
+    written rather than incrementing, since ``incr`` is a get and a set on
+    some backends and two workers bumping at once could both write the same
+    value.
+    """
+    version = time.time_ns()
+    get_cache().set(_version_key(model), version, timeout=None)
+    return version
+
+
+def _local_lock(key):
+    with _local_locks_guard:
+        lock = _local_locks.get(key)
+        if lock is None:
+            lock = _local_locks[key] = threading.Lock()
+        return lock
+
+
+def get_or_build(key, build, timeout=None):
+    """
+    Return the cached value for ``key``, calling ``build`` on a miss.
+
+    Concurrent misses are single-flighted: threads of this process queue on a
+    local lock and other workers wait on a short-lived cache lock, so each
+    entry is rebuilt once per invalidation rather than once per request.
+    """
+    cache = get_cache()
+    if timeout is None:
+        timeout = getattr(settings, 'API_CACHE_TIMEOUT', 300)
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    with _local_lock(key):
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        lock_key = key + LOCK_SUFFIX
+        lock_timeout = getattr(settings, 'API_CACHE_LOCK_TIMEOUT', 10)
+        if not cache.add(lock_key, 1, timeout=lock_timeout):
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = cache.get(key)
+                if value is not None:
+                    return value
+                if cache.add(lock_key, 1, timeout=lock_timeout):
+                    break
+
+        try:
+            value = build()
+            if value is not None:
+                cache.set(key, value, timeout=timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+
+async def aget_or_build(key, build, timeout=None):
+    """
+    Async ``get_or_build`` for a coroutine function ``build``.
+
+    Concurrent misses in this event loop await a single build, and other
+    workers are held off by the same cache lock the sync path takes.
+    """
+    cache = get_cache()
+    value = await cache.aget(key)
+    if value is not None:
+        return value
+
+    task = _async_builds.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = _async_builds[key] = asyncio.ensure_future(_abuild(cache, key, build, timeout))
+        task.add_done_callback(lambda done: _async_builds.pop(key, None) if _async_builds.get(key) is done else None)
+    # Shielded so one cancelled request does not abort the build the others await.
+    return await asyncio.shield(task)
+
+
+async def _abuild(cache, key, build, timeout):
+    if timeout is None:
+        timeout = getattr(settings, 'API_CACHE_TIMEOUT', 300)
+    lock_key = key + LOCK_SUFFIX
+    lock_timeout = getattr(settings, 'API_CACHE_LOCK_TIMEOUT', 10)
+    if not await cache.aadd(lock_key, 1, timeout=lock_timeout):
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            value = await cache.aget(key)
+            if value is not None:
+                return value
+            if await cache.aadd(lock_key, 1, timeout=lock_timeout):
+                break
+
+    try:
+        value = await build()
+        if value is not None:
+            await cache.aset(key, value, timeout=timeout)
+    finally:
+        await cache.adelete(lock_key)
+    return value
+
+
+def response_key(basename, versions, url):
+    return RESPONSE_KEY.format(
+        basename,
+        '.'.join(str(version) for version in versions),
+        hashlib.md5(url.encode()).hexdigest(),
+    )
+
+
+async def aget_response(basename, models, url):
+    """
+    Return (key, cached data or None) for an async view.
+
+    Django's cache backends are synchronous and their async methods each run
+    in a thread, so the version stamps and the entry are read in one hop.
+    """
+    def lookup():
+        key = response_key(basename, get_model_versions(models), url)
+        return key, get_cache().get(key)
+    return await sync_to_async(lookup)()
+
+
+class CachedResponseMixin:
+    """
+    Serve ``list`` and ``retrieve`` from the shared cache.
+
+    Entries are keyed on the absolute request URL and the version stamps of
+    ``cache_models``; saving or deleting a row of any of those models bumps
+    its stamp (see ``api.signals``), which retires every dependent entry.
+    """
+    cache_models = ()
+
+    def get_cache_models(self):
+        return self.cache_models or (self.queryset.model,)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        versions = get_model_versions(self.get_cache_models())
+        key = response_key(self.basename, versions, request.build_absolute_uri())
+        uncached = []
+
+        def build():
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                uncached.append(response)
+                return None
+            return response.data
+
+        data = get_or_build(key, build)
+        if uncached:
+            return uncached[0]
+        if data is None:
+            return handler(request, *args, **kwargs)
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
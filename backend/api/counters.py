@@ -0,0 +1,143 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+
+# model label -> (counter prefix, field broken down per value, filter for an "active" counter)
+TRACKED = {
+    'api.Enquiry': ('enquiries', 'status', None),
+    'api.Appointment': ('appointments', 'status', None),
+    'api.NewsletterSubscriber': ('subscribers', None, 'is_active'),
+    'api.NewsArticle': ('news', None, None),
+    'api.Testimonial': ('testimonials', None, None),
+    'api.CaseStudy': ('case_studies', None, None),
+}
+
+
+def _spec(model):
+    return TRACKED.get(model._meta.label)
+
+
+def counter_state(instance):
+    """The values of ``instance`` that decide which counters it contributes to."""
+    prefix, breakdown, active = _spec(type(instance))
+    names = [f'{prefix}.total']
+    if breakdown:
+        names.append(f'{prefix}.{breakdown}.{getattr(instance, breakdown)}')
+    if active and getattr(instance, active):
+        names.append(f'{prefix}.active')
+    return names
+
+
+def remember_state(instance):
+    instance._counter_state = counter_state(instance) if instance.pk else []
+
+
+def deltas_for_save(instance, created):
+    before = [] if created else getattr(instance, '_counter_state', None)
+    after = counter_state(instance)
+    if before is None:
+        # Loaded without post_init (e.g. deferred fields); nothing to diff against.
+        return {}
+    deltas = {}
+    for name in before:
+        deltas[name] = deltas.get(name, 0) - 1
+    for name in after:
+        deltas[name] = deltas.get(name, 0) + 1
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+def deltas_for_delete(instance):
+    return {name: -1 for name in getattr(instance, '_counter_state', None) or counter_state(instance)}
+
+
+def transition_deltas(model, before, new_value):
+    """Counter deltas for a bulk update moving rows from ``before`` ({value: rows}) to ``new_value``."""
+    prefix, breakdown, _ = _spec(model)
+    deltas = {}
+    for value, rows in before.items():
+        if value != new_value:
+            deltas[f'{prefix}.{breakdown}.{value}'] = deltas.get(f'{prefix}.{breakdown}.{value}', 0) - rows
+            deltas[f'{prefix}.{breakdown}.{new_value}'] = deltas.get(f'{prefix}.{breakdown}.{new_value}', 0) + rows
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+def compute(get_model=apps.get_model):
+    """Count every tracked value from the source tables."""
+    counts = {}
+    for label, (prefix, breakdown, active) in TRACKED.items():
+        model = get_model(*label.split('.'))
+        counts[f'{prefix}.total'] = model._default_manager.count()
+        if breakdown:
+            field = model._meta.get_field(breakdown)
+            for value, _ in field.choices or ():
+                counts[f'{prefix}.{breakdown}.{value}'] = 0
+            for row in model._default_manager.values(breakdown).annotate(n=Count('pk')).order_by():
+                counts[f'{prefix}.{breakdown}.{row[breakdown]}'] = row['n']
+        if active:
+            counts[f'{prefix}.active'] = model._default_manager.filter(**{active: True}).count()
+    return counts
+
+
+def count(name):
+    """Count the single counter ``name`` from its source table."""
+    prefix, _, rest = name.partition('.')
+    for label, (counter_prefix, breakdown, active) in TRACKED.items():
+        if counter_prefix == prefix:
+            break
+    else:
+        return 0
+    manager = apps.get_model(label)._default_manager
+    if rest == 'total':
+        return manager.count()
+    if active and rest == 'active':
+        return manager.filter(**{active: True}).count()
+    if breakdown and rest.startswith(f'{breakdown}.'):
+        return manager.filter(**{breakdown: rest[len(breakdown) + 1:]}).count()
+    return 0
+
+
+def adjust(deltas):
+    if not deltas:
+        return
+    from .models import StatCounter
+    now = timezone.now()
+    with transaction.atomic():
+        for name, delta in deltas.items():
+            updated = StatCounter.objects.filter(name=name).update(
+                value=F('value') + delta, updated_at=now
+            )
+            if not updated:
+                # A counter seen for the first time starts from its real count,
+                # which already includes the change being applied.
+                StatCounter.objects.get_or_create(name=name, defaults={'value': count(name)})
+
+
+def reconcile(get_model=apps.get_model, dry_run=False):
+    """Repair drifted counters; returns {name: (stored, actual)} for each one that differed."""
+    StatCounter = get_model('api', 'StatCounter')
+    actual = compute(get_model)
+    stored = dict(StatCounter._default_manager.values_list('name', 'value'))
+    drift = {
+        name: (stored.get(name), value)
+        for name, value in actual.items()
+        if stored.get(name) != value
+    }
+    if drift and not dry_run:
+        now = timezone.now()
+        with transaction.atomic():
+            for name, (_, value) in drift.items():
+                StatCounter._default_manager.update_or_create(
+                    name=name, defaults={'value': value, 'updated_at': now}
+                )
+    return drift
+
+
+def snapshot(since=None):
+    """All counters in one query, optionally only those changed after ``since``."""
+    from .models import StatCounter
+    queryset = StatCounter.objects.all()
+    if since is not None:
+        queryset = queryset.filter(updated_at__gt=since)
+    return dict(queryset.values_list('name', 'value'))
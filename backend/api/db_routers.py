@@ -0,0 +1,53 @@
+import contextlib
+import contextvars
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+_read_only = contextvars.ContextVar('api_read_only', default=False)
+
+
+@contextlib.contextmanager
+def read_only():
+    """Route the reads made inside the block to ``DATABASE_READ_ALIAS``."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+class ReadReplicaRouter:
+    """
+    Reads inside ``read_only()`` go to ``DATABASE_READ_ALIAS``; every other
+    read and every write goes to the default database.
+
+    While the default connection has a transaction open in this thread,
+    reads stay on it so they see its uncommitted writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = getattr(settings, 'DATABASE_READ_ALIAS', None)
+        if _read_only.get() and alias in settings.DATABASES and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadReplicaMixin:
+    """Serve a viewset's safe requests from the read-only database alias."""
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with read_only():
+            return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,64 @@
+import datetime
+import hashlib
+import re
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .utils import get_client_ip
+
+KEY_HEADER = 'Idempotency-Key'
+KEY_MAX_LENGTH = 255
+
+# Submitted fields that make two submissions the same one.
+FINGERPRINT_FIELDS = {
+    'api.Enquiry': ('email', 'phone', 'matter_type', 'subject', 'message'),
+    'api.Appointment': ('email', 'phone', 'matter_type', 'preferred_date', 'preferred_time', 'message'),
+}
+
+
+def normalize(name, value):
+    if name == 'phone':
+        return re.sub(r'\D', '', value)
+    # Case and whitespace differences do not make a submission new.
+    return ' '.join(str(value).split()).casefold()
+
+
+def fingerprint(model, data):
+    """SHA-256 of the normalized ``FINGERPRINT_FIELDS`` of validated form data."""
+    parts = (normalize(name, data.get(name, '')) for name in FINGERPRINT_FIELDS[model._meta.label])
+    return hashlib.sha256('\x1f'.join(parts).encode()).hexdigest()
+
+
+def idempotency_key(request):
+    """
+    SHA-256 of the client address and the ``Idempotency-Key`` header, or
+    None without one: a key only ever matches submissions from the client
+    that sent it.
+    """
+    key = request.headers.get(KEY_HEADER, '').strip()
+    if len(key) > KEY_MAX_LENGTH:
+        raise ValidationError({KEY_HEADER: [f'Ensure this header has no more than {KEY_MAX_LENGTH} characters.']})
+    if not key:
+        return None
+    return hashlib.sha256(f'{get_client_ip(request)}\x1f{key}'.encode()).hexdigest()
+
+
+def find_original(model, fingerprint, key=None):
+    """
+    The earlier submission this one repeats, or None.
+
+    Only submissions inside ``SUBMISSION_DUPLICATE_WINDOW`` count. A
+    matching ``Idempotency-Key`` wins whenever it was sent; otherwise the
+    first submission with the same fingerprint. Both are found on a
+    (column, created_at) index. Run it in the transaction that saves the
+    submission, so two copies arriving together cannot both be inserted.
+    """
+    since = timezone.now() - datetime.timedelta(seconds=settings.SUBMISSION_DUPLICATE_WINDOW)
+    recent = model.objects.filter(created_at__gte=since).order_by('created_at')
+    if key is not None:
+        original = recent.filter(idempotency_key=key).first()
+        if original is not None:
+            return original
+    return recent.filter(fingerprint=fingerprint).first()
@@ -0,0 +1,49 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+# A cell starting with one of these is read as a formula by spreadsheet apps.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def csv_cell(value):
+    if value is None:
+        return ''
+    # Text comes from public forms, so a leading quote keeps it text.
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_rows(fields, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([csv_cell(value) for value in row])
+
+
+def ndjson_rows(fields, rows):
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    for row in rows:
+        yield encoder.encode(dict(zip(fields, row))) + '\n'
+
+
+def stream_rows(file_format, fields, queryset, chunk_size=2000):
+    """Yield encoded lines for ``queryset``, fetching ``chunk_size`` rows per round trip."""
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    if file_format == 'csv':
+        return csv_rows(fields, rows)
+    return ndjson_rows(fields, rows)
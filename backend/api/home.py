@@ -0,0 +1,73 @@
+import hashlib
+import threading
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+from .cache import get_model_versions
+from .models import FAQ, NewsArticle, PracticeArea, Service, TeamMember, Testimonial
+from .serializers import (
+    FAQSerializer, NewsArticleListSerializer, PracticeAreaSerializer, ServiceSerializer,
+    TeamMemberSerializer, TestimonialSerializer,
+)
+
+
+def _latest_news():
+    limit = getattr(settings, 'HOME_NEWS_COUNT', 3)
+    return NewsArticle.objects.filter(is_published=True).select_related('author')[:limit]
+
+
+# section -> (queryset factory, serializer, models whose changes rebuild it)
+SECTIONS = {
+    'practice_areas': (lambda: PracticeArea.objects.filter(is_active=True), PracticeAreaSerializer, (PracticeArea,)),
+    'services': (lambda: Service.objects.filter(is_active=True), ServiceSerializer, (Service,)),
+    'testimonials': (
+        lambda: Testimonial.objects.filter(is_published=True, is_featured=True).select_related('practice_area'),
+        TestimonialSerializer, (Testimonial, PracticeArea),
+    ),
+    'news': (_latest_news, NewsArticleListSerializer, (NewsArticle,)),
+    'team': (lambda: TeamMember.objects.filter(is_active=True), TeamMemberSerializer, (TeamMember,)),
+    'faqs': (lambda: FAQ.objects.filter(is_published=True), FAQSerializer, (FAQ,)),
+}
+
+
+class HomeBundle:
+    """
+    Rendered JSON for each homepage section, kept in process memory.
+
+    A section is re-rendered only when the version stamp of a model it reads
+    changes (or the site root does, as image URLs are absolute); serving the
+    bundle is otherwise one cache read for the stamps and a byte join.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sections = {}
+
+    def _render(self, name, request):
+        queryset, serializer_class, _ = SECTIONS[name]
+        data = serializer_class(queryset(), many=True, context={'request': request}).data
+        return JSONRenderer().render(data)
+
+    def render(self, request, names):
+        """Return (JSON bytes, strong etag) for the ``names`` sections, in order."""
+        models = sorted({model for name in names for model in SECTIONS[name][2]}, key=lambda m: m._meta.label)
+        versions = dict(zip(models, get_model_versions(models)))
+        base = request.build_absolute_uri('/')
+
+        parts, keys = [], []
+        for name in names:
+            key = (base,) + tuple(versions[model] for model in SECTIONS[name][2])
+            cached = self._sections.get(name)
+            if cached is None or cached[0] != key:
+                with self._lock:
+                    cached = self._sections.get(name)
+                    if cached is None or cached[0] != key:
+                        cached = self._sections[name] = (key, self._render(name, request))
+            parts.append(b'"%s":%s' % (name.encode(), cached[1]))
+            keys.append(f'{name}:{key}')
+        etag = hashlib.sha256('|'.join(keys).encode()).hexdigest()
+        return b'{' + b','.join(parts) + b'}', f'"{etag}"'
+
+
+home_bundle = HomeBundle()
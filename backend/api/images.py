@@ -0,0 +1,177 @@
+import base64
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+
+VARIANT_DIR = 'variants'
+FORMATS = {'webp': ('WEBP', 'webp'), 'jpeg': ('JPEG', 'jpg')}
+
+
+def render_variants(source_path, media_root, name, widths, quality=80, placeholder_width=16):
+    """
+    Write resized WebP/JPEG copies of ``name`` and return their manifest.
+
+    Runs in spawned pool workers that never configure Django, so it may only
+    use the standard library and Pillow.
+    """
+    from PIL import Image, ImageFilter, ImageOps
+
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    variant_dir = os.path.join(directory, VARIANT_DIR)
+    os.makedirs(os.path.join(media_root, variant_dir), exist_ok=True)
+
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        width, height = image.size
+        flat = image
+        if image.mode == 'RGBA':
+            flat = Image.new('RGB', image.size, (255, 255, 255))
+            flat.paste(image, mask=image.getchannel('A'))
+
+        manifest = {'source': name, 'width': width, 'height': height}
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        for key, (pil_format, extension) in FORMATS.items():
+            manifest[key] = {}
+            for target in targets:
+                resized = (image if key == 'webp' else flat).resize(
+                    (target, max(1, round(height * target / width))), Image.LANCZOS
+                )
+                variant = os.path.join(variant_dir, f'{stem}.{target}w.{extension}')
+                resized.save(os.path.join(media_root, variant), pil_format, quality=quality, optimize=True)
+                manifest[key][str(target)] = variant.replace(os.sep, '/')
+
+        tiny = flat.resize(
+            (placeholder_width, max(1, round(height * placeholder_width / width))), Image.BILINEAR
+        ).filter(ImageFilter.GaussianBlur(1))
+        buffer = io.BytesIO()
+        tiny.save(buffer, 'JPEG', quality=40)
+        manifest['placeholder'] = 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode()
+    return manifest
+
+
+# model label -> image fields; each field's manifest lives in "<field>_variants"
+IMAGE_FIELDS = {
+    'api.TeamMember': ('image',),
+    'api.NewsArticle': ('image',),
+    'api.CaseStudy': ('image',),
+    'api.Testimonial': ('client_image',),
+    'api.SEOMetadata': ('og_image',),
+}
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=getattr(settings, 'IMAGE_VARIANT_WORKERS', 2),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _executor
+
+
+def _render_args(name):
+    from django.core.files.storage import default_storage
+    return (
+        default_storage.path(name),
+        str(settings.MEDIA_ROOT),
+        name,
+        tuple(getattr(settings, 'IMAGE_VARIANT_WIDTHS', (320, 640, 960, 1280))),
+        getattr(settings, 'IMAGE_VARIANT_QUALITY', 80),
+    )
+
+
+def delete_variant_files(manifest):
+    from django.core.files.storage import default_storage
+    for key in FORMATS:
+        for name in (manifest or {}).get(key, {}).values():
+            default_storage.delete(name)
+
+
+def _store(model, pk, field_name, manifest):
+    from django.db import connection
+    from .cache import bump_model_version
+
+    try:
+        # Only attach the manifest if the image was not replaced meanwhile;
+        # update() keeps updated_at and the save signals out of it.
+        stored = model.objects.filter(pk=pk, **{field_name: manifest['source']}).update(
+            **{f'{field_name}_variants': manifest}
+        )
+        if stored:
+            bump_model_version(model)
+        else:
+            delete_variant_files(manifest)
+    finally:
+        connection.close()
+
+
+def schedule_variants(instance, field_name, sync=False):
+    """Render variants for ``instance.<field_name>`` unless its manifest is current."""
+    model = type(instance)
+    name = getattr(instance, field_name).name
+    manifest_field = f'{field_name}_variants'
+    manifest = getattr(instance, manifest_field) or {}
+    if manifest.get('source') == name and name:
+        return None
+
+    if manifest:
+        delete_variant_files(manifest)
+        model.objects.filter(pk=instance.pk).update(**{manifest_field: {}})
+        setattr(instance, manifest_field, {})
+    if not name:
+        return None
+
+    if sync:
+        manifest = render_variants(*_render_args(name))
+        model.objects.filter(pk=instance.pk).update(**{manifest_field: manifest})
+        setattr(instance, manifest_field, manifest)
+        return manifest
+
+    def done(future):
+        if future.exception() is not None:
+            logger.error('Rendering variants of %s failed', name, exc_info=future.exception())
+            return
+        _store(model, instance.pk, field_name, future.result())
+
+    def submit():
+        future = get_executor().submit(render_variants, *_render_args(name))
+        future.add_done_callback(done)
+
+    transaction.on_commit(submit)
+    return None
+
+
+def variants_representation(manifest, request):
+    """Absolute variant URLs and ``srcset`` strings for a serializer."""
+    if not manifest or not request:
+        return None
+    from django.core.files.storage import default_storage
+
+    data = {
+        'width': manifest['width'],
+        'height': manifest['height'],
+        'placeholder': manifest['placeholder'],
+        'srcset': {},
+    }
+    for key in FORMATS:
+        urls = {
+            width: request.build_absolute_uri(default_storage.url(name))
+            for width, name in manifest.get(key, {}).items()
+        }
+        data[key] = urls
+        data['srcset'][key] = ', '.join(f'{url} {width}w' for width, url in urls.items())
+    return data
@@ -0,0 +1,56 @@
+import datetime
+import gzip
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import ActivityLog
+
+
+class Command(BaseCommand):
+    help = 'Move activity log rows older than the retention period into a gzipped NDJSON archive'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ACTIVITY_LOG_RETENTION_DAYS,
+                            help='Keep rows newer than this many days')
+        parser.add_argument('--output-dir', default=settings.ACTIVITY_LOG_ARCHIVE_DIR)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would be archived')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(days=options['days'])
+        expired = ActivityLog.objects.filter(timestamp__lt=cutoff).order_by('id')
+        total = expired.count()
+        if options['dry_run'] or not total:
+            self.stdout.write(f'{total} rows older than {cutoff:%Y-%m-%d}')
+            return
+
+        output_dir = Path(options['output_dir'])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f'activity-logs-{timezone.now():%Y%m%d-%H%M%S}.ndjson.gz'
+        fields = ['id', 'user_id', 'user__username', 'action', 'model_name',
+                  'object_id', 'details', 'timestamp', 'ip_address']
+
+        archived = 0
+        last_id = 0
+        with gzip.open(path, 'wt', encoding='utf-8') as archive:
+            while True:
+                # Rows are written before their batch is deleted, so a crash
+                # can at worst leave rows in both places, never in neither.
+                batch = list(expired.filter(id__gt=last_id).values(*fields)[:options['batch_size']])
+                if not batch:
+                    break
+                for row in batch:
+                    archive.write(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+                archive.flush()
+                last_id = batch[-1]['id']
+                with transaction.atomic():
+                    ActivityLog.objects.filter(id__in=[row['id'] for row in batch]).delete()
+                archived += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} rows to {path}'))
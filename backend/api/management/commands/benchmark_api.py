@@ -0,0 +1,246 @@
+import itertools
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api import availability, exports
+from api.models import Appointment, Enquiry
+from api.sampledata import LOCMEM_CACHES, endpoints, seeded
+
+# Latency changes smaller than this are noise, whatever the tolerance.
+LATENCY_FLOOR_MS = 1.0
+MEMORY_FLOOR_KB = 64
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def client_addresses():
+    """A distinct REMOTE_ADDR per form POST, so the per-client throttles never trip."""
+    for n in itertools.count(1):
+        yield f'10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}'
+
+
+def booking(start):
+    return {'preferred_date': start.date().isoformat(), 'preferred_time': start.strftime('%H:%M')}
+
+
+def form_posts():
+    """Yield (name, url, payload factory, encoding) for every public form endpoint."""
+    serial = itertools.count()
+    pdf = b'%PDF-1.4\n' + b'0' * 4096
+
+    yield 'create-enquiry', reverse('create-enquiry'), lambda: {
+        'name': 'Benchmark', 'email': f'bench{next(serial)}@example.com', 'phone': '9999999999',
+        'matter_type': 'civil', 'subject': 'Subject', 'message': 'Message',
+    }, 'json'
+    # Each booking takes a slot, so every POST asks for the next free one.
+    slots = iter(list(availability.free_slots(*availability.bookable_dates())))
+    yield 'create-appointment', reverse('create-appointment'), lambda: {
+        'name': 'Benchmark', 'email': f'bench{next(serial)}@example.com', 'phone': '9999999999',
+        'matter_type': 'civil', 'message': '', **booking(next(slots)),
+    }, 'json'
+    yield 'subscribe-newsletter', reverse('subscribe-newsletter'), lambda: {
+        'email': f'bench-subscriber-{next(serial)}@example.com',
+    }, 'json'
+    yield 'apply-career', reverse('apply-career'), lambda: {
+        'name': 'Benchmark', 'email': f'bench{next(serial)}@example.com', 'phone': '9999999999',
+        'position': 'Associate', 'experience_years': 1, 'education': 'LLB', 'cover_letter': 'Letter',
+        'resume': SimpleUploadedFile('resume.pdf', pdf, content_type='application/pdf'),
+    }, 'multipart'
+
+
+def admin_routes(admin):
+    """
+    Yield (name, method, url, payload factory) for the admin and token routes
+    ``endpoints()`` does not cover. Payload-less routes have None.
+    """
+    for basename, model in (('admin-enquiry', Enquiry), ('admin-appointment', Appointment)):
+        for file_format in exports.FORMATS:
+            yield f'{basename}-export-{file_format}', 'get', f'{reverse(f"{basename}-export")}?file_format={file_format}', None
+        # Cycle through the statuses so every update changes rows and moves the counters.
+        statuses = itertools.cycle(model.STATUS_CHOICES)
+        ids = list(model.objects.values_list('pk', flat=True))
+        url = reverse(f'{basename}-bulk-update-status')
+        yield f'{basename}-bulk-update-status-ids', 'post', url, lambda ids=ids, statuses=statuses: {
+            'ids': ids, 'status': next(statuses)[0],
+        }
+        everything = [value for value, _ in model.STATUS_CHOICES]
+        yield f'{basename}-bulk-update-status-filter', 'post', url, lambda everything=everything, statuses=statuses: {
+            'filter': {'status__in': ','.join(everything)}, 'status': next(statuses)[0],
+        }
+    enquiry = Enquiry.objects.order_by('pk').first()
+    statuses = itertools.cycle(Enquiry.STATUS_CHOICES)
+    yield 'admin-enquiry-update-status', 'patch', reverse('admin-enquiry-update-status', args=[enquiry.pk]), lambda: {
+        'status': next(statuses)[0],
+    }
+    yield 'metrics', 'get', reverse('metrics'), None
+    yield 'token_obtain_pair', 'post', reverse('token_obtain_pair'), lambda: {
+        'username': admin.username, 'password': 'sample-password',
+    }
+    refresh = str(RefreshToken.for_user(admin))
+    yield 'token_refresh', 'post', reverse('token_refresh'), lambda: {'refresh': refresh}
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a scaled dataset in a rolled-back transaction and drive every API route through '
+        'the WSGI handler: latency percentiles, requests/sec, SQL queries and peak memory per '
+        'endpoint, compared against a stored JSON baseline'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=100, help='Rows seeded per model')
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--baseline', default=settings.BENCHMARK_BASELINE)
+        parser.add_argument('--tolerance', type=float, default=settings.BENCHMARK_TOLERANCE,
+                            help='Allowed relative slowdown before an endpoint counts as regressed')
+        parser.add_argument('--save', action='store_true', help='Write these results as the new baseline')
+        parser.add_argument('--only', help='Comma-separated endpoint names to run')
+
+    def handle(self, *args, **options):
+        only = set(options['only'].split(',')) if options['only'] else None
+        with tempfile.TemporaryDirectory() as scratch, override_settings(
+            CACHES=LOCMEM_CACHES,
+            MEDIA_ROOT=scratch,
+            SITEMAP_ROOT=Path(scratch) / 'sitemaps',
+            ACTIVITY_LOG_ASYNC=False,
+        ):
+            results = self.run(options, only)
+
+        for name, result in results.items():
+            self.stdout.write(
+                f'{name:44} p50 {result["p50_ms"]:7.2f}  p95 {result["p95_ms"]:7.2f}  p99 {result["p99_ms"]:7.2f} ms  '
+                f'{result["rps"]:8.1f} req/s  {result["queries"]:5.1f} q  {result["peak_kb"]:8.1f} KB'
+            )
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'scale': options['scale'],
+            'iterations': options['iterations'],
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'endpoints': results,
+        }
+        baseline_path = Path(options['baseline'])
+        if options['save']:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(report, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Baseline written to {baseline_path}'))
+            return
+        if not baseline_path.exists():
+            self.stdout.write(f'No baseline at {baseline_path}; run with --save to record one')
+            return
+
+        baseline = json.loads(baseline_path.read_text())
+        regressions = self.compare(baseline['endpoints'], results, options['tolerance'])
+        if regressions:
+            raise CommandError('Regressions against baseline:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(results)} endpoints within {options["tolerance"]:.0%} of the baseline'
+        ))
+
+    def run(self, options, only):
+        results = {}
+        with seeded(options['scale']) as admin:
+            token = str(RefreshToken.for_user(admin).access_token)
+            public = Client(HTTP_HOST='localhost')
+            authenticated = Client(HTTP_HOST='localhost', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+            requests = []
+            for name, url in endpoints(options['scale']):
+                client = authenticated if name.startswith(('admin-', 'dashboard-')) else public
+                requests.append((name, lambda client=client, url=url: client.get(url)))
+            for name in ('sitemap', 'news-rss'):
+                requests.append((name, lambda url=reverse(name): public.get(url)))
+            addresses = client_addresses()
+            for name, url, payload, encoding in form_posts():
+                if encoding == 'json':
+                    send = lambda url=url, payload=payload: public.post(
+                        url, json.dumps(payload()), content_type='application/json', REMOTE_ADDR=next(addresses))
+                else:
+                    send = lambda url=url, payload=payload: public.post(url, payload(), REMOTE_ADDR=next(addresses))
+                requests.append((name, send))
+            for name, method, url, payload in admin_routes(admin):
+                client = public if name.startswith('token_') else authenticated
+                if payload is None:
+                    send = lambda client=client, url=url: client.get(url)
+                else:
+                    send = lambda client=client, method=method, url=url, payload=payload: getattr(client, method)(
+                        url, json.dumps(payload()), content_type='application/json')
+                requests.append((name, send))
+
+            for name, send in requests:
+                if only and name not in only:
+                    continue
+                results[name] = self.measure(name, send, options['iterations'], options['warmup'])
+        return results
+
+    def measure(self, name, send, iterations, warmup):
+        for _ in range(warmup):
+            response = send()
+            if response.status_code >= 400:
+                raise CommandError(f'{name} returned {response.status_code}')
+
+        latencies = []
+        query_counts = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = send()
+                if hasattr(response, 'streaming_content'):
+                    b''.join(response.streaming_content)
+                latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(queries))
+        elapsed = time.perf_counter() - started
+
+        # Memory is traced in a separate pass; tracemalloc would skew the timings.
+        tracemalloc.start()
+        for _ in range(min(iterations, 5)):
+            send()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        return {
+            'p50_ms': round(percentile(latencies, 0.50), 3),
+            'p95_ms': round(percentile(latencies, 0.95), 3),
+            'p99_ms': round(percentile(latencies, 0.99), 3),
+            'rps': round(iterations / elapsed, 1),
+            'queries': round(sum(query_counts) / len(query_counts), 2),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    def compare(self, baseline, results, tolerance):
+        regressions = []
+        for name, result in results.items():
+            before = baseline.get(name)
+            if before is None:
+                continue
+            for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+                if result[metric] > before[metric] * (1 + tolerance) and result[metric] - before[metric] > LATENCY_FLOOR_MS:
+                    regressions.append(f'{name}: {metric} {before[metric]} -> {result[metric]}')
+            if result['queries'] > before['queries']:
+                regressions.append(f'{name}: queries {before["queries"]} -> {result["queries"]}')
+            if result['peak_kb'] > before['peak_kb'] * (1 + tolerance) and result['peak_kb'] - before['peak_kb'] > MEMORY_FLOOR_KB:
+                regressions.append(f'{name}: peak memory {before["peak_kb"]} KB -> {result["peak_kb"]} KB')
+        return regressions
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+import time
+
+from asgiref.sync import ThreadSensitiveContext, async_to_sync
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from api import async_urls
+from api.management.commands.benchmark_api import percentile
+from api.sampledata import LOCMEM_CACHES, endpoints, temporary_database
+from api.urls import public_router
+
+ASYNC_ROUTES = {pattern.name for pattern in async_urls.urlpatterns}
+
+
+def null_relation_urls():
+    """Yield (name, url) for a public detail whose nullable foreign key is empty, per such key."""
+    for prefix, viewset, basename in public_router.registry:
+        lookup_field = getattr(viewset, 'lookup_field', 'pk')
+        for field in viewset.queryset.model._meta.get_fields():
+            if field.many_to_one and field.null:
+                obj = viewset.queryset.filter(**{f'{field.name}__isnull': True}).order_by('pk').first()
+                if obj is not None:
+                    url = reverse(f'{basename}-detail', kwargs={lookup_field: getattr(obj, lookup_field)})
+                    yield f'{basename}-detail', url
+
+
+class ThreadSampler:
+    """Peak number of threads alive (besides the sampler itself) while the block runs."""
+
+    def __enter__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.wait(0.001):
+            self.peak = max(self.peak, threading.active_count() - 1)
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+class Command(BaseCommand):
+    help = (
+        'Serve the public read endpoints through the WSGI path (sync views, one thread per '
+        'concurrent client) and the ASGI path (async views on one event loop) from a seeded '
+        'throwaway database: check both return the same responses, then compare latency, '
+        'throughput and peak threads at the given concurrency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=100, help='Rows seeded per model')
+        parser.add_argument('--requests', type=int, default=400, help='Requests per endpoint and path')
+        parser.add_argument('--concurrency', type=int, default=50, help='Clients sending requests at once')
+        parser.add_argument('--only', help='Comma-separated endpoint names to run')
+
+    def handle(self, *args, **options):
+        only = set(options['only'].split(',')) if options['only'] else None
+        concurrency = max(1, options['concurrency'])
+        per_client = max(1, options['requests'] // concurrency)
+
+        # AsyncClient always sends Host: testserver, and media URLs carry the host, so both
+        # paths use that host, allowed here as Django's test runner does. Slow-query logging
+        # is off since latency under load is what is measured.
+        with override_settings(CACHES=LOCMEM_CACHES, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                               PERF_SLOW_QUERY_MS=float('inf'), PERF_SLOW_REQUEST_MS=float('inf')), \
+                temporary_database(options['scale']):
+            urls = [(name, url) for name, url in endpoints(10)
+                    if name in ASYNC_ROUTES and (not only or name in only)]
+            self.verify(urls + [(name, url) for name, url in null_relation_urls()
+                                if name in ASYNC_ROUTES and (not only or name in only)])
+
+            self.stdout.write(f'{concurrency} clients x {per_client} requests per endpoint')
+            for name, url in urls:
+                wsgi = self.measure(self.run_wsgi, url, concurrency, per_client)
+                asgi = self.measure(self.run_asgi, url, concurrency, per_client)
+                for label, result in (('wsgi', wsgi), ('asgi', asgi)):
+                    self.stdout.write(
+                        f'{name:22} {label}  p50 {result["p50"]:7.2f}  p95 {result["p95"]:7.2f}  '
+                        f'p99 {result["p99"]:7.2f} ms  {result["rps"]:8.1f} req/s  {result["threads"]:4d} threads'
+                    )
+
+    def verify(self, urls):
+        """Both paths must answer every URL with the same status and body."""
+        cache = caches['default']
+        mismatches = []
+        for name, url in urls:
+            cache.clear()
+            sync = Client().get(url)
+            cache.clear()
+            with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+                response = async_to_sync(AsyncClient().get)(url)
+            if sync.status_code != 200 or response.status_code != 200:
+                raise CommandError(f'{name}: WSGI returned {sync.status_code}, ASGI {response.status_code}')
+            sync_data, async_data = json.loads(sync.content), json.loads(response.content)
+            if name == 'news-detail':
+                # Each request records a view, so the two counts differ by design.
+                sync_data.pop('views'), async_data.pop('views')
+            if sync_data != async_data:
+                mismatches.append(name)
+        if mismatches:
+            raise CommandError(f'Async views differ from the sync views for: {", ".join(mismatches)}')
+        self.stdout.write(self.style.SUCCESS(f'{len(urls)} async endpoints match their sync views'))
+
+    def measure(self, run, url, concurrency, per_client):
+        latencies = []
+        with ThreadSampler() as threads:
+            started = time.perf_counter()
+            run(url, concurrency, per_client, latencies)
+            elapsed = time.perf_counter() - started
+        return {
+            'p50': percentile(latencies, 0.50),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'rps': len(latencies) / elapsed,
+            'threads': threads.peak,
+        }
+
+    def run_wsgi(self, url, concurrency, per_client, latencies):
+        failures = []
+
+        def client():
+            http = Client()
+            try:
+                for _ in range(per_client):
+                    start = time.perf_counter()
+                    response = http.get(url)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    if response.status_code != 200:
+                        failures.append(response.status_code)
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=client) for _ in range(concurrency)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if failures:
+            raise CommandError(f'WSGI {url} returned {failures[0]}')
+
+    @override_settings(ROOT_URLCONF=settings.ASGI_URLCONF)
+    def run_asgi(self, url, concurrency, per_client, latencies):
+        async def client():
+            http = AsyncClient()
+            for _ in range(per_client):
+                # As in ASGIHandler: the request's sync work shares one thread.
+                async with ThreadSensitiveContext():
+                    start = time.perf_counter()
+                    response = await http.get(url)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(f'ASGI {url} returned {response.status_code}')
+
+        async def main():
+            await asyncio.gather(*(client() for _ in range(concurrency)))
+
+        async_to_sync(main)()
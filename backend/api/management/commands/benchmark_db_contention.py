@@ -0,0 +1,186 @@
+import itertools
+import json
+import multiprocessing
+import re
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from api.management.commands.benchmark_api import client_addresses, percentile
+from api.sampledata import temporary_database
+
+DUMMY_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+JOURNAL_MODES = ('delete', 'wal')
+
+
+def read_urls():
+    return [
+        f'{reverse("news-list")}?page_size=20',
+        f'{reverse("case-study-list")}?page_size=20',
+        reverse('practice-area-list'),
+        reverse('faq-list'),
+    ]
+
+
+def in_windows(moment, windows):
+    return any(start <= moment <= end for start, end in windows)
+
+
+class Command(BaseCommand):
+    help = (
+        'Run public readers against bursts of public form POSTs on a seeded throwaway SQLite '
+        'database, once with the rollback journal and once in WAL mode, and compare read '
+        'latency and throughput inside and outside the write bursts'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=200, help='Rows seeded per model')
+        parser.add_argument('--readers', type=int, default=4, help='Reader processes')
+        parser.add_argument('--writers', type=int, default=2, help='Writer processes')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per journal mode')
+        parser.add_argument('--burst', type=int, default=20, help='POSTs per writer per burst')
+        parser.add_argument('--pause', type=float, default=0.5, help='Seconds between bursts')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('The contention benchmark compares SQLite journal modes')
+
+        # The response cache is off so every read reaches the database, and
+        # slow-query logging is off since slow queries are what is measured.
+        with override_settings(CACHES=DUMMY_CACHES, ACTIVITY_LOG_ASYNC=False,
+                               PERF_SLOW_QUERY_MS=float('inf'), PERF_SLOW_REQUEST_MS=float('inf')), \
+                temporary_database(options['scale']):
+            for mode in JOURNAL_MODES:
+                self.set_journal_mode(mode)
+                reads, writes, bursts = self.run(options)
+                self.report(mode, reads, writes, bursts)
+
+    def set_journal_mode(self, mode):
+        # Every connection (the replica mirrors the test database) reopens in ``mode``.
+        connections.close_all()
+        for alias in connections:
+            options = connections[alias].settings_dict['OPTIONS']
+            init_command = re.sub(r'PRAGMA journal_mode=\w+;?\s*', '', options.get('init_command', ''))
+            options['init_command'] = f'PRAGMA journal_mode={mode}; {init_command}'
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            if cursor.fetchone()[0] != mode:
+                raise CommandError(f'Could not switch the database to journal_mode={mode}')
+        connections.close_all()
+
+    def run(self, options):
+        # Separate processes, like server workers, so SQLite locking rather than the GIL decides who waits.
+        context = multiprocessing.get_context('fork')
+        stop = context.Event()
+        results = context.Queue()
+        started = context.Barrier(options['readers'] + options['writers'] + 1)
+        urls = read_urls()
+        workers = [context.Process(target=self.reader, args=(urls[i % len(urls):] + urls[:i % len(urls)],
+                                                             started, stop, results))
+                   for i in range(options['readers'])]
+        workers += [context.Process(target=self.writer, args=(i, options, started, stop, results))
+                    for i in range(options['writers'])]
+
+        connections.close_all()
+        for worker in workers:
+            worker.start()
+        started.wait()
+        time.sleep(options['duration'])
+        stop.set()
+
+        reads, writes, bursts = [], [], []
+        for _ in workers:
+            kind, samples, windows = results.get()
+            (reads if kind == 'read' else writes).extend(samples)
+            bursts.extend(windows)
+        for worker in workers:
+            worker.join()
+        return reads, writes, bursts
+
+    @staticmethod
+    def reader(urls, started, stop, results):
+        http = Client(HTTP_HOST='localhost')
+        reads = []
+        for url in urls:
+            http.get(url)
+        started.wait()
+        for url in itertools.cycle(urls):
+            if stop.is_set():
+                break
+            start = time.monotonic()
+            try:
+                ok = http.get(url).status_code == 200
+            except Exception:
+                ok = False
+            end = time.monotonic()
+            reads.append((end, (end - start) * 1000, ok))
+        connections.close_all()
+        results.put(('read', reads, []))
+
+    @staticmethod
+    def writer(number, options, started, stop, results):
+        http = Client(HTTP_HOST='localhost')
+        url = reverse('create-enquiry')
+        writes, bursts = [], []
+        serial = itertools.count()
+        addresses = client_addresses()
+        http.get(reverse('faq-list'))
+        started.wait()
+        while not stop.is_set():
+            burst_start = time.monotonic()
+            for _ in range(options['burst']):
+                payload = {
+                    'name': 'Contention', 'email': f'contention{number}-{next(serial)}@example.com',
+                    'phone': '9999999999', 'matter_type': 'civil', 'subject': 'Subject', 'message': 'Message',
+                }
+                start = time.monotonic()
+                try:
+                    ok = http.post(url, json.dumps(payload), content_type='application/json',
+                                   REMOTE_ADDR=next(addresses)).status_code == 201
+                except Exception:
+                    ok = False
+                writes.append(((time.monotonic() - start) * 1000, ok))
+            bursts.append((burst_start, time.monotonic()))
+            stop.wait(options['pause'])
+        connections.close_all()
+        results.put(('write', writes, bursts))
+
+    def report(self, mode, reads, writes, bursts):
+        if not bursts:
+            raise CommandError('No write burst completed; raise --duration')
+        # Overlapping bursts from several writers count once.
+        windows = []
+        for start, end in sorted(bursts):
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+            else:
+                windows.append((start, end))
+        span = max(end for end, _, _ in reads) - min(end - latency / 1000 for end, latency, _ in reads)
+        burst_time = sum(end - start for start, end in windows)
+        during = [latency for end, latency, ok in reads if ok and in_windows(end, windows)]
+        outside = [latency for end, latency, ok in reads if ok and not in_windows(end, windows)]
+        failed_reads = sum(1 for _, _, ok in reads if not ok)
+        write_latencies = [latency for latency, ok in writes if ok]
+        failed_writes = sum(1 for _, ok in writes if not ok)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'journal_mode={mode}'))
+        for label, latencies, seconds in (('reads during bursts', during, burst_time),
+                                          ('reads between bursts', outside, max(span - burst_time, 1e-9))):
+            if latencies:
+                self.stdout.write(
+                    f'  {label:21} {len(latencies) / seconds:8.1f} req/s  p50 {percentile(latencies, 0.5):7.2f}  '
+                    f'p99 {percentile(latencies, 0.99):7.2f}  max {max(latencies):8.2f} ms'
+                )
+            else:
+                self.stdout.write(f'  {label:21} none completed')
+        if write_latencies:
+            self.stdout.write(
+                f'  {"writes":21} {len(write_latencies) / burst_time:8.1f} req/s  '
+                f'p50 {percentile(write_latencies, 0.5):7.2f}  p99 {percentile(write_latencies, 0.99):7.2f}  '
+                f'max {max(write_latencies):8.2f} ms'
+            )
+        self.stdout.write(f'  failed reads {failed_reads}, failed writes {failed_writes}')
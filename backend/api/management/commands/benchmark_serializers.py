@@ -0,0 +1,87 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.fast_serializers import FastListMixin, compile_plan, serialize_rows
+from api.images import IMAGE_FIELDS
+from api.sampledata import seeded
+from api.urls import public_router
+
+
+def sample_manifest(name):
+    stem = name.rsplit('.', 1)[0]
+    return {
+        'source': name, 'width': 1200, 'height': 800, 'placeholder': 'data:image/jpeg;base64,AAAA',
+        'webp': {str(width): f'variants/{stem}.{width}w.webp' for width in (480, 960)},
+        'jpeg': {str(width): f'variants/{stem}.{width}w.jpg' for width in (480, 960)},
+    }
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare ModelSerializer and the .values() fast path for every public list endpoint: '
+        'median time per 100 rows, and a check that both render identical JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        renderer = JSONRenderer()
+        factory = APIRequestFactory(HTTP_HOST='localhost')
+        mismatches = []
+
+        with seeded(rows):
+            for prefix, viewset, basename in public_router.registry:
+                if not issubclass(viewset, FastListMixin):
+                    continue
+                request = Request(factory.get(f'/api/{prefix}/'))
+                view = viewset(request=request, format_kwarg=None, action='list', kwargs={}, args=())
+                queryset = view.get_queryset()
+                model = queryset.model
+                for field in IMAGE_FIELDS.get(model._meta.label, ()):
+                    # Give half the rows variant manifests so that path is exercised too.
+                    for pk, name in queryset.exclude(**{field: ''}).values_list('pk', field)[::2]:
+                        model.objects.filter(pk=pk).update(**{f'{field}_variants': sample_manifest(name)})
+
+                serializer_class = view.get_serializer_class()
+                columns, _ = compile_plan(serializer_class)
+
+                def slow():
+                    instances = list(queryset[:rows])
+                    return renderer.render(serializer_class(instances, many=True, context={'request': request}).data)
+
+                def fast():
+                    values = list(queryset.values(*columns)[:rows])
+                    return renderer.render(serialize_rows(serializer_class, values, request))
+
+                slow_time, slow_bytes = timed(slow, repeat)
+                fast_time, fast_bytes = timed(fast, repeat)
+                identical = slow_bytes == fast_bytes
+                if not identical:
+                    mismatches.append(basename)
+                per_100 = 100 / max(rows, 1) * 1000
+                self.stdout.write(
+                    f'{basename:15} serializer {slow_time * per_100:7.2f} ms  '
+                    f'values {fast_time * per_100:7.2f} ms  '
+                    f'x{slow_time / fast_time:4.1f}  {"identical" if identical else "DIFFERENT"}'
+                )
+
+        if mismatches:
+            raise CommandError(f'Fast path output differs for: {", ".join(mismatches)}')
+        self.stdout.write(self.style.SUCCESS('Fast path output is byte-identical for every endpoint'))
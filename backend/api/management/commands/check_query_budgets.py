@@ -0,0 +1,12 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Run api.tests.QueryBudgetTests: every GET endpoint must run a constant number of '
+        'queries within its QUERY_BUDGETS entry at page sizes 10 and 100'
+    )
+
+    def handle(self, *args, **options):
+        call_command('test', 'api.tests.QueryBudgetTests', verbosity=options['verbosity'])
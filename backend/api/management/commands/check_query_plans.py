@@ -0,0 +1,78 @@
+import re
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.urls import admin_router, public_router
+
+
+# Extra query strings worth planning per basename, on top of the bare list.
+QUERY_VARIANTS = {
+    'news': [{'category': 'tax'}],
+    'admin-enquiry': [{'status': 'new'}],
+    'admin-appointment': [{'status': 'pending'}],
+}
+
+FULL_SCAN_RE = re.compile(r'\bSCAN (?!.*\bUSING\b)(\S+)')
+TEMP_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+
+def explain(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def is_regression(plan):
+    """A full table scan whose rows then need a temporary B-tree to sort."""
+    return any(FULL_SCAN_RE.search(step) for step in plan) and any(TEMP_SORT in step for step in plan)
+
+
+def viewset_querysets():
+    """Yield (label, queryset) for the list and detail lookups of every routed viewset."""
+    factory = APIRequestFactory()
+    for router in (public_router, admin_router):
+        for prefix, viewset, basename in router.registry:
+            for params in [{}] + QUERY_VARIANTS.get(basename, []):
+                request = Request(factory.get('/', params))
+                request.user = AnonymousUser()
+                view = viewset(request=request, format_kwarg=None, action='list', kwargs={}, args=())
+                queryset = view.filter_queryset(view.get_queryset())
+                suffix = ''.join(f' {key}={value}' for key, value in params.items())
+                yield f'{basename}-list{suffix}', queryset[:10]
+
+                lookup_field = getattr(view, 'lookup_field', 'pk')
+                yield f'{basename}-detail{suffix}', queryset.filter(**{lookup_field: 1})
+
+
+class Command(BaseCommand):
+    help = (
+        'Capture EXPLAIN QUERY PLAN for every viewset queryset and fail if any '
+        'falls back to a full table scan plus a temporary B-tree sort'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--show-plans', action='store_true', help='Print every plan, not only failures')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Query plan checks target the SQLite backend')
+
+        failures = []
+        for label, queryset in viewset_querysets():
+            plan = explain(queryset)
+            failed = is_regression(plan)
+            if failed:
+                failures.append(label)
+            if failed or options['show_plans']:
+                self.stdout.write(f'{"FAIL" if failed else "ok"} {label}')
+                for step in plan:
+                    self.stdout.write(f'    {step}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} querysets scan and sort: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('No viewset queryset scans and sorts'))
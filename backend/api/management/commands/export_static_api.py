@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.urls import public_router
+
+MANIFEST = 'manifest.json'
+
+# Extra list filters to snapshot per basename: query parameter -> field whose distinct values to use.
+LIST_FILTERS = {
+    'news': {'category': 'category'},
+}
+
+# Related values a detail response embeds, beyond the object's own updated_at and image variants.
+DETAIL_DEPENDENCIES = {
+    'case-study': ('practice_area__updated_at',),
+}
+
+
+def fingerprint(values):
+    return hashlib.sha256(json.dumps(values, cls=DjangoJSONEncoder).encode()).hexdigest()
+
+
+class Snapshot:
+    def __init__(self, root, base_url, previous, full=False):
+        self.root = root
+        self.full = full
+        parts = urlsplit(base_url)
+        self.factory = APIRequestFactory(HTTP_HOST=parts.netloc)
+        self.secure = parts.scheme == 'https'
+        self.previous = previous
+        self.files = {}
+        self.written = self.unchanged = self.skipped = 0
+
+    def request(self, path, params=None):
+        return self.factory.get(path, params or {}, secure=self.secure)
+
+    def is_current(self, name, stamp):
+        entry = self.previous.get(name)
+        return not self.full and entry is not None and entry.get('fingerprint') == stamp and (self.root / name).exists()
+
+    def keep(self, name):
+        self.files[name] = self.previous[name]
+        self.skipped += 1
+
+    def write(self, name, url, data, stamp=None):
+        content = JSONRenderer().render(data)
+        digest = hashlib.sha256(content).hexdigest()
+        self.files[name] = {'url': url, 'sha256': digest, 'fingerprint': stamp}
+        path = self.root / name
+        if (self.previous.get(name) or {}).get('sha256') == digest and path.exists():
+            self.unchanged += 1
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(content)
+        os.replace(tmp, path)
+        self.written += 1
+
+    def lists(self, prefix, viewset, basename):
+        """Every page of the list, unfiltered and once per configured filter value."""
+        url = reverse(f'{basename}-list')
+        variants = [('', {})]
+        for param, field in LIST_FILTERS.get(basename, {}).items():
+            values = viewset.queryset.order_by().values_list(field, flat=True).distinct()
+            variants += [(f'{param}/{value}/', {param: value}) for value in sorted(values) if value]
+
+        list_view = viewset.as_view({'get': 'list'})
+        for directory, params in variants:
+            page = 1
+            while True:
+                query = dict(params, page=page) if page > 1 else params
+                response = list_view(self.request(url, query))
+                name = f'{prefix}/{directory}index.json' if page == 1 else f'{prefix}/{directory}page-{page}.json'
+                self.write(name, f'{url}?{urlencode(query)}' if query else url, response.data)
+                if not (isinstance(response.data, dict) and response.data.get('next')):
+                    break
+                page += 1
+
+    def details(self, prefix, viewset, basename):
+        if getattr(viewset, 'lookup_field', 'pk') != 'slug':
+            return
+        model = viewset.queryset.model
+        stamp_fields = ['updated_at'] + [
+            field.name for field in model._meta.fields if field.name.endswith('_variants')
+        ] + list(DETAIL_DEPENDENCIES.get(basename, ()))
+        stamps = {row[0]: fingerprint(row[1:]) for row in viewset.queryset.values_list('slug', *stamp_fields)}
+
+        view = viewset(request=None, format_kwarg=None, action='retrieve', kwargs={}, args=())
+        serializer_class = view.get_serializer_class()
+        stale = [slug for slug, stamp in stamps.items() if not self.is_current(f'{prefix}/{slug}.json', stamp)]
+        for slug in stamps.keys() - set(stale):
+            self.keep(f'{prefix}/{slug}.json')
+
+        for instance in viewset.queryset.filter(slug__in=stale).iterator(chunk_size=200):
+            # Serialized directly rather than through retrieve(), which counts a news view.
+            url = reverse(f'{basename}-detail', kwargs={'slug': instance.slug})
+            request = Request(self.request(url))
+            data = serializer_class(instance, context={'request': request}).data
+            self.write(f'{prefix}/{instance.slug}.json', url, data, stamps[instance.slug])
+
+
+class Command(BaseCommand):
+    help = (
+        'Render every public list and slug detail response to static JSON files plus a manifest, '
+        'for serving from a CDN. Unchanged details are skipped using updated_at.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output-dir', default=settings.STATIC_API_ROOT)
+        parser.add_argument('--base-url', default=settings.BACKEND_URL,
+                            help='Origin used for absolute media and pagination URLs')
+        parser.add_argument('--full', action='store_true', help='Re-render every detail file')
+
+    def handle(self, *args, **options):
+        root = Path(options['output_dir'])
+        manifest_path = root / MANIFEST
+        previous = {}
+        if manifest_path.exists():
+            previous = json.loads(manifest_path.read_text()).get('files', {})
+
+        snapshot = Snapshot(root, options['base_url'], previous, options['full'])
+        for prefix, viewset, basename in public_router.registry:
+            snapshot.lists(prefix, viewset, basename)
+            snapshot.details(prefix, viewset, basename)
+
+        removed = 0
+        for name in previous.keys() - snapshot.files.keys():
+            (root / name).unlink(missing_ok=True)
+            removed += 1
+
+        root.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'generated_at': timezone.now().isoformat(),
+            'base_url': options['base_url'],
+            'files': dict(sorted(snapshot.files.items())),
+        }
+        fd, tmp = tempfile.mkstemp(dir=root, prefix=f'.{MANIFEST}.')
+        with os.fdopen(fd, 'w') as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(tmp, manifest_path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{snapshot.written} written, {snapshot.unchanged} unchanged, '
+            f'{snapshot.skipped} skipped, {removed} removed in {root}'
+        ))
@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from api import images
+
+
+class Command(BaseCommand):
+    help = 'Render missing or stale responsive variants for every uploaded image'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Re-render variants that are already current')
+
+    def handle(self, *args, **options):
+        rendered = 0
+        for label, field_names in images.IMAGE_FIELDS.items():
+            model = apps.get_model(label)
+            for instance in model.objects.iterator():
+                for field_name in field_names:
+                    if not getattr(instance, field_name):
+                        continue
+                    if options['force']:
+                        setattr(instance, f'{field_name}_variants', {})
+                    try:
+                        if images.schedule_variants(instance, field_name, sync=True):
+                            rendered += 1
+                            self.stdout.write(f'{label} {instance.pk}: {getattr(instance, field_name).name}')
+                    except (OSError, ValueError) as exc:
+                        self.stderr.write(f'{label} {instance.pk}: {exc}')
+        self.stdout.write(self.style.SUCCESS(f'Rendered variants for {rendered} images'))
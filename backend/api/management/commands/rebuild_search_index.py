@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from api import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from published content'
+
+    def handle(self, *args, **options):
+        counts = search.rebuild()
+        for kind, count in counts.items():
+            self.stdout.write(f'{kind}: {count}')
+        self.stdout.write(self.style.SUCCESS(f'Indexed {sum(counts.values())} documents'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api import counters
+
+
+class Command(BaseCommand):
+    help = 'Recount dashboard counters from the source tables and repair any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Report drift without repairing it')
+
+    def handle(self, *args, **options):
+        drift = counters.reconcile(dry_run=options['check'])
+        for name, (stored, actual) in sorted(drift.items()):
+            self.stdout.write(f'{name}: stored {stored}, actual {actual}')
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('All counters match'))
+        elif options['check']:
+            raise CommandError(f'{len(drift)} counters have drifted')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Repaired {len(drift)} counters'))
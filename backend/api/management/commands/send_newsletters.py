@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api import newsletter
+from api.models import NewsletterCampaign
+
+
+class Command(BaseCommand):
+    help = (
+        'Send queued newsletter campaigns in batches over one email connection. '
+        'Safe to re-run after a crash: sending resumes from the undelivered recipients.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--campaign', type=int, help='Only send this campaign id')
+        parser.add_argument('--batch-size', type=int, default=settings.NEWSLETTER_BATCH_SIZE)
+        parser.add_argument('--rate', type=float, default=settings.NEWSLETTER_RATE_LIMIT,
+                            help='Messages per second, 0 for no limit')
+        parser.add_argument('--max-attempts', type=int, default=settings.NEWSLETTER_MAX_ATTEMPTS)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for queued campaigns')
+        parser.add_argument('--poll-interval', type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        limiter = newsletter.RateLimiter(options['rate'])
+        while True:
+            campaigns = newsletter.runnable_campaigns()
+            if options['campaign']:
+                campaigns = campaigns.filter(pk=options['campaign'])
+                if not campaigns.exists() and not options['loop']:
+                    raise CommandError(f'Campaign {options["campaign"]} is not queued')
+
+            for campaign in campaigns:
+                sent, failed = newsletter.send_campaign(
+                    campaign,
+                    batch_size=options['batch_size'],
+                    max_attempts=options['max_attempts'],
+                    limiter=limiter,
+                )
+                status = NewsletterCampaign.objects.values_list('status', flat=True).get(pk=campaign.pk)
+                self.stdout.write(f'Campaign {campaign.pk} "{campaign.subject}": {sent} sent, {failed} failed, now {status}')
+
+            if not options['loop']:
+                break
+            time.sleep(options['poll_interval'])
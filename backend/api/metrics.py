@@ -0,0 +1,154 @@
+import atexit
+import bisect
+import os
+import threading
+import time
+
+from django.conf import settings
+
+from .cache import get_cache
+
+WORKER_KEY = 'api:metrics:worker:{}'
+WORKERS_KEY = 'api:metrics:workers'
+PREFIX = 'mradvocates'
+
+
+class MetricsRegistry:
+    """
+    Per-route request counters and latency histograms for this worker.
+
+    Each worker publishes its cumulative totals to the shared cache every
+    ``publish_interval`` seconds; the metrics endpoint sums the snapshots of
+    every worker still publishing, so a scrape sees the whole site no matter
+    which worker answers it.
+    """
+
+    def __init__(self, buckets, publish_interval=15, ttl=3600):
+        self.buckets = tuple(sorted(buckets))
+        self.publish_interval = publish_interval
+        self.ttl = ttl
+        self._after_fork()
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._durations = {}
+        self._queries = {}
+        self._last_publish = 0.0
+
+    def observe(self, route, method, status, seconds, queries, query_seconds):
+        with self._lock:
+            key = (route, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+            histogram = self._durations.get((route, method))
+            if histogram is None:
+                histogram = self._durations[(route, method)] = [[0] * (len(self.buckets) + 1), 0.0]
+            histogram[0][bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram[1] += seconds
+
+            count, total = self._queries.get(route, (0, 0.0))
+            self._queries[route] = (count + queries, total + query_seconds)
+            due = time.monotonic() - self._last_publish >= self.publish_interval
+        if due:
+            self.publish()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'requests': dict(self._requests),
+                'durations': {key: [list(counts), total] for key, (counts, total) in self._durations.items()},
+                'queries': dict(self._queries),
+            }
+
+    def publish(self):
+        self._last_publish = time.monotonic()
+        cache = get_cache()
+        pid = os.getpid()
+        cache.set(WORKER_KEY.format(pid), (self.buckets, self.snapshot()), timeout=self.ttl)
+        workers = cache.get(WORKERS_KEY) or []
+        if pid not in workers:
+            cache.set(WORKERS_KEY, [w for w in workers if w != pid] + [pid], timeout=None)
+
+    def collect(self):
+        """Merged snapshots of every live worker, this one included."""
+        self.publish()
+        cache = get_cache()
+        workers = cache.get(WORKERS_KEY) or []
+        found = cache.get_many([WORKER_KEY.format(pid) for pid in workers])
+        live = [pid for pid in workers if WORKER_KEY.format(pid) in found]
+        if len(live) != len(workers):
+            cache.set(WORKERS_KEY, live, timeout=None)
+
+        merged = {'requests': {}, 'durations': {}, 'queries': {}}
+        for buckets, snapshot in found.values():
+            if buckets != self.buckets:
+                continue
+            for key, value in snapshot['requests'].items():
+                merged['requests'][key] = merged['requests'].get(key, 0) + value
+            for key, (counts, total) in snapshot['durations'].items():
+                into = merged['durations'].setdefault(key, [[0] * len(counts), 0.0])
+                into[0] = [a + b for a, b in zip(into[0], counts)]
+                into[1] += total
+            for key, (count, total) in snapshot['queries'].items():
+                before = merged['queries'].get(key, (0, 0.0))
+                merged['queries'][key] = (before[0] + count, before[1] + total)
+        return merged
+
+    def render(self):
+        """The merged metrics in the Prometheus text exposition format."""
+        data = self.collect()
+        lines = [
+            f'# HELP {PREFIX}_http_requests_total Requests handled, by route, method and status.',
+            f'# TYPE {PREFIX}_http_requests_total counter',
+        ]
+        for (route, method, status), value in sorted(data['requests'].items()):
+            lines.append(f'{PREFIX}_http_requests_total{{route="{_label(route)}",method="{method}",status="{status}"}} {value}')
+
+        name = f'{PREFIX}_http_request_duration_seconds'
+        lines += [f'# HELP {name} Request latency, by route and method.', f'# TYPE {name} histogram']
+        for (route, method), (counts, total) in sorted(data['durations'].items()):
+            labels = f'route="{_label(route)}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{labels}}} {total:.6f}')
+            lines.append(f'{name}_count{{{labels}}} {cumulative}')
+
+        lines += [
+            f'# HELP {PREFIX}_db_queries_total SQL queries run, by route.',
+            f'# TYPE {PREFIX}_db_queries_total counter',
+        ]
+        lines += [f'{PREFIX}_db_queries_total{{route="{_label(route)}"}} {count}'
+                  for route, (count, _) in sorted(data['queries'].items())]
+        lines += [
+            f'# HELP {PREFIX}_db_query_seconds_total Time spent in SQL, by route.',
+            f'# TYPE {PREFIX}_db_query_seconds_total counter',
+        ]
+        lines += [f'{PREFIX}_db_query_seconds_total{{route="{_label(route)}"}} {total:.6f}'
+                  for route, (_, total) in sorted(data['queries'].items())]
+        return '\n'.join(lines) + '\n'
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+registry = MetricsRegistry(
+    buckets=getattr(settings, 'PERF_HISTOGRAM_BUCKETS', (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)),
+    publish_interval=getattr(settings, 'PERF_METRICS_PUBLISH_INTERVAL', 15),
+)
+
+
+def _publish_at_exit():
+    try:
+        registry.publish()
+    except Exception:
+        pass
+
+
+atexit.register(_publish_at_exit)
+# A forked worker starts counting from zero under its own pid.
+os.register_at_fork(after_in_child=registry._after_fork)
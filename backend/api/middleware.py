@@ -0,0 +1,141 @@
+import contextvars
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import registry
+
+logger = logging.getLogger('api.performance')
+
+# Context variables follow a request into the threads the async ORM runs
+# queries on, where that thread's connections differ from the request's.
+_recorder = contextvars.ContextVar('api_query_recorder', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """Installed on every connection (see ``api.signals``); times queries while a request is recording."""
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+class QueryRecorder:
+    """Times every query of one request without enabling the debug cursor."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start, context['connection'].alias))
+
+    @property
+    def total(self):
+        return sum(duration for _, duration, _ in self.queries)
+
+
+class PerformanceMiddleware:
+    """
+    Time SQL, the view and response rendering for each request.
+
+    Adds a ``Server-Timing`` header, logs requests slower than
+    ``PERF_SLOW_REQUEST_MS`` (with their slowest queries) and every query
+    slower than ``PERF_SLOW_QUERY_MS``, and feeds the per-route metrics
+    served by ``api.views.metrics``.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'PERF_SERVER_TIMING', True)
+        self.slow_request = getattr(settings, 'PERF_SLOW_REQUEST_MS', 500) / 1000
+        self.slow_query = getattr(settings, 'PERF_SLOW_QUERY_MS', 100) / 1000
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # Coroutine hooks, or the async handler would run each one in a thread.
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder, token, start = self.begin(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.finish(request, response, recorder, start)
+
+    async def __acall__(self, request):
+        recorder, token, start = self.begin(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.finish(request, response, recorder, start)
+
+    def begin(self, request):
+        recorder = QueryRecorder()
+        request._perf = {'view_start': None, 'render_start': None}
+        return recorder, _recorder.set(recorder), time.perf_counter()
+
+    def finish(self, request, response, recorder, start):
+        end = time.perf_counter()
+        marks = request._perf
+        view_start = marks['view_start'] or start
+        render_start = marks['render_start'] or end
+        timings = {
+            'db': recorder.total,
+            'view': render_start - view_start,
+            'render': end - render_start,
+            'total': end - start,
+        }
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join(
+                f'{name};dur={seconds * 1000:.1f}' + (f';desc="{len(recorder.queries)} queries"' if name == 'db' else '')
+                for name, seconds in timings.items()
+            )
+
+        match = getattr(request, 'resolver_match', None)
+        route = (match.view_name or match.route) if match else 'unmatched'
+        registry.observe(route, request.method, response.status_code, timings['total'],
+                         len(recorder.queries), recorder.total)
+        self.log_slow(request, response, timings, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._perf['view_start'] = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # Runs just before a lazily rendered (DRF or template) response is rendered.
+        request._perf['render_start'] = time.perf_counter()
+        return response
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        request._perf['view_start'] = time.perf_counter()
+
+    async def aprocess_template_response(self, request, response):
+        request._perf['render_start'] = time.perf_counter()
+        return response
+
+    def log_slow(self, request, response, timings, recorder):
+        for sql, duration, alias in recorder.queries:
+            if duration >= self.slow_query:
+                logger.warning('Slow query %.1f ms on %s during %s %s: %s',
+                               duration * 1000, alias, request.method, request.path, sql)
+        if timings['total'] >= self.slow_request:
+            slowest = sorted(recorder.queries, key=lambda query: query[1], reverse=True)[:5]
+            logger.warning(
+                'Slow request %s %s -> %s in %.1f ms (db %.1f ms over %d queries, view %.1f ms, render %.1f ms)%s',
+                request.method, request.path, response.status_code, timings['total'] * 1000,
+                timings['db'] * 1000, len(recorder.queries), timings['view'] * 1000, timings['render'] * 1000,
+                ''.join(f'\n    {duration * 1000:.1f} ms: {sql}' for sql, duration, _ in slowest),
+            )
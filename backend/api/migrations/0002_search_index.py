@@ -0,0 +1,54 @@
+from django.db import migrations
+
+# The index as it was created here; api.search keeps it up to date afterwards.
+# Kept inline so later changes to api.search do not alter this migration.
+CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS api_searchindex USING fts5("
+    "kind UNINDEXED, object_id UNINDEXED, slug UNINDEXED, title, body, "
+    "tokenize = 'porter unicode61 remove_diacritics 2')"
+)
+DROP_SQL = "DROP TABLE IF EXISTS api_searchindex"
+
+# kind, table, visibility column, title column, body columns
+SOURCES = (
+    ('news', 'api_newsarticle', 'is_published', 'title', ('summary', 'content')),
+    ('case_study', 'api_casestudy', 'is_published', 'title', ('challenge', 'solution', 'outcome')),
+    ('faq', 'api_faq', 'is_published', 'question', ('answer',)),
+    ('service', 'api_service', 'is_active', 'title', ('description', 'full_content')),
+    ('practice_area', 'api_practicearea', 'is_active', 'title', ('description', 'full_content')),
+)
+
+
+def populate_sql(kind, table, visible, title, body, has_slug=True):
+    body_sql = " || char(10, 10) || ".join(f"COALESCE({column}, '')" for column in body)
+    slug = "slug" if has_slug else "''"
+    return (
+        f"INSERT INTO api_searchindex (kind, object_id, slug, title, body) "
+        f"SELECT '{kind}', id, {slug}, {title}, {body_sql} FROM {table} WHERE {visible}"
+    )
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(CREATE_SQL)
+    for kind, table, visible, title, body in SOURCES:
+        schema_editor.execute(populate_sql(kind, table, visible, title, body, has_slug=kind != 'faq'))
+    schema_editor.execute("INSERT INTO api_searchindex (api_searchindex) VALUES ('optimize')")
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1 on 2026-10-17 18:48
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# The counters as first defined in api.counters, copied so later changes
+# there do not alter this migration.
+# model -> (counter prefix, field broken down per value, filter for an "active" counter)
+TRACKED = {
+    'Enquiry': ('enquiries', 'status', None),
+    'Appointment': ('appointments', 'status', None),
+    'NewsletterSubscriber': ('subscribers', None, 'is_active'),
+    'NewsArticle': ('news', None, None),
+    'Testimonial': ('testimonials', None, None),
+    'CaseStudy': ('case_studies', None, None),
+}
+
+
+def populate_counters(apps, schema_editor):
+    counts = {}
+    for model_name, (prefix, breakdown, active) in TRACKED.items():
+        manager = apps.get_model('api', model_name)._default_manager
+        counts[f'{prefix}.total'] = manager.count()
+        if breakdown:
+            for value, _ in manager.model._meta.get_field(breakdown).choices:
+                counts[f'{prefix}.{breakdown}.{value}'] = 0
+            for row in manager.values(breakdown).annotate(n=Count('pk')).order_by():
+                counts[f'{prefix}.{breakdown}.{row[breakdown]}'] = row['n']
+        if active:
+            counts[f'{prefix}.active'] = manager.filter(**{active: True}).count()
+    StatCounter = apps.get_model('api', 'StatCounter')
+    StatCounter._default_manager.bulk_create(StatCounter(name=name, value=value) for name, value in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-17 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_statcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='casestudy',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newsarticle',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='seometadata',
+            name='og_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='client_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
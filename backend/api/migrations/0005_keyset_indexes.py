@@ -0,0 +1,35 @@
+# Generated by Django 5.1 on 2026-10-17 18:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_image_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-timestamp', '-id'], name='activitylog_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['-preferred_date', '-preferred_time', '-id'], name='appointment_slot_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(fields=['-created_at', '-id'], name='career_created_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['-created_at', '-id'], name='enquiry_created_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newslettersubscriber',
+            index=models.Index(fields=['-subscribed_at', '-id'], name='subscriber_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.1 on 2026-10-17 18:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['status', '-preferred_date', '-preferred_time', '-id'], name='appointment_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='career_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casestudy',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['order', '-created_at'], name='casestudy_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casestudy',
+            index=models.Index(fields=['order', '-created_at'], name='casestudy_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='enquiry_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['order', 'question'], name='faq_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(fields=['order', 'question'], name='faq_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date', '-created_at'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['category', '-published_date', '-created_at'], name='news_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['-published_date', '-created_at'], name='news_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='practicearea',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'title'], name='practicearea_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='practicearea',
+            index=models.Index(fields=['order', 'title'], name='practicearea_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'title'], name='service_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['order', 'title'], name='service_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', 'name'], name='teammember_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['order', 'name'], name='teammember_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['order', '-created_at'], name='testimonial_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['order', '-created_at'], name='testimonial_order_idx'),
+        ),
+    ]
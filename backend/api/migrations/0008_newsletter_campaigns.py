@@ -0,0 +1,65 @@
+# Generated by Django 5.1 on 2026-10-17 18:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_activitylog_timestamp_default'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsletterCampaign',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=300)),
+                ('body_text', models.TextField()),
+                ('body_html', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('queued', 'Queued'), ('sending', 'Sending'), ('paused', 'Paused'), ('sent', 'Sent')], default='draft', max_length=20)),
+                ('materialized_through', models.BigIntegerField(default=0, editable=False)),
+                ('recipients_materialized', models.BooleanField(default=False, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('queued_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='NewsletterDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='api.newslettercampaign')),
+                ('subscriber', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='api.newslettersubscriber')),
+            ],
+            options={
+                'verbose_name_plural': 'Newsletter deliveries',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='newslettercampaign',
+            index=models.Index(fields=['status', 'queued_at'], name='campaign_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsletterdelivery',
+            index=models.Index(fields=['campaign', 'status', 'id'], name='delivery_queue_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='newsletterdelivery',
+            constraint=models.UniqueConstraint(fields=('campaign', 'email'), name='delivery_campaign_email_uniq'),
+        ),
+    ]
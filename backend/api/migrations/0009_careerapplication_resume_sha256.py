@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-17 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_newsletter_campaigns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='careerapplication',
+            name='resume_sha256',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+    ]
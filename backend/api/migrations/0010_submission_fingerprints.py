@@ -0,0 +1,41 @@
+# Generated by Django 5.1 on 2026-10-17 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_careerapplication_resume_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='appointment',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='enquiry',
+            name='fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='enquiry',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['fingerprint', 'created_at'], name='appointment_fingerprint_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['fingerprint', 'created_at'], name='enquiry_fingerprint_idx'),
+        ),
+    ]
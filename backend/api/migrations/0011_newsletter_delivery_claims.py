@@ -0,0 +1,28 @@
+# Generated by Django 5.1 on 2026-10-17 19:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_submission_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsletterdelivery',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='newsletterdelivery',
+            name='claimed_by',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='newsletterdelivery',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed'), ('skipped', 'Skipped')], default='pending', max_length=20),
+        ),
+    ]
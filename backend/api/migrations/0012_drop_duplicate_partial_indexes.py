@@ -0,0 +1,41 @@
+# Generated by Django 5.1 on 2026-10-17 19:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_newsletter_delivery_claims'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='casestudy',
+            name='casestudy_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='faq',
+            name='faq_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='practicearea',
+            name='practicearea_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='service',
+            name='service_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='teammember',
+            name='teammember_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='testimonial',
+            name='testimonial_published_idx',
+        ),
+    ]
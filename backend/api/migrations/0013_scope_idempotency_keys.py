@@ -0,0 +1,31 @@
+# Generated by Django 5.1 on 2026-10-17 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_drop_duplicate_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AlterField(
+            model_name='enquiry',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['idempotency_key', 'created_at'], name='appointment_idempotency_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['idempotency_key', 'created_at'], name='enquiry_idempotency_idx'),
+        ),
+    ]
@@ -16,6 +16,9 @@ class PracticeArea(models.Model):
     
     class Meta:
         ordering = ['order', 'title']
+        indexes = [
+            models.Index(fields=['order', 'title'], name='practicearea_order_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -45,6 +48,7 @@ class TeamMember(models.Model):
     email = models.EmailField(blank=True)
     phone = models.CharField(max_length=20, blank=True)
     image = models.ImageField(upload_to='team/', blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     linkedin_url = models.URLField(blank=True)
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
@@ -53,6 +57,9 @@ class TeamMember(models.Model):
     
     class Meta:
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=['order', 'name'], name='teammember_order_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -82,6 +89,7 @@ class NewsArticle(models.Model):
     summary = models.TextField(max_length=500)
     content = models.TextField()
     image = models.ImageField(upload_to='news/', blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     is_published = models.BooleanField(default=False)
     published_date = models.DateTimeField(null=True, blank=True)
@@ -91,6 +99,10 @@ class NewsArticle(models.Model):
     
     class Meta:
         ordering = ['-published_date', '-created_at']
+        indexes = [
+            models.Index(fields=['category', '-published_date', '-created_at'], name='news_category_idx', condition=models.Q(is_published=True)),
+            models.Index(fields=['-published_date', '-created_at'], name='news_date_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -125,6 +137,9 @@ class Service(models.Model):
     
     class Meta:
         ordering = ['order', 'title']
+        indexes = [
+            models.Index(fields=['order', 'title'], name='service_order_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -144,6 +159,7 @@ class CaseStudy(models.Model):
     solution = models.TextField()
     outcome = models.TextField()
     image = models.ImageField(upload_to='cases/', blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     is_published = models.BooleanField(default=False)
     order = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -152,6 +168,9 @@ class CaseStudy(models.Model):
     class Meta:
         ordering = ['order', '-created_at']
         verbose_name_plural = 'Case Studies'
+        indexes = [
+            models.Index(fields=['order', '-created_at'], name='casestudy_order_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -166,6 +185,7 @@ class Testimonial(models.Model):
     client_name = models.CharField(max_length=200)
     client_designation = models.CharField(max_length=200, blank=True)
     client_image = models.ImageField(upload_to='testimonials/', blank=True, null=True)
+    client_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     content = models.TextField()
     rating = models.IntegerField(default=5, choices=[(i, i) for i in range(1, 6)])
     practice_area = models.ForeignKey(PracticeArea, on_delete=models.SET_NULL, null=True, blank=True)
@@ -176,6 +196,9 @@ class Testimonial(models.Model):
     
     class Meta:
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['order', '-created_at'], name='testimonial_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.client_name} - {self.rating}★"
@@ -194,6 +217,9 @@ class FAQ(models.Model):
         ordering = ['order', 'question']
         verbose_name = 'FAQ'
         verbose_name_plural = 'FAQs'
+        indexes = [
+            models.Index(fields=['order', 'question'], name='faq_order_idx'),
+        ]
     
     def __str__(self):
         return self.question[:100]
@@ -225,12 +251,20 @@ class Enquiry(models.Model):
     message = models.TextField()
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='new')
     notes = models.TextField(blank=True, help_text="Internal notes by admin")
+    fingerprint = models.CharField(max_length=64, blank=True, editable=False)
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True, editable=False)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Enquiries'
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='enquiry_created_keyset_idx'),
+            models.Index(fields=['status', '-created_at', '-id'], name='enquiry_status_idx'),
+            models.Index(fields=['fingerprint', 'created_at'], name='enquiry_fingerprint_idx'),
+            models.Index(fields=['idempotency_key', 'created_at'], name='enquiry_idempotency_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.subject}"
@@ -253,11 +287,19 @@ class Appointment(models.Model):
     message = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     notes = models.TextField(blank=True)
+    fingerprint = models.CharField(max_length=64, blank=True, editable=False)
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['-preferred_date', '-preferred_time']
+        indexes = [
+            models.Index(fields=['-preferred_date', '-preferred_time', '-id'], name='appointment_slot_keyset_idx'),
+            models.Index(fields=['status', '-preferred_date', '-preferred_time', '-id'], name='appointment_status_idx'),
+            models.Index(fields=['fingerprint', 'created_at'], name='appointment_fingerprint_idx'),
+            models.Index(fields=['idempotency_key', 'created_at'], name='appointment_idempotency_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.preferred_date} {self.preferred_time}"
@@ -269,6 +311,11 @@ class NewsletterSubscriber(models.Model):
     is_active = models.BooleanField(default=True)
     subscribed_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-subscribed_at', '-id'], name='subscriber_keyset_idx'),
+        ]
+    
     def __str__(self):
         return self.email
 
@@ -282,11 +329,16 @@ class CareerApplication(models.Model):
     education = models.TextField()
     cover_letter = models.TextField()
     resume = models.FileField(upload_to='resumes/')
+    resume_sha256 = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
     status = models.CharField(max_length=20, default='new')
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='career_created_keyset_idx'),
+            models.Index(fields=['status', '-created_at', '-id'], name='career_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.position}"
@@ -298,6 +350,7 @@ class SEOMetadata(models.Model):
     description = models.TextField(max_length=500)
     keywords = models.CharField(max_length=500, blank=True)
     og_image = models.ImageField(upload_to='seo/', blank=True, null=True)
+    og_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
@@ -314,11 +367,92 @@ class ActivityLog(models.Model):
     model_name = models.CharField(max_length=100)
     object_id = models.IntegerField(null=True, blank=True)
     details = models.TextField(blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp', '-id'], name='activitylog_keyset_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user} - {self.action} - {self.timestamp}"
+
+
+class StatCounter(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+
+class NewsletterCampaign(models.Model):
+    STATUS_CHOICES = [
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('sending', 'Sending'),
+        ('paused', 'Paused'),
+        ('sent', 'Sent'),
+    ]
+    
+    subject = models.CharField(max_length=300)
+    body_text = models.TextField()
+    body_html = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    # Highest subscriber id already copied into the delivery queue.
+    materialized_through = models.BigIntegerField(default=0, editable=False)
+    recipients_materialized = models.BooleanField(default=False, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    queued_at = models.DateTimeField(null=True, blank=True, editable=False)
+    completed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'queued_at'], name='campaign_status_idx'),
+        ]
+    
+    def __str__(self):
+        return self.subject
+
+
+class NewsletterDelivery(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+        ('skipped', 'Skipped'),
+    ]
+    
+    campaign = models.ForeignKey(NewsletterCampaign, on_delete=models.CASCADE, related_name='deliveries')
+    subscriber = models.ForeignKey(NewsletterSubscriber, on_delete=models.SET_NULL, null=True, blank=True)
+    email = models.EmailField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    # Set while a sending run holds the delivery (status 'sending').
+    claimed_by = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['id']
+        verbose_name_plural = 'Newsletter deliveries'
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'email'], name='delivery_campaign_email_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['campaign', 'status', 'id'], name='delivery_queue_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.campaign} - {self.email}"
@@ -0,0 +1,203 @@
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import NewsletterCampaign, NewsletterDelivery, NewsletterSubscriber
+
+logger = logging.getLogger(__name__)
+
+
+def materialize(campaign, chunk_size=1000):
+    """
+    Copy active subscribers into the campaign's delivery queue, ``chunk_size`` at a time.
+
+    Progress is kept in ``materialized_through`` so an interrupted run picks
+    up after the last copied subscriber; the unique (campaign, email)
+    constraint makes a repeated chunk harmless.
+    """
+    while not campaign.recipients_materialized:
+        chunk = list(
+            NewsletterSubscriber.objects
+            .filter(is_active=True, id__gt=campaign.materialized_through)
+            .order_by('id')
+            .values_list('id', 'email')[:chunk_size]
+        )
+        with transaction.atomic():
+            if chunk:
+                NewsletterDelivery.objects.bulk_create(
+                    [NewsletterDelivery(campaign=campaign, subscriber_id=pk, email=email) for pk, email in chunk],
+                    ignore_conflicts=True,
+                )
+                campaign.materialized_through = chunk[-1][0]
+            else:
+                campaign.recipients_materialized = True
+            NewsletterCampaign.objects.filter(pk=campaign.pk).update(
+                materialized_through=campaign.materialized_through,
+                recipients_materialized=campaign.recipients_materialized,
+            )
+
+
+def build_message(campaign, email, connection):
+    message = EmailMultiAlternatives(
+        subject=campaign.subject,
+        body=campaign.body_text,
+        from_email=settings.NEWSLETTER_FROM_EMAIL,
+        to=[email],
+        connection=connection,
+    )
+    if campaign.body_html:
+        message.attach_alternative(campaign.body_html, 'text/html')
+    return message
+
+
+class RateLimiter:
+    """Sleep just enough to keep to ``rate`` calls per second; 0 disables the limit."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.next_at = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if now < self.next_at:
+            time.sleep(self.next_at - now)
+        self.next_at = max(now, self.next_at) + self.interval
+
+
+def is_paused(campaign):
+    return NewsletterCampaign.objects.filter(pk=campaign.pk, status='paused').exists()
+
+
+def release_stale_claims(campaign, timeout):
+    """Return deliveries claimed more than ``timeout`` seconds ago, by a run that died, to the queue."""
+    return NewsletterDelivery.objects.filter(
+        campaign=campaign, status='sending', claimed_at__lt=timezone.now() - timedelta(seconds=timeout),
+    ).update(status='pending', claimed_by='', claimed_at=None)
+
+
+def claim(campaign, after_id, batch_size, token):
+    """
+    Claim the next ``batch_size`` pending deliveries after ``after_id`` for this run.
+
+    The conditional UPDATE only takes rows that are still pending, so of two
+    overlapping runs each delivery goes to exactly one. Returns the last id
+    looked at (None when the queue is empty) and the claimed rows as
+    (id, email, attempts, subscribed).
+    """
+    candidates = list(
+        NewsletterDelivery.objects
+        .filter(campaign=campaign, status='pending', id__gt=after_id)
+        .order_by('id')
+        .values_list('id', flat=True)[:batch_size]
+    )
+    if not candidates:
+        return None, []
+    NewsletterDelivery.objects.filter(pk__in=candidates, status='pending').update(
+        status='sending', claimed_by=token, claimed_at=timezone.now()
+    )
+    claimed = list(
+        NewsletterDelivery.objects
+        .filter(pk__in=candidates, status='sending', claimed_by=token)
+        .order_by('id')
+        .values_list('id', 'email', 'attempts', 'subscriber__is_active')
+    )
+    return candidates[-1], claimed
+
+
+def send_campaign(campaign, batch_size=100, rate=0, max_attempts=3, connection=None, limiter=None,
+                  claim_timeout=None):
+    """
+    Send every pending delivery of ``campaign`` over one email connection.
+
+    Deliveries are claimed in id order ``batch_size`` at a time, so runs
+    that overlap (cron next to ``--loop``, or a run outlasting its interval)
+    never send the same one twice. Outcomes are written after each batch; a
+    batch claimed by a run that crashed is released after ``claim_timeout``
+    seconds and sent again. Recipients who unsubscribed after the queue was
+    built are skipped. Failures stay pending until ``max_attempts`` is
+    reached. Returns (sent, failed) for this run.
+    """
+    if claim_timeout is None:
+        claim_timeout = getattr(settings, 'NEWSLETTER_CLAIM_TIMEOUT', 15 * 60)
+    NewsletterCampaign.objects.filter(pk=campaign.pk, status='queued').update(status='sending')
+    materialize(campaign)
+    release_stale_claims(campaign, claim_timeout)
+
+    connection = connection or get_connection()
+    limiter = limiter or RateLimiter(rate)
+    token = uuid.uuid4().hex
+    sent_total = failed_total = 0
+    last_id = 0
+    with connection:
+        while not is_paused(campaign):
+            last_id, batch = claim(campaign, last_id, batch_size, token)
+            if last_id is None:
+                break
+
+            sent, failed, skipped = [], {}, []
+            for pk, email, attempts, subscribed in batch:
+                if not subscribed:
+                    skipped.append(pk)
+                    continue
+                limiter.wait()
+                try:
+                    connection.send_messages([build_message(campaign, email, connection)])
+                except Exception as exc:
+                    logger.warning('Newsletter %s to %s failed: %s', campaign.pk, email, exc)
+                    failed[pk] = (attempts + 1, str(exc))
+                else:
+                    sent.append(pk)
+
+            now = timezone.now()
+            released = {'claimed_by': '', 'claimed_at': None}
+            with transaction.atomic():
+                NewsletterDelivery.objects.filter(pk__in=sent).update(
+                    status='sent', sent_at=now, attempts=F('attempts') + 1, **released
+                )
+                NewsletterDelivery.objects.filter(pk__in=skipped).update(status='skipped', **released)
+                for pk, (attempts, error) in failed.items():
+                    NewsletterDelivery.objects.filter(pk=pk).update(
+                        attempts=attempts,
+                        error=error,
+                        status='failed' if attempts >= max_attempts else 'pending',
+                        **released,
+                    )
+            sent_total += len(sent)
+            failed_total += len(failed)
+
+    finish_if_done(campaign)
+    return sent_total, failed_total
+
+
+def finish_if_done(campaign):
+    if not campaign.recipients_materialized:
+        return False
+    if NewsletterDelivery.objects.filter(campaign=campaign, status__in=['pending', 'sending']).exists():
+        return False
+    return bool(NewsletterCampaign.objects.filter(pk=campaign.pk, status='sending').update(
+        status='sent', completed_at=timezone.now()
+    ))
+
+
+def runnable_campaigns():
+    return NewsletterCampaign.objects.filter(status__in=['queued', 'sending']).order_by('queued_at', 'id')
+
+
+def progress(queryset):
+    """Annotate campaigns with their delivery counts by status."""
+    return queryset.annotate(
+        recipients=Count('deliveries'),
+        sent_count=Count('deliveries', filter=Q(deliveries__status='sent')),
+        failed_count=Count('deliveries', filter=Q(deliveries__status='failed')),
+        pending_count=Count('deliveries', filter=Q(deliveries__status__in=['pending', 'sending'])),
+        skipped_count=Count('deliveries', filter=Q(deliveries__status='skipped')),
+    )
@@ -0,0 +1,164 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import InvalidPage
+from django.db import connections
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    async def apaginate_queryset(self, queryset, request):
+        """``paginate_queryset`` through the async ORM: the same page, links and errors."""
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        self.page.object_list = [row async for row in self.page.object_list]
+        return self.page.object_list
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the full ordering key instead of OFFSET.
+
+    The key is the view's ``keyset_ordering`` (or the model's
+    ``Meta.ordering``) plus ``id`` as a tiebreaker, compared as one SQL row
+    value so a composite index on the same columns serves every page. All
+    ordering fields must sort in the same direction.
+    """
+    cursor_query_param = 'cursor'
+    page_size = StandardResultsSetPagination.page_size
+    page_size_query_param = StandardResultsSetPagination.page_size_query_param
+    max_page_size = StandardResultsSetPagination.max_page_size
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_keyset(self, queryset, view):
+        ordering = list(getattr(view, 'keyset_ordering', None) or queryset.model._meta.ordering)
+        if not ordering:
+            raise ImproperlyConfigured(f'{queryset.model.__name__} needs an ordering for keyset pagination')
+        directions = {field.startswith('-') for field in ordering}
+        if len(directions) > 1:
+            raise ImproperlyConfigured('Keyset pagination needs every ordering field in the same direction')
+        fields = [field.lstrip('-') for field in ordering]
+        if 'id' not in fields and 'pk' not in fields:
+            fields.append('id')
+        return fields, directions.pop()
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return list(cursor['v']), bool(cursor.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        values = [_encode_value(getattr(obj, field)) for field in self.fields]
+        cursor = json.dumps({'v': values, 'r': int(reverse)}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(cursor.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def seek(self, queryset, values, forward):
+        model = queryset.model
+        connection = connections[queryset.db]
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        model_fields = [model._meta.get_field(field) for field in self.fields]
+        if len(values) != len(model_fields):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            params = [
+                field.get_db_prep_value(field.to_python(value), connection)
+                for field, value in zip(model_fields, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        columns = ', '.join(f'{table}.{quote(field.column)}' for field in model_fields)
+        placeholders = ', '.join(['%s'] * len(params))
+        operator = '<' if self.descending == forward else '>'
+        return queryset.extra(where=[f'({columns}) {operator} ({placeholders})'], params=params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields, self.descending = self.get_keyset(queryset, view)
+        values, reverse = self.decode_cursor(request)
+
+        prefix = '-' if self.descending != reverse else ''
+        queryset = queryset.order_by(*(prefix + field for field in self.fields))
+        if values is not None:
+            queryset = self.seek(queryset, values, forward=not reverse)
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_url = self.previous_url = None
+        if rows:
+            if has_more or reverse:
+                self.next_url = self.encode_cursor(rows[-1], reverse=False)
+            if values is not None and (has_more or not reverse):
+                self.previous_url = self.encode_cursor(rows[0], reverse=True)
+        elif values is not None:
+            self.previous_url = remove_query_param(self.base_url, self.cursor_query_param)
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.next_url,
+            'previous': self.previous_url,
+            'results': data,
+        })
+
+
+class OptionalKeysetPagination(StandardResultsSetPagination):
+    """Page numbers by default; ``?pagination=cursor`` or a ``cursor`` switches to keysets."""
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        params = request.query_params
+        if params.get('pagination') == 'cursor' or KeysetPagination.cursor_query_param in params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
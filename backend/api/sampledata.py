@@ -0,0 +1,190 @@
+import contextlib
+import datetime
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.db import connection, connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from . import counters, search
+from .cache import bump_model_version
+from .models import *
+
+# Keeps benchmark and query-count runs away from the shared file cache.
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(scale, prefix='sample'):
+    """
+    Bulk-insert ``scale`` rows of every content and submission model.
+
+    ``bulk_create`` skips ``save()`` and the model signals, so slugs are set
+    here and derived state (search index, counters, version stamps) is
+    rebuilt afterwards. Every fourth row with a nullable foreign key has it
+    null, as after its target is deleted, so that output is exercised too.
+    Returns the staff user that owns the generated rows.
+    """
+    now = timezone.now()
+    admin = User.objects.create_user(
+        f'{prefix}-admin', f'{prefix}-admin@example.com', 'sample-password',
+        first_name='Sample', last_name='Admin', is_staff=True,
+    )
+
+    practice_areas = PracticeArea.objects.bulk_create(
+        PracticeArea(title=f'{prefix} practice area {i}', slug=f'{prefix}-practice-area-{i}',
+                     description='Practice area description', full_content='Full content', order=i)
+        for i in range(scale)
+    )
+    TeamMember.objects.bulk_create(
+        TeamMember(name=f'{prefix} member {i}', slug=f'{prefix}-member-{i}', role='associate',
+                   specialization='Civil litigation', bio='Biography', image=f'team/{prefix}-{i}.png', order=i)
+        for i in range(scale)
+    )
+    NewsArticle.objects.bulk_create(
+        NewsArticle(title=f'{prefix} article {i}', slug=f'{prefix}-article-{i}', category='general',
+                    summary='Article summary', content='Article content about taxation and property law',
+                    image=f'news/{prefix}-{i}.png', author=None if i % 4 == 1 else admin, is_published=True,
+                    published_date=now - datetime.timedelta(hours=i))
+        for i in range(scale)
+    )
+    Service.objects.bulk_create(
+        Service(title=f'{prefix} service {i}', slug=f'{prefix}-service-{i}', category='advisory',
+                description='Service description', order=i)
+        for i in range(scale)
+    )
+    CaseStudy.objects.bulk_create(
+        CaseStudy(title=f'{prefix} case study {i}', slug=f'{prefix}-case-study-{i}',
+                  practice_area=None if i % 4 == 1 else practice_areas[i % len(practice_areas)],
+                  challenge='Challenge', solution='Solution', outcome='Outcome', image=f'cases/{prefix}-{i}.png',
+                  is_published=True, order=i)
+        for i in range(scale)
+    )
+    Testimonial.objects.bulk_create(
+        Testimonial(client_name=f'{prefix} client {i}', content='Testimonial content',
+                    client_image=f'testimonials/{prefix}-{i}.png',
+                    practice_area=None if i % 4 == 1 else practice_areas[i % len(practice_areas)],
+                    is_featured=i % 2 == 0, order=i)
+        for i in range(scale)
+    )
+    FAQ.objects.bulk_create(
+        FAQ(question=f'{prefix} question {i} about taxation?', answer='Answer', order=i)
+        for i in range(scale)
+    )
+    Enquiry.objects.bulk_create(
+        Enquiry(name=f'{prefix} enquirer {i}', email=f'{prefix}{i}@example.com', phone='9999999999',
+                matter_type='civil', subject='Subject', message='Message',
+                created_at=now - datetime.timedelta(minutes=i))
+        for i in range(scale)
+    )
+    Appointment.objects.bulk_create(
+        Appointment(name=f'{prefix} client {i}', email=f'{prefix}{i}@example.com', phone='9999999999',
+                    matter_type='civil', preferred_date=now.date() + datetime.timedelta(days=i % 30),
+                    preferred_time=datetime.time(10 + i % 8, 0))
+        for i in range(scale)
+    )
+    NewsletterSubscriber.objects.bulk_create(
+        NewsletterSubscriber(email=f'{prefix}-subscriber-{i}@example.com') for i in range(scale)
+    )
+    NewsletterCampaign.objects.bulk_create(
+        NewsletterCampaign(subject=f'{prefix} newsletter {i}', body_text='Newsletter body', created_by=admin)
+        for i in range(scale)
+    )
+    CareerApplication.objects.bulk_create(
+        CareerApplication(name=f'{prefix} applicant {i}', email=f'{prefix}{i}@example.com',
+                          phone='9999999999', position='Associate', experience_years=i % 10,
+                          education='LLB', cover_letter='Cover letter', resume=f'resumes/{prefix}-{i}.pdf')
+        for i in range(scale)
+    )
+    SEOMetadata.objects.bulk_create(
+        SEOMetadata(page_name=f'{prefix}-page-{i}', title='Title', description='Description',
+                    og_image=f'seo/{prefix}-{i}.png')
+        for i in range(scale)
+    )
+    ActivityLog.objects.bulk_create(
+        ActivityLog(user=admin, action='Created', model_name='NewsArticle', object_id=i)
+        for i in range(scale)
+    )
+
+    search.rebuild()
+    counters.reconcile()
+    bump_versions()
+    return admin
+
+
+def bump_versions():
+    from .signals import VERSIONED_MODELS
+    for model in VERSIONED_MODELS:
+        bump_model_version(model)
+
+
+@contextlib.contextmanager
+def seeded(scale, prefix='sample'):
+    """Seed inside a transaction that is always rolled back on exit."""
+    try:
+        with transaction.atomic():
+            yield seed(scale, prefix)
+            raise Rollback
+    except Rollback:
+        pass
+    # Anything cached against the seeded rows is stale once they are rolled back.
+    bump_versions()
+
+
+@contextlib.contextmanager
+def temporary_database(scale, prefix='sample'):
+    """
+    Make a freshly migrated and seeded test database the default until exit.
+
+    Unlike ``seeded`` the rows are committed, so connections opened by other
+    threads see them too. SQLite databases live in a temporary file rather
+    than in memory.
+    """
+    from django.test.utils import setup_databases, teardown_databases
+
+    # Test mirrors (the read replica) are repointed at the test database too.
+    original_settings = {alias: connections[alias].settings_dict for alias in connections}
+    with tempfile.TemporaryDirectory() as directory:
+        test_settings = connection.settings_dict['TEST']
+        original_name = test_settings['NAME']
+        if connection.vendor == 'sqlite':
+            test_settings['NAME'] = str(Path(directory) / 'db.sqlite3')
+        try:
+            old_config = setup_databases(verbosity=0, interactive=False, aliases={connection.alias},
+                                         serialized_aliases=set())
+            try:
+                with transaction.atomic():
+                    admin = seed(scale, prefix)
+                yield admin
+            finally:
+                connections.close_all()
+                teardown_databases(old_config, verbosity=0)
+        finally:
+            test_settings['NAME'] = original_name
+            for alias, settings_dict in original_settings.items():
+                connections[alias].settings_dict = settings_dict
+    bump_versions()
+
+
+def endpoints(page_size):
+    """Yield (name, url) for every GET endpoint, seeded with ``page_size`` rows."""
+    from .urls import admin_router, public_router
+
+    for router in (public_router, admin_router):
+        for prefix, viewset, basename in router.registry:
+            yield f'{basename}-list', f'{reverse(f"{basename}-list")}?page_size={page_size}'
+            lookup_field = getattr(viewset, 'lookup_field', 'pk')
+            obj = viewset.queryset.order_by('-pk').first()
+            lookup = getattr(obj, lookup_field)
+            yield f'{basename}-detail', reverse(f'{basename}-detail', kwargs={lookup_field: lookup})
+    yield 'get-seo', reverse('get-seo', kwargs={'page_name': 'sample-page-0'})
+    yield 'seo-bulk', reverse('seo-bulk')
+    yield 'home', reverse('home')
+    yield 'search', f'{reverse("search")}?q=taxation&page_size={page_size}'
+    yield 'appointment-availability', reverse('appointment-availability')
+    yield 'dashboard-stats', reverse('dashboard-stats')
@@ -0,0 +1,140 @@
+import re
+
+from django.apps import apps
+from django.db import connection, transaction
+
+
+TABLE = 'api_searchindex'
+
+# kind -> (model label, visibility filter, title field, body fields)
+SOURCES = {
+    'news': ('api.NewsArticle', {'is_published': True}, 'title', ('summary', 'content')),
+    'case_study': ('api.CaseStudy', {'is_published': True}, 'title', ('challenge', 'solution', 'outcome')),
+    'faq': ('api.FAQ', {'is_published': True}, 'question', ('answer',)),
+    'service': ('api.Service', {'is_active': True}, 'title', ('description', 'full_content')),
+    'practice_area': ('api.PracticeArea', {'is_active': True}, 'title', ('description', 'full_content')),
+}
+
+CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+    "kind UNINDEXED, object_id UNINDEXED, slug UNINDEXED, title, body, "
+    "tokenize = 'porter unicode61 remove_diacritics 2')"
+)
+DROP_SQL = f"DROP TABLE IF EXISTS {TABLE}"
+
+# Column weights for bm25(): kind, object_id, slug, title, body
+RANK = f"bm25({TABLE}, 0.0, 0.0, 0.0, 10.0, 1.0)"
+
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def kind_for_model(model):
+    label = model._meta.label
+    for kind, source in SOURCES.items():
+        if source[0] == label:
+            return kind
+    return None
+
+
+def _row(kind, obj):
+    _, _, title_field, body_fields = SOURCES[kind]
+    body = '\n\n'.join(getattr(obj, field) or '' for field in body_fields)
+    return (kind, obj.pk, getattr(obj, 'slug', ''), getattr(obj, title_field), body)
+
+
+def _is_visible(kind, obj):
+    return all(getattr(obj, field) == value for field, value in SOURCES[kind][1].items())
+
+
+def index_instance(instance):
+    kind = kind_for_model(type(instance))
+    if kind is None:
+        return
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s", [kind, instance.pk])
+        if _is_visible(kind, instance):
+            cursor.execute(
+                f"INSERT INTO {TABLE} (kind, object_id, slug, title, body) VALUES (%s, %s, %s, %s, %s)",
+                _row(kind, instance),
+            )
+
+
+def remove_instance(instance):
+    kind = kind_for_model(type(instance))
+    if kind is None:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s", [kind, instance.pk])
+
+
+def rebuild(get_model=apps.get_model, conn=None):
+    """Repopulate the whole index; ``get_model`` lets migrations pass historical models."""
+    conn = conn or connection
+    counts = {}
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE}")
+        for kind, (label, visible, _, _) in SOURCES.items():
+            model = get_model(*label.split('.'))
+            rows = [_row(kind, obj) for obj in model._default_manager.filter(**visible).iterator()]
+            cursor.executemany(
+                f"INSERT INTO {TABLE} (kind, object_id, slug, title, body) VALUES (%s, %s, %s, %s, %s)",
+                rows,
+            )
+            counts[kind] = len(rows)
+        cursor.execute(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')")
+    return counts
+
+
+def build_match(query):
+    """Turn free text into an FTS5 expression: every term must match, as a prefix."""
+    terms = TERM_RE.findall(query or '')
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _where(match, kinds):
+    sql = f"{TABLE} MATCH %s"
+    params = [match]
+    if kinds:
+        sql += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    return sql, params
+
+
+def search(query, kinds=None, limit=20, offset=0):
+    match = build_match(query)
+    if not match:
+        return 0, []
+    where, params = _where(match, kinds)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {TABLE} WHERE {where}", params)
+        count = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT kind, object_id, slug, "
+            f"highlight({TABLE}, 3, '<mark>', '</mark>'), "
+            f"snippet({TABLE}, 4, '<mark>', '</mark>', '…', 24), {RANK} AS rank "
+            f"FROM {TABLE} WHERE {where} ORDER BY rank LIMIT %s OFFSET %s",
+            params + [limit, offset],
+        )
+        rows = cursor.fetchall()
+    results = [
+        {
+            'type': kind,
+            'id': int(object_id),
+            'slug': slug or None,
+            'title': title,
+            'snippet': snippet,
+            'score': round(-rank, 6),
+        }
+        for kind, object_id, slug, title, snippet, rank in rows
+    ]
+    return count, results
+
+
+def matching_ids(kind, query):
+    match = build_match(query)
+    if not match:
+        return []
+    where, params = _where(match, [kind])
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT object_id FROM {TABLE} WHERE {where}", params)
+        return [int(row[0]) for row in cursor.fetchall()]
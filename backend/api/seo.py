@@ -0,0 +1,56 @@
+import hashlib
+import json
+import threading
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .cache import get_model_version
+from .models import SEOMetadata
+from .serializers import SEOMetadataSerializer
+
+
+class SEOMap:
+    """
+    Every SEOMetadata row, serialized once and held in process memory.
+
+    The map is rebuilt when the SEOMetadata version stamp moves (any admin
+    write bumps it) or when it is requested for a different site root, since
+    image URLs are absolute. Because the map holds every page, a page that is
+    not in it is a known miss and costs no query either.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._pages = {}
+        self._etag = None
+
+    def _current(self, request):
+        key = (get_model_version(SEOMetadata), request.build_absolute_uri('/'))
+        if key != self._key:
+            with self._lock:
+                if key != self._key:
+                    rows = SEOMetadata.objects.order_by('page_name')
+                    data = SEOMetadataSerializer(rows, many=True, context={'request': request}).data
+                    pages = {row['page_name']: row for row in data}
+                    encoded = json.dumps(pages, cls=DjangoJSONEncoder, sort_keys=True).encode()
+                    self._pages, self._etag, self._key = pages, hashlib.sha256(encoded).hexdigest(), key
+        return self._pages, self._etag
+
+    def get(self, request, page_name):
+        pages, _ = self._current(request)
+        return pages.get(page_name)
+
+    def select(self, request, page_names=None):
+        """Return (pages, missing, strong etag) for ``page_names``, or for every page."""
+        pages, etag = self._current(request)
+        if page_names is None:
+            return pages, [], f'"{etag}"'
+        names = sorted(set(page_names))
+        selected = {name: pages[name] for name in names if name in pages}
+        missing = [name for name in names if name not in pages]
+        digest = hashlib.sha256(f'{etag}:{",".join(names)}'.encode()).hexdigest()
+        return selected, missing, f'"{digest}"'
+
+
+seo_map = SEOMap()
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import *
+from .images import variants_representation
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -17,6 +18,7 @@ class PracticeAreaSerializer(serializers.ModelSerializer):
 
 class TeamMemberSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = TeamMember
@@ -28,15 +30,19 @@ class TeamMemberSerializer(serializers.ModelSerializer):
             if request:
                 return request.build_absolute_uri(obj.image.url)
         return None
+    
+    def get_image_variants(self, obj):
+        return variants_representation(obj.image_variants, self.context.get('request'))
 
 
 class NewsArticleListSerializer(serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.get_full_name', read_only=True)
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = NewsArticle
-        fields = ['id', 'title', 'slug', 'category', 'summary', 'image_url', 
+        fields = ['id', 'title', 'slug', 'category', 'summary', 'image_url', 'image_variants',
                   'author_name', 'published_date', 'views', 'is_published']
     
     def get_image_url(self, obj):
@@ -45,11 +51,15 @@ class NewsArticleListSerializer(serializers.ModelSerializer):
             if request:
                 return request.build_absolute_uri(obj.image.url)
         return None
+    
+    def get_image_variants(self, obj):
+        return variants_representation(obj.image_variants, self.context.get('request'))
 
 
 class NewsArticleDetailSerializer(serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.get_full_name', read_only=True)
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = NewsArticle
@@ -61,6 +71,9 @@ class NewsArticleDetailSerializer(serializers.ModelSerializer):
             if request:
                 return request.build_absolute_uri(obj.image.url)
         return None
+    
+    def get_image_variants(self, obj):
+        return variants_representation(obj.image_variants, self.context.get('request'))
 
 
 class ServiceSerializer(serializers.ModelSerializer):
@@ -72,6 +85,7 @@ class ServiceSerializer(serializers.ModelSerializer):
 class CaseStudySerializer(serializers.ModelSerializer):
     practice_area_name = serializers.CharField(source='practice_area.title', read_only=True, required=False, allow_blank=True)
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = CaseStudy
@@ -88,6 +102,9 @@ class CaseStudySerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.image.url)
         return None
     
+    def get_image_variants(self, obj):
+        return variants_representation(obj.image_variants, self.context.get('request'))
+    
     def create(self, validated_data):
         # Handle empty practice_area
         practice_area = validated_data.pop('practice_area', None)
@@ -106,10 +123,11 @@ class CaseStudySerializer(serializers.ModelSerializer):
 class TestimonialSerializer(serializers.ModelSerializer):
     practice_area_name = serializers.CharField(source='practice_area.title', read_only=True, required=False, allow_blank=True)
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = Testimonial
-        fields = '__all__'
+        exclude = ['client_image_variants']
         extra_kwargs = {
             'practice_area': {'required': False, 'allow_null': True},
             'client_designation': {'required': False, 'allow_blank': True},
@@ -123,6 +141,9 @@ class TestimonialSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.client_image.url)
         return None
     
+    def get_image_variants(self, obj):
+        return variants_representation(obj.client_image_variants, self.context.get('request'))
+    
     def create(self, validated_data):
         # Handle empty practice_area
         practice_area = validated_data.pop('practice_area', None)
@@ -147,14 +168,16 @@ class FAQSerializer(serializers.ModelSerializer):
 class EnquirySerializer(serializers.ModelSerializer):
     class Meta:
         model = Enquiry
-        fields = '__all__'
+        # Duplicate-detection bookkeeping, not part of the record.
+        exclude = ['fingerprint', 'idempotency_key']
         read_only_fields = ['created_at', 'updated_at']
 
 
 class AppointmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Appointment
-        fields = '__all__'
+        # Duplicate-detection bookkeeping, not part of the record.
+        exclude = ['fingerprint', 'idempotency_key']
         read_only_fields = ['created_at', 'updated_at']
 
 
@@ -164,6 +187,19 @@ class NewsletterSubscriberSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class NewsletterCampaignSerializer(serializers.ModelSerializer):
+    recipients = serializers.IntegerField(read_only=True)
+    sent_count = serializers.IntegerField(read_only=True)
+    failed_count = serializers.IntegerField(read_only=True)
+    pending_count = serializers.IntegerField(read_only=True)
+    skipped_count = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = NewsletterCampaign
+        fields = '__all__'
+        read_only_fields = ['status', 'created_by', 'created_at', 'updated_at']
+
+
 class CareerApplicationSerializer(serializers.ModelSerializer):
     resume_url = serializers.SerializerMethodField()
     
@@ -181,6 +217,7 @@ class CareerApplicationSerializer(serializers.ModelSerializer):
 
 class SEOMetadataSerializer(serializers.ModelSerializer):
     og_image_url = serializers.SerializerMethodField()
+    og_image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = SEOMetadata
@@ -192,6 +229,9 @@ class SEOMetadataSerializer(serializers.ModelSerializer):
             if request:
                 return request.build_absolute_uri(obj.og_image.url)
         return None
+    
+    def get_og_image_variants(self, obj):
+        return variants_representation(obj.og_image_variants, self.context.get('request'))
 
 
 class ActivityLogSerializer(serializers.ModelSerializer):
@@ -202,14 +242,35 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class BulkStatusUpdateSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False,
+                                allow_empty=False, max_length=5000)
+    filter = serializers.DictField(required=False, allow_empty=False)
+    status = serializers.ChoiceField(choices=[])
+    notes = serializers.CharField(required=False, allow_blank=True)
+    
+    def __init__(self, *args, status_choices=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['status'].choices = status_choices
+    
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('filter' in attrs):
+            raise serializers.ValidationError('Provide either ids or filter.')
+        return attrs
+
+
 class DashboardStatsSerializer(serializers.Serializer):
-    total_enquiries = serializers.IntegerField()
-    new_enquiries = serializers.IntegerField()
-    total_appointments = serializers.IntegerField()
-    pending_appointments = serializers.IntegerField()
-    total_subscribers = serializers.IntegerField()
-    total_news = serializers.IntegerField()
-    total_testimonials = serializers.IntegerField()
-    total_case_studies = serializers.IntegerField()
+    # Fields are optional so ?since= responses can carry only what changed
+    total_enquiries = serializers.IntegerField(required=False)
+    new_enquiries = serializers.IntegerField(required=False)
+    total_appointments = serializers.IntegerField(required=False)
+    pending_appointments = serializers.IntegerField(required=False)
+    total_subscribers = serializers.IntegerField(required=False)
+    total_news = serializers.IntegerField(required=False)
+    total_testimonials = serializers.IntegerField(required=False)
+    total_case_studies = serializers.IntegerField(required=False)
+    enquiries_by_status = serializers.DictField(child=serializers.IntegerField(), required=False)
+    appointments_by_status = serializers.DictField(child=serializers.IntegerField(), required=False)
     recent_enquiries = EnquirySerializer(many=True)
     recent_appointments = AppointmentSerializer(many=True)
+    as_of = serializers.DateTimeField()
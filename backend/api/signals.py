@@ -0,0 +1,72 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from . import counters, images, search
+from .middleware import record_query
+from .cache import bump_model_version
+from .models import CaseStudy, FAQ, NewsArticle, PracticeArea, SEOMetadata, Service, TeamMember, Testimonial
+
+CACHED_MODELS = (PracticeArea, TeamMember, Service, CaseStudy, Testimonial, FAQ)
+# Sitemap and feed files and the in-process SEO map also follow these version stamps.
+VERSIONED_MODELS = CACHED_MODELS + (NewsArticle, SEOMetadata)
+
+
+@receiver([post_save, post_delete])
+def invalidate_cached_responses(sender, **kwargs):
+    if sender in VERSIONED_MODELS:
+        # After commit: a miss rebuilt before then would read the old rows
+        # (the replica does not see uncommitted writes) and cache them under
+        # the new stamp.
+        transaction.on_commit(lambda: bump_model_version(sender))
+
+
+@receiver(post_save)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    if not raw and search.kind_for_model(sender):
+        search.index_instance(instance)
+
+
+@receiver(post_delete)
+def remove_from_search_index(sender, instance, **kwargs):
+    if search.kind_for_model(sender):
+        search.remove_instance(instance)
+
+
+@receiver(post_init)
+def remember_counter_state(sender, instance, **kwargs):
+    if sender._meta.label in counters.TRACKED:
+        counters.remember_state(instance)
+
+
+@receiver(post_save)
+def count_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw and sender._meta.label in counters.TRACKED:
+        counters.adjust(counters.deltas_for_save(instance, created))
+        counters.remember_state(instance)
+
+
+@receiver(post_delete)
+def count_deleted(sender, instance, **kwargs):
+    if sender._meta.label in counters.TRACKED:
+        counters.adjust(counters.deltas_for_delete(instance))
+
+
+@receiver(post_save)
+def render_image_variants(sender, instance, raw=False, **kwargs):
+    if not raw:
+        for field_name in images.IMAGE_FIELDS.get(sender._meta.label, ()):
+            images.schedule_variants(instance, field_name)
+
+
+@receiver(post_delete)
+def delete_image_variants(sender, instance, **kwargs):
+    for field_name in images.IMAGE_FIELDS.get(sender._meta.label, ()):
+        images.delete_variant_files(getattr(instance, f'{field_name}_variants'))
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
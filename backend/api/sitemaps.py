@@ -0,0 +1,199 @@
+import datetime
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Max
+from django.utils import feedgenerator
+
+from .cache import get_model_versions
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+FEED_ITEMS = 20
+
+# Frontend pages without a model of their own; a model label lends its latest updated_at as lastmod.
+STATIC_PAGES = [
+    ('/', None),
+    ('/about', None),
+    ('/practice-areas', 'api.PracticeArea'),
+    ('/services', 'api.Service'),
+    ('/team', 'api.TeamMember'),
+    ('/legal-news', 'api.NewsArticle'),
+    ('/case-studies', 'api.CaseStudy'),
+    ('/testimonials', None),
+    ('/faq', 'api.FAQ'),
+    ('/contact', None),
+    ('/careers', None),
+]
+
+# section -> (model label, visibility filter, frontend path)
+SECTIONS = {
+    'news': ('api.NewsArticle', {'is_published': True}, '/legal-news/{slug}'),
+    'practice-areas': ('api.PracticeArea', {'is_active': True}, '/practice-areas/{slug}'),
+    'team': ('api.TeamMember', {'is_active': True}, '/team/{slug}'),
+    'case-studies': ('api.CaseStudy', {'is_published': True}, '/case-studies/{slug}'),
+}
+
+VISIBLE = {label: visible for label, visible, _ in SECTIONS.values()}
+VISIBLE.update({'api.Service': {'is_active': True}, 'api.FAQ': {'is_published': True}})
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _model(label):
+    return apps.get_model(*label.split('.'))
+
+
+def _latest(label):
+    return _model(label).objects.filter(**VISIBLE[label]).aggregate(latest=Max('updated_at'))['latest']
+
+
+def _absolute(path):
+    return settings.FRONTEND_URL.rstrip('/') + path
+
+
+def _w3c(value):
+    return value.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+
+
+def _urlset(entries):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NS}">']
+    for location, lastmod in entries:
+        lastmod_tag = f'<lastmod>{_w3c(lastmod)}</lastmod>' if lastmod else ''
+        lines.append(f'<url><loc>{escape(location)}</loc>{lastmod_tag}</url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines).encode()
+
+
+def build_pages():
+    entries = [(_absolute(path), _latest(label) if label else None) for path, label in STATIC_PAGES]
+    return _urlset(entries), max((lastmod for _, lastmod in entries if lastmod), default=None)
+
+
+def build_section(name):
+    label, visible, path = SECTIONS[name]
+    rows = (
+        _model(label).objects.filter(**visible)
+        .order_by('-updated_at')
+        .values_list('slug', 'updated_at')
+        .iterator(chunk_size=2000)
+    )
+    entries = [(_absolute(path.format(slug=slug)), updated_at) for slug, updated_at in rows]
+    return _urlset(entries), entries[0][1] if entries else None
+
+
+def build_index():
+    parts = [('pages', build_pages()[1])]
+    parts += [(name, _latest(SECTIONS[name][0])) for name in SECTIONS]
+    base = settings.BACKEND_URL.rstrip('/') + '/api/sitemaps/'
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NS}">']
+    for name, lastmod in parts:
+        lastmod_tag = f'<lastmod>{_w3c(lastmod)}</lastmod>' if lastmod else ''
+        lines.append(f'<sitemap><loc>{escape(base + name)}.xml</loc>{lastmod_tag}</sitemap>')
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines).encode(), max((lastmod for _, lastmod in parts if lastmod), default=None)
+
+
+def build_feed(feed_class, extension):
+    NewsArticle = _model('api.NewsArticle')
+    feed = feed_class(
+        title='MR Advocates & Associates - Legal News',
+        link=_absolute('/legal-news'),
+        description='Legal news and updates from MR Advocates & Associates',
+        language='en',
+        feed_url=settings.BACKEND_URL.rstrip('/') + f'/api/feeds/news.{extension}',
+    )
+    articles = (
+        NewsArticle.objects.filter(is_published=True)
+        .select_related('author')
+        .order_by('-published_date', '-created_at')[:FEED_ITEMS]
+    )
+    for article in articles:
+        author = article.author.get_full_name() or article.author.username if article.author else None
+        feed.add_item(
+            title=article.title,
+            link=_absolute(f'/legal-news/{article.slug}'),
+            description=article.summary,
+            unique_id=_absolute(f'/legal-news/{article.slug}'),
+            pubdate=article.published_date or article.created_at,
+            updateddate=article.updated_at,
+            author_name=author,
+            categories=[article.get_category_display()],
+        )
+    return feed.writeString('utf-8').encode(), feed.latest_post_date()
+
+
+# file name -> (models whose versions key it, builder, content type)
+ARTIFACTS = {
+    'sitemap.xml': (
+        [entry[0] for entry in SECTIONS.values()] + ['api.Service', 'api.FAQ'],
+        build_index, 'application/xml',
+    ),
+    'sitemap-pages.xml': (
+        sorted({label for _, label in STATIC_PAGES if label}),
+        build_pages, 'application/xml',
+    ),
+    'news.rss': (['api.NewsArticle'], lambda: build_feed(feedgenerator.Rss201rev2Feed, 'rss'), feedgenerator.Rss201rev2Feed.content_type),
+    'news.atom': (['api.NewsArticle'], lambda: build_feed(feedgenerator.Atom1Feed, 'atom'), feedgenerator.Atom1Feed.content_type),
+}
+for _name, (_label, _, _) in SECTIONS.items():
+    ARTIFACTS[f'sitemap-{_name}.xml'] = ([_label], lambda name=_name: build_section(name), 'application/xml')
+
+
+def _lock(name):
+    with _locks_guard:
+        return _locks.setdefault(name, threading.Lock())
+
+
+def ensure(name):
+    """
+    Return (path, etag, content type) of the current file for artifact ``name``.
+
+    Files are named after the version stamps of the models they read, so a
+    save bumps only the affected sections; the next request rebuilds just
+    those and removes the superseded file.
+    """
+    labels, build, content_type = ARTIFACTS[name]
+    versions = get_model_versions([_model(label) for label in labels])
+    stamp = '-'.join(str(version) for version in versions)
+    root = Path(settings.SITEMAP_ROOT)
+    path = root / f'{name}.{stamp}'
+    etag = '"%s"' % hashlib.md5(path.name.encode()).hexdigest()
+    if path.exists():
+        return path, etag, content_type
+
+    with _lock(name):
+        if not path.exists():
+            root.mkdir(parents=True, exist_ok=True)
+            content, lastmod = build()
+            fd, tmp = tempfile.mkstemp(dir=root, prefix=f'.{name}.')
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(content)
+            if lastmod:
+                # The file's mtime doubles as the Last-Modified of its content.
+                os.utime(tmp, (lastmod.timestamp(), lastmod.timestamp()))
+            os.replace(tmp, path)
+            for stale in root.glob(f'{name}.*'):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+    return path, etag, content_type
+
+
+def open_artifact(name):
+    """Open the current file for ``name``; returns (file, etag, content type, mtime)."""
+    for attempt in range(2):
+        path, etag, content_type = ensure(name)
+        try:
+            handle = open(path, 'rb')
+        except FileNotFoundError:
+            # Superseded and removed by another worker between ensure() and open().
+            if attempt:
+                raise
+            continue
+        return handle, etag, content_type, int(os.fstat(handle.fileno()).st_mtime)
@@ -0,0 +1,708 @@
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+import zipfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import StopUpload
+from django.db import DatabaseError, connection
+from django.db.models import QuerySet
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import availability, counters, newsletter
+from .activity import ActivityLogSink
+from .cache import get_cache, get_model_version
+from .exports import csv_rows
+from .fast_serializers import FastListMixin, compile_plan, serialize_rows
+from .models import *
+from .pagination import StandardResultsSetPagination
+from .sampledata import LOCMEM_CACHES, endpoints, seed
+from .throttling import ServiceBusy, WriteSlots
+from .uploads import ResumeUploadHandler
+from .urls import public_router
+from .utils import get_client_ip
+from .view_counts import ViewCountBuffer
+from .views import AdminEnquiryViewSet, NewsArticlePublicViewSet, TestimonialViewSet
+
+
+# Queries per GET endpoint, the same at every page size (see QueryBudgetTests).
+QUERY_BUDGETS = {
+    'practice-area-list': 1,
+    'practice-area-detail': 1,
+    'team-list': 1,
+    'team-detail': 1,
+    'news-list': 2,
+    'news-detail': 1,
+    'service-list': 1,
+    'service-detail': 1,
+    'case-study-list': 2,
+    'case-study-detail': 1,
+    'testimonial-list': 1,
+    'testimonial-detail': 1,
+    'faq-list': 1,
+    'faq-detail': 1,
+    'get-seo': 1,
+    'seo-bulk': 1,
+    'search': 2,
+    'appointment-availability': 1,
+    'home': 6,
+    'admin-practice-area-list': 1,
+    'admin-practice-area-detail': 1,
+    'admin-team-list': 1,
+    'admin-team-detail': 1,
+    'admin-news-list': 2,
+    'admin-news-detail': 1,
+    'admin-service-list': 1,
+    'admin-service-detail': 1,
+    'admin-case-study-list': 2,
+    'admin-case-study-detail': 1,
+    'admin-testimonial-list': 1,
+    'admin-testimonial-detail': 1,
+    'admin-faq-list': 1,
+    'admin-faq-detail': 1,
+    'admin-enquiry-list': 2,
+    'admin-enquiry-detail': 1,
+    'admin-appointment-list': 2,
+    'admin-appointment-detail': 1,
+    'admin-subscriber-list': 2,
+    'admin-subscriber-detail': 1,
+    'admin-newsletter-campaign-list': 1,
+    'admin-newsletter-campaign-detail': 1,
+    'admin-career-list': 2,
+    'admin-career-detail': 1,
+    'admin-seo-list': 1,
+    'admin-seo-detail': 1,
+    'admin-activity-log-list': 2,
+    'admin-activity-log-detail': 1,
+    'dashboard-stats': 3,
+}
+
+
+class FastSerializationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed(8)
+        # Rows with no related object, besides the ones seed() leaves null.
+        NewsArticle.objects.create(title='Orphaned article', slug='orphaned-article', category='general',
+                                   summary='Summary', content='Content', is_published=True)
+        Testimonial.objects.create(client_name='Orphaned client', content='Content', order=-1)
+        CaseStudy.objects.create(title='Orphaned case study', slug='orphaned-case-study', challenge='Challenge',
+                                 solution='Solution', outcome='Outcome', is_published=True, order=-1)
+
+    def test_values_rows_render_like_the_serializers(self):
+        renderer = JSONRenderer()
+        factory = APIRequestFactory()
+        for prefix, viewset, basename in public_router.registry:
+            if not issubclass(viewset, FastListMixin):
+                continue
+            with self.subTest(basename):
+                request = Request(factory.get(f'/api/{prefix}/'))
+                view = viewset(request=request, format_kwarg=None, action='list', kwargs={}, args=())
+                queryset = view.get_queryset()
+                serializer_class = view.get_serializer_class()
+                columns, _ = compile_plan(serializer_class)
+
+                expected = serializer_class(list(queryset), many=True, context={'request': request}).data
+                actual = serialize_rows(serializer_class, list(queryset.values(*columns)), request)
+                self.assertEqual(renderer.render(actual), renderer.render(expected))
+
+    def test_null_relation_leaves_the_field_out(self):
+        factory = APIRequestFactory()
+        for viewset, lookup, field in (
+            (NewsArticlePublicViewSet, {'slug': 'orphaned-article'}, 'author_name'),
+            (TestimonialViewSet, {'client_name': 'Orphaned client'}, 'practice_area_name'),
+        ):
+            request = Request(factory.get('/'))
+            view = viewset(request=request, format_kwarg=None, action='list', kwargs={}, args=())
+            serializer_class = view.get_serializer_class()
+            columns, _ = compile_plan(serializer_class)
+            rows = list(view.get_queryset().filter(**lookup).values(*columns))
+            self.assertNotIn(field, serialize_rows(serializer_class, rows, request)[0])
+
+
+class CSVExportTests(TestCase):
+    def test_formula_cells_are_quoted(self):
+        values = ['=HYPERLINK("http://x")', '+91 99999', '-2+3', '@SUM(A1)', '\tcmd', '\rcmd', 'plain', -5, None]
+        lines = list(csv_rows([f'f{i}' for i in range(len(values))], [values]))
+        self.assertEqual(
+            lines[1],
+            '"\'=HYPERLINK(""http://x"")",\'+91 99999,\'-2+3,\'@SUM(A1),\'\tcmd,"\'\rcmd",plain,-5,\r\n',
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class VersionStampTests(TestCase):
+    def test_stamp_changes_only_when_the_write_commits(self):
+        before = get_model_version(FAQ)
+        with self.captureOnCommitCallbacks() as callbacks:
+            FAQ.objects.create(question='Question?', answer='Answer')
+        self.assertEqual(get_model_version(FAQ), before)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_model_version(FAQ), before)
+
+
+def wait_for_call(obj, name):
+    """
+    Return an event set once ``obj.name`` has been called and returned.
+
+    Tests wait on it instead of polling the table, which could meet the
+    background thread's write: the shared in-memory test database reports
+    a lock at once rather than waiting.
+    """
+    called = threading.Event()
+    method = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            called.set()
+    setattr(obj, name, wrapper)
+    return called
+
+
+# Transactional, so the flusher thread's own connection sees the rows.
+class ViewCountBufferTests(TransactionTestCase):
+    def setUp(self):
+        self.article = NewsArticle.objects.create(title='Article', slug='article', category='general',
+                                                  summary='Summary', content='Content')
+        self.buffer = ViewCountBuffer('api.NewsArticle', max_pending=100, flush_interval=60)
+        self.addCleanup(self.buffer.shutdown)
+
+    def views(self):
+        return NewsArticle.objects.get(pk=self.article.pk).views
+
+    def test_views_are_buffered_until_flushed(self):
+        for _ in range(3):
+            self.buffer.record(self.article.pk)
+        self.assertEqual(self.buffer.pending(self.article.pk), 3)
+        self.assertEqual(self.views(), 0)
+
+        self.assertEqual(self.buffer.flush(), 3)
+        self.assertEqual(self.buffer.pending(self.article.pk), 0)
+        self.assertEqual(self.views(), 3)
+
+    def test_failed_write_keeps_the_views_queued(self):
+        self.buffer.record(self.article.pk)
+        self.buffer.record(self.article.pk)
+        with mock.patch.object(QuerySet, 'update', side_effect=DatabaseError('locked')), \
+                self.assertLogs('api.view_counts', 'ERROR'):
+            self.assertIsNone(self.buffer.flush())
+        self.assertEqual(self.buffer.pending(self.article.pk), 2)
+
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(self.views(), 2)
+
+    def test_thread_writes_once_the_threshold_is_reached(self):
+        self.buffer.max_pending = 5
+        flushed = wait_for_call(self.buffer, 'flush')
+        for _ in range(5):
+            self.buffer.record(self.article.pk)
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(self.views(), 5)
+        self.assertEqual(self.buffer.pending(self.article.pk), 0)
+
+
+class ActivityLogSinkTests(TransactionTestCase):
+    def setUp(self):
+        self.sink = ActivityLogSink(batch_size=3, flush_interval=60)
+        self.addCleanup(self.sink.shutdown)
+
+    def put(self, count):
+        for n in range(count):
+            self.sink.put(user=None, action=f'Action {n}', model_name='FAQ', timestamp=timezone.now())
+
+    def test_full_batch_is_written_by_the_thread(self):
+        written = wait_for_call(self.sink, '_write')
+        self.put(2)
+        self.assertFalse(written.wait(0.1))
+        self.put(1)
+        self.assertTrue(written.wait(5))
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+    def test_shutdown_writes_what_is_queued(self):
+        self.put(2)
+        self.sink.shutdown()
+        self.assertEqual(ActivityLog.objects.count(), 2)
+
+
+class ClientIPTests(TestCase):
+    def address(self, num_proxies, forwarded_for=None):
+        headers = {'HTTP_X_FORWARDED_FOR': forwarded_for} if forwarded_for else {}
+        request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', **headers)
+        with override_settings(REST_FRAMEWORK={'NUM_PROXIES': num_proxies}):
+            return get_client_ip(request)
+
+    def test_entry_appended_by_the_trusted_proxy_is_used(self):
+        self.assertEqual(self.address(1, '9.9.9.9, 203.0.113.7'), '203.0.113.7')
+        self.assertEqual(self.address(2, '9.9.9.9, 203.0.113.7, 10.0.0.2'), '203.0.113.7')
+
+    def test_more_proxies_than_entries_takes_the_leftmost(self):
+        self.assertEqual(self.address(3, '203.0.113.7, 10.0.0.2'), '203.0.113.7')
+
+    def test_header_is_ignored_without_proxies(self):
+        self.assertEqual(self.address(None, '9.9.9.9'), '10.0.0.1')
+        self.assertEqual(self.address(0, '9.9.9.9'), '10.0.0.1')
+        self.assertEqual(self.address(1), '10.0.0.1')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = seed(StandardResultsSetPagination.max_page_size)
+
+    def count_queries(self, page_size):
+        # A cleared cache moves every version stamp, so nothing is served warm from the last round.
+        get_cache().clear()
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        counts = {}
+        for name, url in endpoints(page_size):
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            self.assertEqual(response.status_code, 200, f'{name} {url}')
+            counts[name] = len(queries)
+        return counts
+
+    def test_endpoints_stay_within_their_budgets(self):
+        small, full = self.count_queries(10), self.count_queries(StandardResultsSetPagination.max_page_size)
+        for name, count in full.items():
+            with self.subTest(name):
+                self.assertIn(name, QUERY_BUDGETS, f'{name} has no query budget')
+                self.assertEqual(small[name], count, f'{name}: query count grows with page size')
+                self.assertLessEqual(count, QUERY_BUDGETS[name])
+
+
+class CounterTests(TestCase):
+    def test_missing_counter_is_created_from_its_own_count(self):
+        Enquiry.objects.create(name='First', email='first@example.com', phone='1', subject='S', message='M')
+        StatCounter.objects.filter(name='enquiries.status.new').delete()
+        rows = StatCounter.objects.count()
+
+        # Only the missing row is counted, not every tracked table.
+        with mock.patch.object(counters, 'compute', side_effect=AssertionError('compute() called')):
+            Enquiry.objects.create(name='Second', email='second@example.com', phone='2', subject='S', message='M')
+        self.assertEqual(StatCounter.objects.get(name='enquiries.status.new').value, 2)
+        self.assertEqual(StatCounter.objects.count(), rows + 1)
+
+
+def staff_client():
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user('staff', 'staff@example.com', 'password', is_staff=True))
+    return client
+
+
+def create_enquiries(count, status='new'):
+    return [
+        Enquiry.objects.create(name=f'Client {n}', email=f'client{n}@example.com', phone='9999999999',
+                               subject='Subject', message='Message', status=status).pk
+        for n in range(count)
+    ]
+
+
+@override_settings(ACTIVITY_LOG_ASYNC=False)
+class BulkStatusUpdateTests(TestCase):
+    url = '/api/admin/enquiries/bulk-update-status/'
+
+    def setUp(self):
+        self.client = staff_client()
+
+    def post(self, data):
+        return self.client.post(self.url, data, format='json')
+
+    def counter(self, status):
+        return StatCounter.objects.get(name=f'enquiries.status.{status}').value
+
+    def test_ids_are_updated_in_chunks(self):
+        ids = create_enquiries(7)
+        with mock.patch.object(AdminEnquiryViewSet, 'bulk_chunk_size', 3), \
+                CaptureQueriesContext(connection) as queries:
+            response = self.post({'ids': ids + [ids[0], 999999], 'status': 'closed'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 7)
+        self.assertEqual(response.data['results'][999999], 'not_found')
+        self.assertEqual(set(response.data['results']) - {999999}, set(ids))
+        updates = [q for q in queries if q['sql'].startswith('UPDATE "api_enquiry"')]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(Enquiry.objects.filter(status='closed').count(), 7)
+        self.assertEqual((self.counter('new'), self.counter('closed')), (0, 7))
+
+    def test_filter_updates_matching_rows_and_summarizes_them(self):
+        create_enquiries(5)
+        create_enquiries(2, status='contacted')
+        response = self.post({'filter': {'status__in': 'new,contacted'}, 'status': 'resolved'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 7)
+        self.assertEqual(response.data['previous_status'], {'new': 5, 'contacted': 2})
+        self.assertNotIn('results', response.data)
+        self.assertEqual(self.counter('resolved'), 7)
+
+    def test_filter_is_validated_against_the_filterset(self):
+        create_enquiries(3)
+        for data in (
+            {'filter': {'stauts': 'new'}, 'status': 'closed'},
+            {'filter': {'created_at__gte': 'yesterday'}, 'status': 'closed'},
+            {'filter': {'status': 'new'}, 'ids': [1], 'status': 'closed'},
+            {'filter': {'status': 'new'}, 'status': 'archived'},
+        ):
+            with self.subTest(data):
+                self.assertEqual(self.post(data).status_code, 400)
+        self.assertEqual(Enquiry.objects.filter(status='new').count(), 3)
+
+
+@override_settings(ACTIVITY_LOG_ASYNC=False)
+class UpdateStatusTests(TestCase):
+    def setUp(self):
+        self.client = staff_client()
+
+    def test_status_must_be_one_of_the_choices(self):
+        enquiry = Enquiry.objects.get(pk=create_enquiries(1)[0])
+        appointment = Appointment.objects.create(name='Client', email='client@example.com', phone='9999999999',
+                                                 matter_type='civil', preferred_date='2030-01-07',
+                                                 preferred_time='10:00')
+        for url, valid in (
+            (f'/api/admin/enquiries/{enquiry.pk}/update_status/', 'contacted'),
+            (f'/api/admin/appointments/{appointment.pk}/update_status/', 'confirmed'),
+        ):
+            with self.subTest(url):
+                self.assertEqual(self.client.patch(url, {'status': 'archived'}, format='json').status_code, 400)
+                self.assertEqual(self.client.patch(url, {}, format='json').status_code, 400)
+                self.assertEqual(self.client.patch(url, {'status': valid}, format='json').status_code, 200)
+        enquiry.refresh_from_db()
+        appointment.refresh_from_db()
+        self.assertEqual((enquiry.status, appointment.status), ('contacted', 'confirmed'))
+
+
+class NewsletterSendTests(TestCase):
+    def setUp(self):
+        self.subscribers = [
+            NewsletterSubscriber.objects.create(email=f'reader{n}@example.com') for n in range(5)
+        ]
+        self.campaign = NewsletterCampaign.objects.create(subject='News', body_text='Body', status='queued')
+        newsletter.materialize(self.campaign)
+
+    def deliveries(self, status):
+        return set(self.campaign.deliveries.filter(status=status).values_list('email', flat=True))
+
+    def test_rows_claimed_meanwhile_are_left_to_the_other_run(self):
+        ids = list(self.campaign.deliveries.order_by('id').values_list('id', flat=True))
+        update = QuerySet.update
+
+        def racing_update(queryset, **changes):
+            if changes.get('claimed_by') == 'this-run':
+                # Another run claims two of the candidates between the SELECT and this UPDATE.
+                update(NewsletterDelivery.objects.filter(pk__in=ids[:2]),
+                       status='sending', claimed_by='other-run', claimed_at=timezone.now())
+            return update(queryset, **changes)
+
+        with mock.patch.object(QuerySet, 'update', racing_update):
+            last_id, claimed = newsletter.claim(self.campaign, 0, 10, 'this-run')
+        self.assertEqual(last_id, ids[-1])
+        self.assertEqual([pk for pk, _, _, _ in claimed], ids[2:])
+        self.assertEqual(set(self.campaign.deliveries.filter(claimed_by='other-run').values_list('id', flat=True)),
+                         set(ids[:2]))
+
+    def test_deliveries_claimed_by_another_run_are_not_sent(self):
+        _, first = newsletter.claim(self.campaign, 0, 2, 'other-run')
+        self.assertEqual(newsletter.send_campaign(self.campaign), (3, 0))
+        claimed_elsewhere = {email for _, email, _, _ in first}
+        self.assertFalse(claimed_elsewhere & {message.to[0] for message in mail.outbox})
+        self.assertEqual(self.deliveries('sending'), claimed_elsewhere)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sending')
+
+    def test_stale_claims_are_sent_again(self):
+        newsletter.claim(self.campaign, 0, 2, 'crashed-run')
+        self.campaign.deliveries.update(claimed_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(newsletter.send_campaign(self.campaign, claim_timeout=60), (5, 0))
+        self.assertEqual(len(mail.outbox), 5)
+
+    def test_unsubscribed_recipients_are_skipped(self):
+        self.subscribers[0].is_active = False
+        self.subscribers[0].save()
+        self.subscribers[1].delete()
+
+        self.assertEqual(newsletter.send_campaign(self.campaign), (3, 0))
+        self.assertEqual(self.deliveries('skipped'), {'reader0@example.com', 'reader1@example.com'})
+        self.assertEqual(len(mail.outbox), 3)
+        campaign = newsletter.progress(NewsletterCampaign.objects.filter(pk=self.campaign.pk)).get()
+        self.assertEqual((campaign.status, campaign.sent_count, campaign.skipped_count), ('sent', 3, 2))
+
+
+def docx(paths=('word/document.xml',)):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for path in paths:
+            archive.writestr(path, '<w:document/>')
+    return buffer.getvalue()
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RESUME_MAX_UPLOAD_SIZE=16 * 1024)
+class ResumeUploadTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        self.media_root = media.name
+        self.addresses = (f'10.0.0.{n}' for n in range(1, 255))
+
+    def apply(self, name, content):
+        return self.client.post('/api/careers/apply/', {
+            'name': 'Applicant', 'email': 'applicant@example.com', 'phone': '9999999999',
+            'position': 'Associate', 'experience_years': 2, 'education': 'LLB', 'cover_letter': 'Letter',
+            'resume': SimpleUploadedFile(name, content),
+        }, REMOTE_ADDR=next(self.addresses))
+
+    def stored_files(self):
+        return [name for _, _, names in os.walk(self.media_root) for name in names]
+
+    def test_handler_stops_reading_past_the_cap(self):
+        handler = ResumeUploadHandler(max_size=8)
+        handler.new_file('resume', 'resume.pdf', 'application/pdf', None)
+        handler.receive_data_chunk(b'%PDF-1.4', 0)
+        with self.assertRaises(StopUpload) as raised:
+            handler.receive_data_chunk(b'\n', 8)
+        self.assertTrue(raised.exception.connection_reset)
+        self.assertTrue(handler.too_large)
+
+    def test_oversized_resume_is_refused(self):
+        # Small enough to pass the Content-Length check, so the handler has to stop it.
+        response = self.apply('resume.pdf', b'%PDF-1.4\n' + b'0' * 20 * 1024)
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(CareerApplication.objects.exists())
+        self.assertEqual(self.stored_files(), [])
+
+    def test_file_type_comes_from_the_content(self):
+        for name, content, accepted in (
+            ('resume.pdf', b'Not really a PDF', False),
+            ('resume.docx', docx(['notes.txt']), False),
+            ('resume.exe', b'MZ\x90\x00\x03\x00\x00\x00', False),
+            ('resume.docx', docx(), True),
+            ('resume.txt', b'%PDF-1.4\n%', True),
+            ('resume.doc', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'0' * 64, True),
+        ):
+            with self.subTest(name=name, accepted=accepted):
+                response = self.apply(name, content)
+                self.assertEqual(response.status_code, 201 if accepted else 400)
+        self.assertEqual(sorted(os.path.splitext(name)[1] for name in self.stored_files()), ['.doc', '.docx', '.pdf'])
+
+    def test_identical_resumes_are_stored_once(self):
+        for content in (b'%PDF-1.4\nsame', b'%PDF-1.4\nsame', b'%PDF-1.4\nother'):
+            self.assertEqual(self.apply('resume.pdf', content).status_code, 201)
+        first, second, third = CareerApplication.objects.order_by('id')
+        self.assertEqual(first.resume.name, second.resume.name)
+        self.assertEqual(first.resume_sha256, second.resume_sha256)
+        self.assertNotEqual(first.resume.name, third.resume.name)
+        self.assertEqual(len(self.stored_files()), 2)
+
+
+def hold_slot(slots, held, release):
+    with slots:
+        held.set()
+        release.wait(5)
+
+
+class WriteSlotTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.slots = WriteSlots(2, directory.name)
+
+    def test_slots_are_shared_between_processes(self):
+        context = multiprocessing.get_context('fork')
+        held, release = context.Event(), context.Event()
+        worker = context.Process(target=hold_slot, args=(self.slots, held, release))
+        worker.start()
+        self.addCleanup(worker.join, 5)
+        self.addCleanup(release.set)
+        self.assertTrue(held.wait(5))
+
+        with self.slots:
+            with self.assertRaises(ServiceBusy):
+                with self.slots:
+                    pass
+        release.set()
+        worker.join(5)
+        with self.slots, self.slots:
+            pass
+
+    def test_slots_are_shared_between_threads(self):
+        held, release = threading.Event(), threading.Event()
+        worker = threading.Thread(target=hold_slot, args=(self.slots, held, release))
+        worker.start()
+        self.addCleanup(worker.join, 5)
+        self.addCleanup(release.set)
+        self.assertTrue(held.wait(5))
+        with self.slots, self.assertRaises(ServiceBusy):
+            with self.slots:
+                pass
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ThrottleTests(TestCase):
+    url = '/api/newsletter/subscribe/'
+
+    def setUp(self):
+        get_cache().clear()
+
+    def subscribe(self, n, **headers):
+        return self.client.post(self.url, {'email': f'reader{n}@example.com'}, REMOTE_ADDR='203.0.113.7', **headers)
+
+    def test_forwarded_for_is_ignored_without_a_proxy(self):
+        rest_framework = {'NUM_PROXIES': 0, 'DEFAULT_THROTTLE_RATES': {'subscribe-newsletter': '3/min'}}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            for n in range(3):
+                self.assertEqual(self.subscribe(n).status_code, 201)
+            self.assertEqual(self.subscribe(3).status_code, 429)
+            self.assertEqual(self.subscribe(4, HTTP_X_FORWARDED_FOR='9.9.9.9').status_code, 429)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    OFFICE_HOURS={weekday: [('10:00', '12:00')] for weekday in range(7)},
+    APPOINTMENT_CLOSED_DATES=[],
+    APPOINTMENT_SLOT_MINUTES=30,
+    APPOINTMENT_SLOT_CAPACITY=1,
+    APPOINTMENT_BOOKING_DAYS=60,
+    APPOINTMENT_SUGGESTIONS=3,
+)
+class AppointmentAvailabilityTests(TestCase):
+    url = '/api/appointment/availability/'
+
+    def setUp(self):
+        get_cache().clear()
+        self.today, self.last = availability.bookable_dates()
+        self.tomorrow = self.today + timedelta(days=1)
+        self.addresses = (f'10.0.1.{n}' for n in range(1, 255))
+
+    def book(self, time, email='client@example.com'):
+        return self.client.post('/api/appointment/', {
+            'name': 'Client', 'email': email, 'phone': '9999999999', 'matter_type': 'civil',
+            'preferred_date': self.tomorrow.isoformat(), 'preferred_time': time, 'message': '',
+        }, content_type='application/json', REMOTE_ADDR=next(self.addresses))
+
+    def get(self, **params):
+        return self.client.get(self.url, params)
+
+    def test_booked_slots_are_left_out(self):
+        self.assertEqual(self.book('10:00').status_code, 201)
+        Appointment.objects.create(name='Client', email='gone@example.com', phone='1', matter_type='civil',
+                                   preferred_date=self.tomorrow, preferred_time='10:30', status='cancelled')
+        response = self.get(start=self.tomorrow.isoformat(), end=self.tomorrow.isoformat())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['days'], [
+            {'date': self.tomorrow.isoformat(), 'slots': ['10:30', '11:00', '11:30']},
+        ])
+
+    def test_range_is_clamped_to_the_bookable_dates(self):
+        response = self.get(start=(self.today - timedelta(days=3)).isoformat(),
+                            end=(self.last + timedelta(days=30)).isoformat())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['start'], response.data['end']), (self.today.isoformat(), self.last.isoformat()))
+
+    def test_range_outside_the_bookable_dates_is_rejected(self):
+        for start, end in (
+            ('2020-01-01', '2020-01-02'),
+            ((self.last + timedelta(days=1)).isoformat(), (self.last + timedelta(days=7)).isoformat()),
+            (self.tomorrow.isoformat(), self.today.isoformat()),
+            ('tomorrow', None),
+        ):
+            with self.subTest(start=start, end=end):
+                response = self.get(start=start, **({'end': end} if end else {}))
+                self.assertEqual(response.status_code, 400)
+
+    def test_taken_slot_is_refused_with_the_nearest_free_ones(self):
+        self.assertEqual(self.book('10:00').status_code, 201)
+        self.assertEqual(self.book('11:00', email='other@example.com').status_code, 201)
+
+        response = self.book('10:00', email='late@example.com')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['errors']['preferred_time'], [availability.describe(availability.FULL)])
+        # The third nearest is today's 11:30 or, once that has passed, 10:00 the day after.
+        suggestions = response.data['suggestions']
+        self.assertEqual(len(suggestions), 3)
+        self.assertEqual([s['time'] for s in suggestions if s['date'] == self.tomorrow.isoformat()], ['10:30', '11:30'])
+        self.assertEqual(suggestions, sorted(suggestions, key=lambda s: (s['date'], s['time'])))
+        self.assertEqual(Appointment.objects.filter(email='late@example.com').count(), 0)
+
+    def test_time_outside_office_hours_is_refused(self):
+        response = self.book('15:00')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors']['preferred_time'], [availability.describe(availability.OUTSIDE_HOURS)])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SUBMISSION_DUPLICATE_WINDOW=600)
+class DuplicateSubmissionTests(TestCase):
+    url = '/api/enquiry/'
+
+    def setUp(self):
+        get_cache().clear()
+
+    def submit(self, key=None, address='203.0.113.7', **changes):
+        data = {'name': 'Client', 'email': 'client@example.com', 'phone': '+91 99999 99999',
+                'matter_type': 'civil', 'subject': 'Subject', 'message': 'Message', **changes}
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        return self.client.post(self.url, data, content_type='application/json', REMOTE_ADDR=address, **headers)
+
+    def test_submission_leaves_out_the_bookkeeping_fields(self):
+        response = self.submit(key='key-1')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('fingerprint', response.data['data'])
+        self.assertNotIn('idempotency_key', response.data['data'])
+
+    def test_replay_returns_only_the_id(self):
+        first = self.submit(key='key-1')
+        Enquiry.objects.update(notes='internal: do not call back')
+
+        replay = self.submit(key='key-1')
+        self.assertEqual(replay.status_code, 201)
+        self.assertEqual(replay['Idempotent-Replayed'], 'true')
+        self.assertEqual(set(replay.data), {'success', 'message', 'id'})
+        self.assertEqual(replay.data['id'], first.data['data']['id'])
+        self.assertEqual(Enquiry.objects.count(), 1)
+
+    def test_key_reused_for_a_different_submission_is_refused(self):
+        self.submit(key='key-1')
+        response = self.submit(key='key-1', message='Something else')
+        self.assertEqual(response.status_code, 422)
+        self.assertNotIn('data', response.data)
+        self.assertEqual(Enquiry.objects.count(), 1)
+
+    def test_key_is_scoped_to_the_client(self):
+        self.submit(key='key-1')
+        response = self.submit(key='key-1', address='198.51.100.9', message='Something else')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Enquiry.objects.count(), 2)
+
+    def test_key_expires_with_the_window(self):
+        self.submit(key='key-1')
+        Enquiry.objects.update(created_at=timezone.now() - timedelta(seconds=601))
+        response = self.submit(key='key-1', message='Something else')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Enquiry.objects.count(), 2)
+
+    def test_same_content_collapses_inside_the_window(self):
+        first = self.submit()
+        # Case, spacing and phone punctuation do not make a submission new.
+        repeat = self.submit(email='CLIENT@example.com', phone='919999999999', message='  Message ')
+        self.assertEqual(repeat.data['id'], first.data['data']['id'])
+        self.assertEqual(Enquiry.objects.count(), 1)
+
+        Enquiry.objects.update(created_at=timezone.now() - timedelta(seconds=601))
+        self.assertEqual(self.submit().status_code, 201)
+        self.assertEqual(Enquiry.objects.count(), 2)
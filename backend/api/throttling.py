@@ -0,0 +1,151 @@
+import fcntl
+import math
+import os
+import threading
+import time
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .cache import get_cache
+
+BUCKET_KEY = 'api:throttle:{}:{}'
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'5/min' -> (capacity 5, 12.0 seconds to refill one token)."""
+    count, period = rate.split('/')
+    capacity = int(count)
+    return capacity, PERIODS[period[0]] / capacity
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    One token bucket per client and endpoint, holding up to N tokens and
+    refilling at N per period for a ``DEFAULT_THROTTLE_RATES`` rate 'N/period'
+    keyed by the route name.
+
+    Bucket state lives in the shared cache so every worker draws from the
+    same bucket; a worker that has refused a client remembers for how long
+    and refuses it again without touching the cache. Two workers may spend
+    the same last token, so a client can overshoot by one request per worker.
+    """
+    timer = time.time
+    max_blocked = 10000
+
+    _blocked = {}
+    _lock = threading.Lock()
+
+    def allow_request(self, request, view):
+        match = request.resolver_match
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(match.url_name) if match else None
+        if rate is None:
+            return True
+        capacity, interval = parse_rate(rate)
+        key = BUCKET_KEY.format(match.url_name, self.get_ident(request))
+        now = self.timer()
+
+        blocked_until = self._blocked.get(key)
+        if blocked_until is not None:
+            if now < blocked_until:
+                self.retry_after = blocked_until - now
+                return False
+            with self._lock:
+                self._blocked.pop(key, None)
+
+        cache = get_cache()
+        tokens, updated = cache.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + (now - updated) / interval)
+        if tokens < 1:
+            self.retry_after = (1 - tokens) * interval
+            self.block(key, now + self.retry_after)
+            return False
+        cache.set(key, (tokens - 1, now), timeout=math.ceil(capacity * interval))
+        return True
+
+    def wait(self):
+        return math.ceil(self.retry_after)
+
+    @classmethod
+    def block(cls, key, until):
+        with cls._lock:
+            if len(cls._blocked) >= cls.max_blocked:
+                now = cls.timer()
+                cls._blocked = {k: v for k, v in cls._blocked.items() if v > now}
+            cls._blocked[key] = until
+
+    @classmethod
+    def _after_fork(cls):
+        cls._blocked = {}
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=TokenBucketThrottle._after_fork)
+
+
+class ServiceBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'The server is busy. Please try again shortly.'
+    default_code = 'service_busy'
+
+    def __init__(self, wait):
+        super().__init__()
+        # Sent as Retry-After by DRF's exception handler.
+        self.wait = wait
+
+
+class WriteSlots:
+    """
+    Cap on public form submissions writing to the database at once, across
+    every worker process. Each slot is a file in ``directory``, held with a
+    non-blocking ``flock`` for the duration of the write; a request that
+    finds every slot taken fails fast with a 503 rather than queueing on the
+    SQLite write lock. The kernel releases the locks of a worker that dies,
+    so a crash cannot leak a slot.
+    """
+
+    def __init__(self, limit, directory, retry_after=1):
+        self.limit = limit
+        self.directory = directory
+        self.retry_after = retry_after
+        self._after_fork()
+
+    def _after_fork(self):
+        self._held = threading.local()
+
+    def _acquire(self):
+        os.makedirs(self.directory, exist_ok=True)
+        for slot in range(self.limit):
+            # A descriptor per attempt: flock excludes other open files, other threads included.
+            fd = os.open(os.path.join(self.directory, f'slot-{slot}.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            return fd
+        return None
+
+    def __enter__(self):
+        fd = self._acquire()
+        if fd is None:
+            raise ServiceBusy(self.retry_after)
+        self._held.__dict__.setdefault('fds', []).append(fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        fd = self._held.fds.pop()
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+write_slots = WriteSlots(
+    getattr(settings, 'PUBLIC_WRITE_CONCURRENCY', 4),
+    getattr(settings, 'PUBLIC_WRITE_LOCK_DIR', settings.BASE_DIR / 'cache' / 'write_slots'),
+    getattr(settings, 'PUBLIC_WRITE_RETRY_AFTER', 1),
+)
+os.register_at_fork(after_in_child=write_slots._after_fork)
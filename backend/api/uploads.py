@@ -0,0 +1,88 @@
+import hashlib
+import zipfile
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+
+
+SNIFF_BYTES = 8
+
+# extension -> (content type, leading bytes)
+RESUME_TYPES = {
+    'pdf': ('application/pdf', b'%PDF-'),
+    'doc': ('application/msword', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),
+    'docx': ('application/vnd.openxmlformats-officedocument.wordprocessingml.document', b'PK\x03\x04'),
+}
+
+
+def sniff(head, path):
+    """Return the resume extension matching the file's leading bytes, or None."""
+    for extension, (_, magic) in RESUME_TYPES.items():
+        if head.startswith(magic):
+            if extension == 'docx':
+                # Any zip starts with PK; only accept an actual Word document.
+                try:
+                    with zipfile.ZipFile(path) as archive:
+                        if 'word/document.xml' not in archive.namelist():
+                            return None
+                except zipfile.BadZipFile:
+                    return None
+            return extension
+    return None
+
+
+class HashedUploadedFile(TemporaryUploadedFile):
+    sha256 = ''
+    extension = None
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Stream each uploaded file to a temporary file, hashing it as it is written.
+
+    The upload is abandoned as soon as it grows past ``max_size`` bytes,
+    without reading the rest of the request body; ``too_large`` is then set
+    for the view to answer 413.
+    """
+
+    def __init__(self, request=None, max_size=None):
+        super().__init__(request)
+        self.max_size = max_size or settings.RESUME_MAX_UPLOAD_SIZE
+        self.too_large = False
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = HashedUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.digest = hashlib.sha256()
+        self.head = b''
+        self.size = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.size += len(raw_data)
+        if self.size > self.max_size:
+            self.too_large = True
+            self.file.close()
+            raise StopUpload(connection_reset=True)
+        if len(self.head) < SNIFF_BYTES:
+            self.head += raw_data[:SNIFF_BYTES - len(self.head)]
+        self.digest.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.digest.hexdigest()
+        self.file.extension = sniff(self.head, self.file.temporary_file_path())
+        if self.file.extension:
+            self.file.content_type = RESUME_TYPES[self.file.extension][0]
+        return self.file
+
+
+def store_resume(upload):
+    """Save ``upload`` under its content hash, reusing an identical file already stored."""
+    name = f'resumes/{upload.sha256[:2]}/{upload.sha256}.{upload.extension}'
+    if default_storage.exists(name):
+        return name
+    return default_storage.save(name, upload)
@@ -25,6 +25,7 @@ admin_router.register(r'faqs', views.AdminFAQViewSet, basename='admin-faq')
 admin_router.register(r'enquiries', views.AdminEnquiryViewSet, basename='admin-enquiry')
 admin_router.register(r'appointments', views.AdminAppointmentViewSet, basename='admin-appointment')
 admin_router.register(r'subscribers', views.AdminNewsletterSubscriberViewSet, basename='admin-subscriber')
+admin_router.register(r'newsletter-campaigns', views.AdminNewsletterCampaignViewSet, basename='admin-newsletter-campaign')
 admin_router.register(r'careers', views.AdminCareerApplicationViewSet, basename='admin-career')
 admin_router.register(r'seo', views.AdminSEOMetadataViewSet, basename='admin-seo')
 admin_router.register(r'activity-logs', views.AdminActivityLogViewSet, basename='admin-activity-log')
@@ -38,12 +39,21 @@ urlpatterns = [
     path('', include(public_router.urls)),
     path('enquiry/', views.create_enquiry, name='create-enquiry'),
     path('appointment/', views.create_appointment, name='create-appointment'),
+    path('appointment/availability/', views.appointment_availability, name='appointment-availability'),
     path('newsletter/subscribe/', views.subscribe_newsletter, name='subscribe-newsletter'),
     path('careers/apply/', views.apply_career, name='apply-career'),
+    path('seo/', views.seo_metadata_bulk, name='seo-bulk'),
     path('seo/<str:page_name>/', views.get_seo_metadata, name='get-seo'),
+    path('home/', views.home, name='home'),
+    path('search/', views.search, name='search'),
+    path('sitemap.xml', views.sitemap_file, {'name': 'sitemap.xml'}, name='sitemap'),
+    path('sitemaps/<slug:section>.xml', views.sitemap_section, name='sitemap-section'),
+    path('feeds/news.rss', views.sitemap_file, {'name': 'news.rss'}, name='news-rss'),
+    path('feeds/news.atom', views.sitemap_file, {'name': 'news.atom'}, name='news-atom'),
     
     # Admin APIs
     path('admin/', include(admin_router.urls)),
     path('admin/dashboard/stats/', views.dashboard_stats, name='dashboard-stats'),
+    path('admin/metrics/', views.metrics_view, name='metrics'),
 ]
 
@@ -1,11 +1,36 @@
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
 from .models import ActivityLog
+from .activity import sink
+
+
+def get_client_ip(request):
+    """
+    The client address as DRF's throttles see it: the X-Forwarded-For entry
+    ``NUM_PROXIES`` from the right, which the last trusted proxy appended.
+    Entries further left are supplied by the client and are never used.
+    """
+    forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    num_proxies = api_settings.NUM_PROXIES
+    if forwarded_for and num_proxies:
+        addresses = forwarded_for.split(',')
+        return addresses[-min(num_proxies, len(addresses))].strip() or None
+    return request.META.get('REMOTE_ADDR') or None
+
 
 def log_activity(user, action, model_name, object_id=None, details='', ip_address=None):
-    ActivityLog.objects.create(
+    fields = dict(
         user=user,
         action=action,
         model_name=model_name,
         object_id=object_id,
         details=details,
-        ip_address=ip_address
+        ip_address=ip_address,
+        timestamp=timezone.now(),
     )
+    if getattr(settings, 'ACTIVITY_LOG_ASYNC', True):
+        sink.put(**fields)
+    else:
+        ActivityLog.objects.create(**fields)
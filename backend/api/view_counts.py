@@ -0,0 +1,123 @@
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    Process-local buffer of article view increments.
+
+    Reads only bump an in-memory counter. A daemon thread writes the pending
+    counts as ``views = views + n`` updates every ``flush_interval`` seconds,
+    or sooner once ``max_pending`` views have accumulated, so no request
+    waits on the write. A failed write is logged and its counts stay queued
+    for the next one. ``QuerySet.update`` leaves ``updated_at`` alone, and
+    because every worker adds its own deltas no increment is lost when
+    several processes flush concurrently.
+    """
+
+    def __init__(self, model_label, max_pending=100, flush_interval=30):
+        self.model_label = model_label
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._after_fork()
+
+    def _after_fork(self):
+        self._condition = threading.Condition()
+        self._pending = Counter()
+        self._total = 0
+        self._thread = None
+        self._stopping = False
+
+    def record(self, pk):
+        with self._condition:
+            self._pending[pk] += 1
+            self._total += 1
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._run, name='view-count-flusher', daemon=True)
+                self._thread.start()
+            if self._total >= self.max_pending:
+                self._condition.notify()
+
+    def pending(self, pk):
+        with self._condition:
+            return self._pending.get(pk, 0)
+
+    def _take(self):
+        with self._condition:
+            pending, self._pending, self._total = self._pending, Counter(), 0
+        return pending
+
+    def _requeue(self, pending):
+        with self._condition:
+            self._pending.update(pending)
+            self._total += sum(pending.values())
+
+    def _run(self):
+        failed = False
+        while True:
+            with self._condition:
+                # After a failed write, wait out the interval rather than retry at once.
+                self._condition.wait_for(
+                    lambda: self._stopping or (not failed and self._total >= self.max_pending),
+                    timeout=self.flush_interval,
+                )
+                stopping = self._stopping
+            close_old_connections()
+            failed = self.flush() is None
+            if stopping:
+                return
+
+    def flush(self):
+        """
+        Write the pending counts. Returns how many views were written, or
+        None if the write failed and they were queued again.
+        """
+        pending = self._take()
+        if not pending:
+            return 0
+
+        from django.apps import apps
+        model = apps.get_model(self.model_label)
+
+        # Articles read the same number of times share one UPDATE.
+        by_increment = defaultdict(list)
+        for pk, count in pending.items():
+            by_increment[count].append(pk)
+        try:
+            with transaction.atomic():
+                for count, pks in by_increment.items():
+                    model.objects.filter(pk__in=pks).update(views=F('views') + count)
+        except Exception:
+            logger.exception('Could not write %d article views; keeping them queued', sum(pending.values()))
+            self._requeue(pending)
+            return None
+        return sum(pending.values())
+
+    def shutdown(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=10)
+        self.flush()
+
+
+news_views = ViewCountBuffer(
+    'api.NewsArticle',
+    max_pending=getattr(settings, 'NEWS_VIEW_FLUSH_THRESHOLD', 100),
+    flush_interval=getattr(settings, 'NEWS_VIEW_FLUSH_INTERVAL', 30),
+)
+
+atexit.register(news_views.shutdown)
+# Counts buffered before a fork belong to the parent only; the child starts its own flusher.
+os.register_at_fork(after_in_child=news_views._after_fork)
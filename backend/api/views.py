@@ -1,42 +1,84 @@
+import datetime
+import json
+
 from rest_framework import viewsets, status, generics
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import api_view, authentication_classes, permission_classes, throttle_classes, action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
-from rest_framework.pagination import PageNumberPagination
 from rest_framework_simplejwt.views import TokenObtainPairView
-from django.db.models import Q
+from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.db.models import Count, Q
+from django.template.defaultfilters import filesizeformat
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+from django.utils.dateparse import parse_datetime
 from .models import *
 from .serializers import *
-from .utils import log_activity
-
-
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+from .utils import get_client_ip, log_activity
+from . import availability
+from . import counters
+from . import duplicates
+from . import metrics
+from . import exports
+from . import newsletter
+from . import search as search_index
+from . import sitemaps
+from .cache import CachedResponseMixin
+from .db_routers import ReadReplicaMixin, read_only
+from .fast_serializers import FastListMixin
+from .home import SECTIONS as HOME_SECTIONS, home_bundle
+from .pagination import OptionalKeysetPagination, StandardResultsSetPagination
+from .seo import seo_map
+from .throttling import TokenBucketThrottle, write_slots
+from .uploads import ResumeUploadHandler, store_resume
+from .view_counts import news_views
+
+
+@require_safe
+def sitemap_file(request, name):
+    if name not in sitemaps.ARTIFACTS:
+        raise Http404
+    handle, etag, content_type, last_modified = sitemaps.open_artifact(name)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = FileResponse(handle, content_type=content_type)
+    else:
+        handle.close()
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=300)
+    return response
+
+
+def sitemap_section(request, section):
+    return sitemap_file(request, f'sitemap-{section}.xml')
 
 
 # ============================================
 # PUBLIC APIs (No Authentication Required)
 # ============================================
 
-class PracticeAreaViewSet(viewsets.ReadOnlyModelViewSet):
+class PracticeAreaViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = PracticeArea.objects.filter(is_active=True)
     serializer_class = PracticeAreaSerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
 
 
-class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamMemberViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = TeamMember.objects.filter(is_active=True)
     serializer_class = TeamMemberSerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
 
 
-class NewsArticlePublicViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = NewsArticle.objects.filter(is_published=True)
+class NewsArticlePublicViewSet(ReadReplicaMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = NewsArticle.objects.filter(is_published=True).select_related('author')
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
     lookup_field = 'slug'
@@ -48,8 +90,8 @@ class NewsArticlePublicViewSet(viewsets.ReadOnlyModelViewSet):
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        instance.views += 1
-        instance.save()
+        news_views.record(instance.pk)
+        instance.views += news_views.pending(instance.pk)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
     
@@ -61,49 +103,122 @@ class NewsArticlePublicViewSet(viewsets.ReadOnlyModelViewSet):
         if category:
             queryset = queryset.filter(category=category)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(summary__icontains=search)
-            )
+            queryset = queryset.filter(pk__in=search_index.matching_ids('news', search))
         
         return queryset
 
 
-class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Service.objects.filter(is_active=True)
     serializer_class = ServiceSerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
 
 
-class CaseStudyViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = CaseStudy.objects.filter(is_published=True)
+class CaseStudyViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = CaseStudy.objects.filter(is_published=True).select_related('practice_area')
     serializer_class = CaseStudySerializer
+    cache_models = (CaseStudy, PracticeArea)
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
     lookup_field = 'slug'
 
 
-class TestimonialViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Testimonial.objects.filter(is_published=True)
+class TestimonialViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Testimonial.objects.filter(is_published=True).select_related('practice_area')
     serializer_class = TestimonialSerializer
     permission_classes = [AllowAny]
+    cache_models = (Testimonial, PracticeArea)
 
 
-class FAQViewSet(viewsets.ReadOnlyModelViewSet):
+class FAQViewSet(ReadReplicaMixin, CachedResponseMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = FAQ.objects.filter(is_published=True)
     serializer_class = FAQSerializer
     permission_classes = [AllowAny]
 
 
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def home(request):
+    include = request.query_params.get('include')
+    names = [name for name in include.split(',') if name] if include else list(HOME_SECTIONS)
+    unknown = [name for name in names if name not in HOME_SECTIONS]
+    if unknown:
+        return Response({'error': f'Unknown sections: {", ".join(unknown)}'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    body, etag = home_bundle.render(request, list(dict.fromkeys(names)))
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def search(request):
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'Query parameter q is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    kinds = [kind for kind in request.query_params.get('type', '').split(',') if kind]
+    unknown = [kind for kind in kinds if kind not in search_index.SOURCES]
+    if unknown:
+        return Response({
+            'error': f"Unknown type: {', '.join(unknown)}",
+            'types': list(search_index.SOURCES),
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    paginator = StandardResultsSetPagination()
+    try:
+        page = max(int(request.query_params.get('page', 1)), 1)
+        page_size = min(int(request.query_params.get('page_size', paginator.page_size)), paginator.max_page_size)
+    except ValueError:
+        return Response({'error': 'page and page_size must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+    page_size = max(page_size, 1)
+
+    count, results = search_index.search(query, kinds, limit=page_size, offset=(page - 1) * page_size)
+    return Response({'count': count, 'page': page, 'results': results})
+
+
+def replayed_submission(original, fingerprint, message):
+    """
+    Answer a repeated form submission with the id of the record the first
+    one created, not the record itself, which staff may since have annotated.
+    """
+    if original.fingerprint != fingerprint:
+        return Response({
+            'success': False,
+            'message': 'This Idempotency-Key was already used for a different submission.',
+        }, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+    response = Response({
+        'success': True,
+        'message': message,
+        'id': original.pk,
+    }, status=status.HTTP_201_CREATED)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle])
 def create_enquiry(request):
     serializer = EnquirySerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save()
+        key = duplicates.idempotency_key(request)
+        fingerprint = duplicates.fingerprint(Enquiry, serializer.validated_data)
+        with write_slots, transaction.atomic():
+            original = duplicates.find_original(Enquiry, fingerprint, key)
+            if original is None:
+                serializer.save(fingerprint=fingerprint, idempotency_key=key)
+        message = 'Your enquiry has been submitted successfully. We will contact you soon.'
+        if original is not None:
+            return replayed_submission(original, fingerprint, message)
         return Response({
             'success': True,
-            'message': 'Your enquiry has been submitted successfully. We will contact you soon.',
+            'message': message,
             'data': serializer.data
         }, status=status.HTTP_201_CREATED)
     return Response({
@@ -115,13 +230,34 @@ def create_enquiry(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle])
 def create_appointment(request):
     serializer = AppointmentSerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save()
+        start = datetime.datetime.combine(serializer.validated_data['preferred_date'],
+                                          serializer.validated_data['preferred_time'])
+        key = duplicates.idempotency_key(request)
+        fingerprint = duplicates.fingerprint(Appointment, serializer.validated_data)
+        # The checks and the insert share one write transaction, so two
+        # submissions for the last place in a slot cannot both succeed.
+        with write_slots, transaction.atomic():
+            original = duplicates.find_original(Appointment, fingerprint, key)
+            reason = availability.unavailable_reason(start) if original is None else None
+            if original is None and reason is None:
+                serializer.save(fingerprint=fingerprint, idempotency_key=key)
+        message = 'Your appointment request has been submitted. We will confirm shortly.'
+        if original is not None:
+            return replayed_submission(original, fingerprint, message)
+        if reason is not None:
+            return Response({
+                'success': False,
+                'message': 'The selected time is not available. Please choose another slot.',
+                'errors': {'preferred_time': [availability.describe(reason)]},
+                'suggestions': [availability.slot_data(slot) for slot in availability.suggestions(start)],
+            }, status=status.HTTP_409_CONFLICT if reason == availability.FULL else status.HTTP_400_BAD_REQUEST)
         return Response({
             'success': True,
-            'message': 'Your appointment request has been submitted. We will confirm shortly.',
+            'message': message,
             'data': serializer.data
         }, status=status.HTTP_201_CREATED)
     return Response({
@@ -131,12 +267,44 @@ def create_appointment(request):
     }, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def appointment_availability(request):
+    today, last = availability.bookable_dates()
+    try:
+        first = datetime.date.fromisoformat(request.query_params.get('start', today.isoformat()))
+        end = request.query_params.get('end')
+        end = datetime.date.fromisoformat(end) if end else first + datetime.timedelta(days=6)
+    except ValueError:
+        return Response({'error': 'start and end must be dates (YYYY-MM-DD)'}, status=status.HTTP_400_BAD_REQUEST)
+    if end < first:
+        return Response({'error': 'end must not be before start'}, status=status.HTTP_400_BAD_REQUEST)
+    first, end = max(first, today), min(end, last)
+    if end < first:
+        return Response({'error': f'Appointments can be booked from {today.isoformat()} to {last.isoformat()}'},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    days = {}
+    with read_only():
+        for slot in availability.free_slots(first, end):
+            days.setdefault(slot.date(), []).append(slot.strftime('%H:%M'))
+    return Response({
+        'start': first.isoformat(),
+        'end': end.isoformat(),
+        'slot_minutes': settings.APPOINTMENT_SLOT_MINUTES,
+        'days': [{'date': day.isoformat(), 'slots': slots} for day, slots in days.items()],
+    })
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle])
 def subscribe_newsletter(request):
     serializer = NewsletterSubscriberSerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save()
+        with write_slots:
+            serializer.save()
         return Response({
             'success': True,
             'message': 'Thank you for subscribing to our newsletter!'
@@ -148,12 +316,46 @@ def subscribe_newsletter(request):
     }, status=status.HTTP_400_BAD_REQUEST)
 
 
+# Room for the other application fields alongside the resume.
+RESUME_FORM_OVERHEAD = 64 * 1024
+
+
+def resume_too_large(max_size):
+    return Response({
+        'success': False,
+        'errors': {'resume': [f'Resume must be at most {filesizeformat(max_size)}.']}
+    }, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle])
 def apply_career(request):
-    serializer = CareerApplicationSerializer(data=request.data)
+    max_size = settings.RESUME_MAX_UPLOAD_SIZE
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > max_size + RESUME_FORM_OVERHEAD:
+        return resume_too_large(max_size)
+    
+    handler = ResumeUploadHandler(request._request, max_size)
+    request._request.upload_handlers = [handler]
+    data = request.data
+    if handler.too_large:
+        return resume_too_large(max_size)
+    
+    resume = data.get('resume')
+    if resume is not None and not getattr(resume, 'extension', None):
+        return Response({
+            'success': False,
+            'errors': {'resume': ['Resume must be a PDF, DOC or DOCX file.']}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = CareerApplicationSerializer(data=data)
     if serializer.is_valid():
-        serializer.save()
+        with write_slots:
+            serializer.save(resume=store_resume(resume), resume_sha256=resume.sha256)
         return Response({
             'success': True,
             'message': 'Your application has been submitted successfully.'
@@ -167,34 +369,84 @@ def apply_career(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_seo_metadata(request, page_name):
-    try:
-        seo = SEOMetadata.objects.get(page_name=page_name)
-        serializer = SEOMetadataSerializer(seo, context={'request': request})
-        return Response(serializer.data)
-    except SEOMetadata.DoesNotExist:
+    data = seo_map.get(request, page_name)
+    if data is None:
         return Response({'message': 'SEO metadata not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def seo_metadata_bulk(request):
+    names = request.query_params.get('pages')
+    page_names = [name for name in names.split(',') if name] if names is not None else None
+    pages, missing, etag = seo_map.select(request, page_names)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response({'pages': pages, 'missing': missing})
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
 
 
 # ============================================
 # ADMIN APIs (Authentication Required)
 # ============================================
 
+DASHBOARD_COUNTERS = {
+    'total_enquiries': 'enquiries.total',
+    'new_enquiries': 'enquiries.status.new',
+    'total_appointments': 'appointments.total',
+    'pending_appointments': 'appointments.status.pending',
+    'total_subscribers': 'subscribers.active',
+    'total_news': 'news.total',
+    'total_testimonials': 'testimonials.total',
+    'total_case_studies': 'case_studies.total',
+}
+
+
+def _by_prefix(values, prefix):
+    return {name[len(prefix):]: value for name, value in values.items() if name.startswith(prefix)}
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminUser])
+def metrics_view(request):
+    return HttpResponse(metrics.registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def dashboard_stats(request):
+    as_of = timezone.now()
+    since = request.query_params.get('since')
+    if since:
+        since = parse_datetime(since)
+        if since is None:
+            return Response({'error': 'since must be an ISO 8601 datetime'}, status=status.HTTP_400_BAD_REQUEST)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+    values = counters.snapshot(since)
     stats = {
-        'total_enquiries': Enquiry.objects.count(),
-        'new_enquiries': Enquiry.objects.filter(status='new').count(),
-        'total_appointments': Appointment.objects.count(),
-        'pending_appointments': Appointment.objects.filter(status='pending').count(),
-        'total_subscribers': NewsletterSubscriber.objects.filter(is_active=True).count(),
-        'total_news': NewsArticle.objects.count(),
-        'total_testimonials': Testimonial.objects.count(),
-        'total_case_studies': CaseStudy.objects.count(),
-        'recent_enquiries': Enquiry.objects.all()[:5],
-        'recent_appointments': Appointment.objects.all()[:5],
+        field: values.get(name, 0)
+        for field, name in DASHBOARD_COUNTERS.items()
+        if since is None or name in values
     }
-    
+    for field, prefix in (('enquiries_by_status', 'enquiries.status.'), ('appointments_by_status', 'appointments.status.')):
+        by_status = _by_prefix(values, prefix)
+        if since is None or by_status:
+            stats[field] = by_status
+
+    recent_enquiries = Enquiry.objects.all()
+    recent_appointments = Appointment.objects.all()
+    if since:
+        recent_enquiries = recent_enquiries.filter(created_at__gt=since)
+        recent_appointments = recent_appointments.filter(created_at__gt=since)
+    stats['recent_enquiries'] = recent_enquiries[:5]
+    stats['recent_appointments'] = recent_appointments[:5]
+    stats['as_of'] = as_of
+
     serializer = DashboardStatsSerializer(stats)
     return Response(serializer.data)
 
@@ -206,14 +458,14 @@ class AdminPracticeAreaViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         instance = serializer.save()
-        log_activity(self.request.user, 'Created', 'PracticeArea', instance.id)
+        log_activity(self.request.user, 'Created', 'PracticeArea', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_update(self, serializer):
         instance = serializer.save()
-        log_activity(self.request.user, 'Updated', 'PracticeArea', instance.id)
+        log_activity(self.request.user, 'Updated', 'PracticeArea', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_destroy(self, instance):
-        log_activity(self.request.user, 'Deleted', 'PracticeArea', instance.id)
+        log_activity(self.request.user, 'Deleted', 'PracticeArea', instance.id, ip_address=get_client_ip(self.request))
         instance.delete()
 
 
@@ -224,33 +476,33 @@ class AdminTeamMemberViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         instance = serializer.save()
-        log_activity(self.request.user, 'Created', 'TeamMember', instance.id)
+        log_activity(self.request.user, 'Created', 'TeamMember', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_update(self, serializer):
         instance = serializer.save()
-        log_activity(self.request.user, 'Updated', 'TeamMember', instance.id)
+        log_activity(self.request.user, 'Updated', 'TeamMember', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_destroy(self, instance):
-        log_activity(self.request.user, 'Deleted', 'TeamMember', instance.id)
+        log_activity(self.request.user, 'Deleted', 'TeamMember', instance.id, ip_address=get_client_ip(self.request))
         instance.delete()
 
 
 class AdminNewsArticleViewSet(viewsets.ModelViewSet):
-    queryset = NewsArticle.objects.all()
+    queryset = NewsArticle.objects.select_related('author')
     serializer_class = NewsArticleDetailSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = StandardResultsSetPagination
     
     def perform_create(self, serializer):
         instance = serializer.save(author=self.request.user)
-        log_activity(self.request.user, 'Created', 'NewsArticle', instance.id)
+        log_activity(self.request.user, 'Created', 'NewsArticle', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_update(self, serializer):
         instance = serializer.save()
-        log_activity(self.request.user, 'Updated', 'NewsArticle', instance.id)
+        log_activity(self.request.user, 'Updated', 'NewsArticle', instance.id, ip_address=get_client_ip(self.request))
     
     def perform_destroy(self, instance):
-        log_activity(self.request.user, 'Deleted', 'NewsArticle', instance.id)
+        log_activity(self.request.user, 'Deleted', 'NewsArticle', instance.id, ip_address=get_client_ip(self.request))
         instance.delete()
 
 
@@ -261,7 +513,7 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
 
 
 class AdminCaseStudyViewSet(viewsets.ModelViewSet):
-    queryset = CaseStudy.objects.all()
+    queryset = CaseStudy.objects.select_related('practice_area')
     serializer_class = CaseStudySerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = StandardResultsSetPagination
@@ -273,7 +525,7 @@ class AdminCaseStudyViewSet(viewsets.ModelViewSet):
 
 
 class AdminTestimonialViewSet(viewsets.ModelViewSet):
-    queryset = Testimonial.objects.all()
+    queryset = Testimonial.objects.select_related('practice_area')
     serializer_class = TestimonialSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     
@@ -289,11 +541,131 @@ class AdminFAQViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
 
-class AdminEnquiryViewSet(viewsets.ModelViewSet):
+class BulkStatusUpdateMixin:
+    """
+    Apply one status (and optional notes) to many rows picked by id or by list filters.
+
+    Listed ids are handled ``bulk_chunk_size`` at a time to stay under the
+    database's bound-parameter limit. A filter is applied in one UPDATE,
+    and its response reports counts by previous status instead of every id.
+    """
+    bulk_chunk_size = 500
+    
+    @action(detail=False, methods=['post'], url_path='bulk-update-status')
+    def bulk_update_status(self, request):
+        model = self.queryset.model
+        serializer = BulkStatusUpdateSerializer(data=request.data, status_choices=model.STATUS_CHOICES)
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+        
+        queryset = model.objects.order_by()
+        if 'filter' in data:
+            filterset_class = DjangoFilterBackend().get_filterset_class(self, queryset)
+            unknown = set(data['filter']) - set(filterset_class.base_filters)
+            if unknown:
+                # An ignored key would silently widen the update to every row.
+                return Response({'errors': {'filter': [f'Unknown filters: {", ".join(sorted(unknown))}']}},
+                                status=status.HTTP_400_BAD_REQUEST)
+            filterset = filterset_class(data=data['filter'], queryset=queryset, request=request)
+            if not filterset.is_valid():
+                return Response({'errors': {'filter': filterset.errors}}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = filterset.qs
+        
+        changes = {'status': data['status'], 'updated_at': timezone.now()}
+        if data.get('notes'):
+            changes['notes'] = data['notes']
+        
+        by_status = {}
+        with transaction.atomic():
+            if 'ids' in data:
+                ids = list(dict.fromkeys(data['ids']))
+                found = []
+                for start in range(0, len(ids), self.bulk_chunk_size):
+                    chunk = queryset.filter(pk__in=ids[start:start + self.bulk_chunk_size])
+                    for pk, old_status in chunk.values_list('pk', 'status'):
+                        found.append(pk)
+                        by_status[old_status] = by_status.get(old_status, 0) + 1
+                    chunk.update(**changes)
+                updated = len(found)
+                details = {'ids': sorted(found)}
+            else:
+                for old_status, rows in queryset.values_list('status').annotate(rows=Count('pk')):
+                    by_status[old_status] = rows
+                updated = queryset.update(**changes)
+                details = {'filter': data['filter'], 'updated': updated}
+            if updated:
+                counters.adjust(counters.transition_deltas(model, by_status, data['status']))
+                log_activity(
+                    request.user,
+                    f'Bulk updated {model._meta.verbose_name} status to {data["status"]}',
+                    model.__name__,
+                    details=json.dumps({**details, 'status': data['status'], 'notes': data.get('notes', '')}),
+                    ip_address=get_client_ip(request),
+                )
+        
+        response = {'updated': updated, 'status': data['status']}
+        if 'ids' in data:
+            results = {pk: 'updated' for pk in found}
+            for pk in ids:
+                results.setdefault(pk, 'not_found')
+            response['results'] = results
+        else:
+            response['previous_status'] = by_status
+        return Response(response)
+
+
+class ExportMixin:
+    """
+    Stream the filtered list as CSV or NDJSON in ``id`` order.
+
+    ``?after_id=`` resumes after the last id a previous export returned and
+    ``?limit=`` caps one response, so very large tables can be pulled in pieces.
+    """
+    export_fields = ()
+    export_chunk_size = 2000
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        file_format = request.query_params.get('file_format', 'csv')
+        if file_format not in exports.FORMATS:
+            return Response({'error': f'file_format must be one of {", ".join(exports.FORMATS)}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            after_id = int(request.query_params.get('after_id', 0))
+            limit = int(request.query_params['limit']) if 'limit' in request.query_params else None
+        except ValueError:
+            return Response({'error': 'after_id and limit must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        queryset = self.filter_queryset(self.get_queryset()).filter(id__gt=after_id).order_by('id')
+        if limit is not None:
+            queryset = queryset[:max(limit, 0)]
+        fields = ['id'] + [field for field in self.export_fields if field != 'id']
+        
+        model_name = self.queryset.model._meta.model_name
+        response = StreamingHttpResponse(
+            exports.stream_rows(file_format, fields, queryset, self.export_chunk_size),
+            content_type=exports.FORMATS[file_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{model_name}-{timezone.now():%Y%m%d-%H%M%S}-after-{after_id}.{file_format}"'
+        )
+        return response
+
+
+class AdminEnquiryViewSet(BulkStatusUpdateMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Enquiry.objects.all()
     serializer_class = EnquirySerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OptionalKeysetPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'status': ['exact', 'in'],
+        'matter_type': ['exact'],
+        'created_at': ['gte', 'lte'],
+    }
+    export_fields = ('name', 'email', 'phone', 'matter_type', 'subject', 'message',
+                     'status', 'notes', 'created_at', 'updated_at')
     
     @action(detail=True, methods=['patch'])
     def update_status(self, request, pk=None):
@@ -301,22 +673,30 @@ class AdminEnquiryViewSet(viewsets.ModelViewSet):
         new_status = request.data.get('status')
         notes = request.data.get('notes', '')
         
-        if new_status:
-            enquiry.status = new_status
-            if notes:
-                enquiry.notes = notes
-            enquiry.save()
-            log_activity(request.user, f'Updated enquiry status to {new_status}', 'Enquiry', enquiry.id)
-            return Response({'message': 'Status updated successfully'})
+        if new_status not in dict(Enquiry.STATUS_CHOICES):
+            return Response({'error': 'A valid status is required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        return Response({'error': 'Status is required'}, status=status.HTTP_400_BAD_REQUEST)
+        enquiry.status = new_status
+        if notes:
+            enquiry.notes = notes
+        enquiry.save()
+        log_activity(request.user, f'Updated enquiry status to {new_status}', 'Enquiry', enquiry.id, ip_address=get_client_ip(request))
+        return Response({'message': 'Status updated successfully'})
 
 
-class AdminAppointmentViewSet(viewsets.ModelViewSet):
+class AdminAppointmentViewSet(BulkStatusUpdateMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Appointment.objects.all()
     serializer_class = AppointmentSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OptionalKeysetPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'status': ['exact', 'in'],
+        'matter_type': ['exact'],
+        'preferred_date': ['gte', 'lte'],
+    }
+    export_fields = ('name', 'email', 'phone', 'matter_type', 'preferred_date', 'preferred_time',
+                     'message', 'status', 'notes', 'created_at', 'updated_at')
     
     @action(detail=True, methods=['patch'])
     def update_status(self, request, pk=None):
@@ -324,29 +704,89 @@ class AdminAppointmentViewSet(viewsets.ModelViewSet):
         new_status = request.data.get('status')
         notes = request.data.get('notes', '')
         
-        if new_status:
-            appointment.status = new_status
-            if notes:
-                appointment.notes = notes
-            appointment.save()
-            log_activity(request.user, f'Updated appointment status to {new_status}', 'Appointment', appointment.id)
-            return Response({'message': 'Status updated successfully'})
+        if new_status not in dict(Appointment.STATUS_CHOICES):
+            return Response({'error': 'A valid status is required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        return Response({'error': 'Status is required'}, status=status.HTTP_400_BAD_REQUEST)
+        appointment.status = new_status
+        if notes:
+            appointment.notes = notes
+        appointment.save()
+        log_activity(request.user, f'Updated appointment status to {new_status}', 'Appointment', appointment.id, ip_address=get_client_ip(request))
+        return Response({'message': 'Status updated successfully'})
 
 
-class AdminNewsletterSubscriberViewSet(viewsets.ModelViewSet):
-    queryset = NewsletterSubscriber.objects.all()
+class AdminNewsletterSubscriberViewSet(ExportMixin, viewsets.ModelViewSet):
+    queryset = NewsletterSubscriber.objects.order_by('-subscribed_at', '-id')
     serializer_class = NewsletterSubscriberSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ('-subscribed_at',)
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'is_active': ['exact'],
+        'subscribed_at': ['gte', 'lte'],
+    }
+    export_fields = ('email', 'name', 'is_active', 'subscribed_at')
 
 
-class AdminCareerApplicationViewSet(viewsets.ModelViewSet):
+class AdminNewsletterCampaignViewSet(viewsets.ModelViewSet):
+    queryset = NewsletterCampaign.objects.all()
+    serializer_class = NewsletterCampaignSerializer
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    
+    def get_queryset(self):
+        return newsletter.progress(NewsletterCampaign.objects.all())
+    
+    def perform_create(self, serializer):
+        instance = serializer.save(created_by=self.request.user)
+        log_activity(self.request.user, 'Created', 'NewsletterCampaign', instance.id, ip_address=get_client_ip(self.request))
+    
+    def perform_update(self, serializer):
+        instance = serializer.save()
+        log_activity(self.request.user, 'Updated', 'NewsletterCampaign', instance.id, ip_address=get_client_ip(self.request))
+    
+    def perform_destroy(self, instance):
+        log_activity(self.request.user, 'Deleted', 'NewsletterCampaign', instance.id, ip_address=get_client_ip(self.request))
+        instance.delete()
+    
+    def _transition(self, request, from_statuses, to_status, **changes):
+        campaign = self.get_object()
+        updated = NewsletterCampaign.objects.filter(pk=campaign.pk, status__in=from_statuses).update(
+            status=to_status, updated_at=timezone.now(), **changes
+        )
+        if not updated:
+            return Response(
+                {'error': f'Cannot move a {campaign.status} campaign to {to_status}'},
+                status=status.HTTP_409_CONFLICT,
+            )
+        log_activity(request.user, f'Campaign {to_status}', 'NewsletterCampaign', campaign.id, ip_address=get_client_ip(request))
+        return Response(self.get_serializer(self.get_queryset().get(pk=campaign.pk)).data)
+    
+    @action(detail=True, methods=['post'])
+    def queue(self, request, pk=None):
+        # Sending happens in `manage.py send_newsletters`, never in this request.
+        if self.get_object().queued_at is None:
+            return self._transition(request, ['draft'], 'queued', queued_at=timezone.now())
+        return self._transition(request, ['paused'], 'queued')
+    
+    @action(detail=True, methods=['post'])
+    def pause(self, request, pk=None):
+        return self._transition(request, ['queued', 'sending'], 'paused')
+
+
+class AdminCareerApplicationViewSet(ExportMixin, viewsets.ModelViewSet):
     queryset = CareerApplication.objects.all()
     serializer_class = CareerApplicationSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OptionalKeysetPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'status': ['exact', 'in'],
+        'position': ['exact'],
+        'created_at': ['gte', 'lte'],
+    }
+    export_fields = ('name', 'email', 'phone', 'position', 'experience_years', 'education',
+                     'cover_letter', 'resume', 'status', 'created_at')
 
 
 class AdminSEOMetadataViewSet(viewsets.ModelViewSet):
@@ -361,7 +801,7 @@ class AdminSEOMetadataViewSet(viewsets.ModelViewSet):
 
 
 class AdminActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = ActivityLog.objects.all()
+    queryset = ActivityLog.objects.select_related('user')
     serializer_class = ActivityLogSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OptionalKeysetPagination
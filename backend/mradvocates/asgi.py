@@ -9,8 +9,25 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mradvocates.settings')
 
-application = get_asgi_application()
+
+class APIHandler(ASGIHandler):
+    """Resolve requests against ``ASGI_URLCONF``, which serves the public read API from async views."""
+
+    async def get_response_async(self, request):
+        request.urlconf = settings.ASGI_URLCONF
+        return await super().get_response_async(request)
+
+
+# Every request's sync work runs on a fresh thread, so a persistent
+# connection would be left open per thread: close them after each request.
+for database in settings.DATABASES.values():
+    database['CONN_MAX_AGE'] = 0
+
+django.setup(set_prefix=False)
+application = APIHandler()
@@ -0,0 +1,9 @@
+from django.urls import include, path
+
+from .urls import urlpatterns as sync_urlpatterns
+
+# ASGI_URLCONF: the async public read views take precedence; every other
+# route resolves to the same views as under WSGI.
+urlpatterns = [
+    path('api/', include('api.async_urls')),
+] + sync_urlpatterns
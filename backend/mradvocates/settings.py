@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from datetime import timedelta
 
@@ -29,10 +30,12 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
+    'django_filters',
     'api',
 ]
 
 MIDDLEWARE = [
+    'api.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -63,10 +66,50 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'mradvocates.wsgi.application'
 
+# WAL lets readers carry on while a write commits; synchronous=NORMAL is
+# durable in WAL mode except against power loss. Writers take the lock at
+# BEGIN so a read-then-write transaction waits on busy_timeout instead of
+# failing. Persistent connections suit WSGI threads; mradvocates.asgi turns
+# them off, since every ASGI request runs on a fresh thread.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; '
+                'PRAGMA mmap_size=134217728; PRAGMA cache_size=-20000'
+            ),
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # The same file opened read-only, for the public read endpoints (see api.db_routers)
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': (BASE_DIR / 'db.sqlite3').as_uri() + '?mode=ro',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA query_only=ON; PRAGMA busy_timeout=5000; '
+                'PRAGMA mmap_size=134217728; PRAGMA cache_size=-20000'
+            ),
+        },
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+DATABASE_ROUTERS = ['api.db_routers.ReadReplicaRouter']
+DATABASE_READ_ALIAS = 'replica'
+
+# Shared by every worker so version stamps and cached responses stay coherent
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
     }
 }
 
@@ -100,17 +143,19 @@ CORS_ALLOWED_ORIGINS = [
 
 # CORS Additional Settings
 CORS_ALLOW_CREDENTIALS = True
-CORS_ALLOWED_HEADERS = [
+CORS_ALLOW_HEADERS = [
     'accept',
     'accept-encoding',
     'authorization',
     'content-type',
     'dnt',
+    'idempotency-key',
     'origin',
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
 ]
+CORS_EXPOSE_HEADERS = ['idempotent-replayed']
 
 # REST Framework Settings
 REST_FRAMEWORK = {
@@ -120,6 +165,17 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # Client address for throttling: the X-Forwarded-For entry added by the last of this many
+    # proxies in front; set DJANGO_NUM_PROXIES=1 behind the PythonAnywhere proxy. 0 ignores the
+    # header (DRF would trust all of it with None).
+    'NUM_PROXIES': int(os.environ.get('DJANGO_NUM_PROXIES') or 0),
+    # Token buckets for the public forms (api.throttling), keyed by route name
+    'DEFAULT_THROTTLE_RATES': {
+        'create-enquiry': '5/min',
+        'create-appointment': '5/min',
+        'subscribe-newsletter': '3/min',
+        'apply-career': '5/hour',
+    },
 }
 
 # JWT Settings
@@ -130,3 +186,87 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
+
+# Public API response cache
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 60 * 60 * 24
+API_CACHE_LOCK_TIMEOUT = 10
+
+# News view counts are buffered per worker and written by a background thread in batches
+NEWS_VIEW_FLUSH_THRESHOLD = 100
+NEWS_VIEW_FLUSH_INTERVAL = 30
+
+# Responsive image variants rendered for every uploaded ImageField
+IMAGE_VARIANT_WIDTHS = (320, 640, 960, 1280)
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANT_WORKERS = 2
+
+# Activity logs are queued and written in batches by a background thread
+ACTIVITY_LOG_ASYNC = True
+ACTIVITY_LOG_BATCH_SIZE = 50
+ACTIVITY_LOG_FLUSH_INTERVAL = 2.0
+ACTIVITY_LOG_RETENTION_DAYS = 180
+ACTIVITY_LOG_ARCHIVE_DIR = BASE_DIR / 'archive' / 'activity_logs'
+
+# Newsletter campaigns are sent by `manage.py send_newsletters` over one email connection
+DEFAULT_FROM_EMAIL = 'MR Advocates & Associates <noreply@mradvocates.in>'
+NEWSLETTER_FROM_EMAIL = DEFAULT_FROM_EMAIL
+NEWSLETTER_BATCH_SIZE = 100
+NEWSLETTER_RATE_LIMIT = 10  # messages per second, 0 for no limit
+NEWSLETTER_MAX_ATTEMPTS = 3
+NEWSLETTER_CLAIM_TIMEOUT = 15 * 60  # seconds before a crashed run's claimed batch is sent again
+
+# Career application resumes are streamed to disk, capped and stored once per content hash
+RESUME_MAX_UPLOAD_SIZE = 5 * 1024 * 1024
+
+# Precomputed sitemap and news feed files, rebuilt per section when its content changes
+SITEMAP_ROOT = BASE_DIR / 'sitemaps'
+
+# Latest articles included in the /api/home/ bundle
+HOME_NEWS_COUNT = 3
+
+# Output of `manage.py export_static_api`, published to the CDN alongside the frontend
+STATIC_API_ROOT = BASE_DIR / 'static_api'
+
+# Public list endpoints serialize .values() rows directly (same output as the serializers)
+API_FAST_SERIALIZATION = True
+
+# `manage.py benchmark_api` baseline and allowed slowdown before flagging a regression.
+# Timings only compare on the same machine, so the baseline is not committed: record
+# one per machine with `benchmark_api --save` before a change, or point --baseline elsewhere.
+BENCHMARK_BASELINE = BASE_DIR / 'benchmarks' / 'api_baseline.json'
+BENCHMARK_TOLERANCE = 0.25
+
+# Per-request timing: Server-Timing header, slow request/query logging and /api/admin/metrics/
+PERF_SERVER_TIMING = True
+PERF_SLOW_REQUEST_MS = 500
+PERF_SLOW_QUERY_MS = 100
+PERF_HISTOGRAM_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+PERF_METRICS_PUBLISH_INTERVAL = 15
+
+# URLconf used by mradvocates.asgi: async views for the public read endpoints
+ASGI_URLCONF = 'mradvocates.asgi_urls'
+
+# Public form submissions writing at once across all workers (file locks in PUBLIC_WRITE_LOCK_DIR);
+# more are shed with a 503
+PUBLIC_WRITE_CONCURRENCY = 4
+PUBLIC_WRITE_LOCK_DIR = BASE_DIR / 'cache' / 'write_slots'
+PUBLIC_WRITE_RETRY_AFTER = 1
+
+# Appointment booking (api.availability): weekday (0 = Monday) -> opening periods, split into slots
+OFFICE_HOURS = {
+    0: [('10:00', '12:30'), ('14:00', '17:30')],
+    1: [('10:00', '12:30'), ('14:00', '17:30')],
+    2: [('10:00', '12:30'), ('14:00', '17:30')],
+    3: [('10:00', '12:30'), ('14:00', '17:30')],
+    4: [('10:00', '12:30'), ('14:00', '17:30')],
+    5: [('10:00', '12:30')],
+}
+APPOINTMENT_CLOSED_DATES = []  # ISO dates, e.g. court holidays
+APPOINTMENT_SLOT_MINUTES = 30
+APPOINTMENT_SLOT_CAPACITY = 1  # appointments accepted per slot
+APPOINTMENT_BOOKING_DAYS = 60
+APPOINTMENT_SUGGESTIONS = 3  # alternatives offered when a slot is refused
+
+# Repeated enquiry and appointment submissions (api.duplicates) answered with the original record
+SUBMISSION_DUPLICATE_WINDOW = 600  # seconds